@@ -58,16 +58,21 @@ from .enums import *
 from .embeds import *
 from .mentions import *
 from .shard import *
+from .cluster import *
 from .player import *
 from .webhook import *
 from .voice_client import *
 from .audit_logs import *
+from .cursors import *
 from .raw_models import *
 from .team import *
 from .sticker import *
 from .stage_instance import *
 from .interactions import *
 from .components import *
+from .cache import *
+from .metrics import *
+from .codec import *
 from .threads import *
 
 
@@ -50,6 +50,7 @@ import asyncio
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     List,
     Optional,
@@ -63,7 +64,7 @@ from typing import (
     runtime_checkable,
 )
 
-from .iterators import HistoryIterator
+from .iterators import HistoryIterator, PartitionedHistoryIterator
 from .context_managers import Typing
 from .enums import ChannelType
 from .errors import InvalidArgument, ClientException
@@ -236,6 +237,99 @@ class _Overwrites:
         return self.type == 1
 
 
+class _ChannelPermissions:
+    # A channel's overwrites split by target, along with the member permissions
+    # already resolved in it keyed by role set (and member ID, for members with
+    # their own overwrite). Guilds rebuild it when the channel gets a new list
+    # of overwrites and drop resolved entries when role permissions change.
+
+    __slots__ = ('overwrites', 'everyone', 'roles', 'members', 'resolved')
+
+    MAX_RESOLVED: ClassVar[int] = 4096
+
+    def __init__(self, overwrites: List[_Overwrites], guild_id: int):
+        self.overwrites: List[_Overwrites] = overwrites
+        self.everyone: Optional[_Overwrites] = None
+        self.roles: Dict[int, _Overwrites] = {}
+        self.members: Dict[int, _Overwrites] = {}
+        self.resolved: Dict[Tuple[Tuple[int, ...], int], int] = {}
+
+        for index, overwrite in enumerate(overwrites):
+            if index == 0 and overwrite.id == guild_id:
+                self.everyone = overwrite
+            elif overwrite.is_role():
+                self.roles[overwrite.id] = overwrite
+            else:
+                self.members.setdefault(overwrite.id, overwrite)
+
+    def resolve(self, guild: Guild, member: Member) -> int:
+        roles = member._roles
+        member_id = member.id if member.id in self.members else 0
+        key = (tuple(roles), member_id)
+        try:
+            return self.resolved[key]
+        except KeyError:
+            pass
+
+        # see GuildChannel.permissions_for for the resolution order
+        base = Permissions(guild.default_role._permissions)
+        get_role = guild.get_role
+
+        # Apply guild roles that the member has.
+        for role_id in roles:
+            role = get_role(role_id)
+            if role is not None:
+                base.value |= role._permissions
+
+        # Guild-wide Administrator -> True for everything
+        # Bypass all channel-specific overrides
+        if base.administrator:
+            base = Permissions.all()
+        else:
+            # Apply @everyone allow/deny first since it's special
+            everyone = self.everyone
+            if everyone is not None:
+                base.handle_overwrite(allow=everyone.allow, deny=everyone.deny)
+
+            # Apply channel specific role permission overwrites
+            denies = 0
+            allows = 0
+            for role_id in roles:
+                overwrite = self.roles.get(role_id)
+                if overwrite is not None:
+                    denies |= overwrite.deny
+                    allows |= overwrite.allow
+
+            base.handle_overwrite(allow=allows, deny=denies)
+
+            # Apply member specific permission overwrites
+            if member_id:
+                overwrite = self.members[member_id]
+                base.handle_overwrite(allow=overwrite.allow, deny=overwrite.deny)
+
+            # if you can't send a message in a channel then you can't have certain
+            # permissions as well
+            if not base.send_messages:
+                base.send_tts_messages = False
+                base.mention_everyone = False
+                base.embed_links = False
+                base.attach_files = False
+
+            # if you can't read a channel then you have no permissions there
+            if not base.read_messages:
+                base.value &= ~Permissions.all_channel().value
+
+        if len(self.resolved) >= self.MAX_RESOLVED:
+            self.resolved.clear()
+        self.resolved[key] = base.value
+        return base.value
+
+    def invalidate_role(self, role_id: int) -> None:
+        stale = [key for key in self.resolved if role_id in key[0]]
+        for key in stale:
+            del self.resolved[key]
+
+
 GCH = TypeVar('GCH', bound='GuildChannel')
 
 
@@ -596,11 +690,9 @@ class GuildChannel:
         if self.guild.owner_id == obj.id:
             return Permissions.all()
 
-        default = self.guild.default_role
-        base = Permissions(default.permissions.value)
-
         # Handle the role case first
         if isinstance(obj, Role):
+            base = Permissions(self.guild.default_role.permissions.value)
             base.value |= obj._permissions
 
             if base.administrator:
@@ -623,62 +715,9 @@ class GuildChannel:
 
             return base
 
-        roles = obj._roles
-        get_role = self.guild.get_role
-
-        # Apply guild roles that the member has.
-        for role_id in roles:
-            role = get_role(role_id)
-            if role is not None:
-                base.value |= role._permissions
-
-        # Guild-wide Administrator -> True for everything
-        # Bypass all channel-specific overrides
-        if base.administrator:
-            return Permissions.all()
-
-        # Apply @everyone allow/deny first since it's special
-        try:
-            maybe_everyone = self._overwrites[0]
-            if maybe_everyone.id == self.guild.id:
-                base.handle_overwrite(allow=maybe_everyone.allow, deny=maybe_everyone.deny)
-                remaining_overwrites = self._overwrites[1:]
-            else:
-                remaining_overwrites = self._overwrites
-        except IndexError:
-            remaining_overwrites = self._overwrites
-
-        denies = 0
-        allows = 0
-
-        # Apply channel specific role permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.is_role() and roles.has(overwrite.id):
-                denies |= overwrite.deny
-                allows |= overwrite.allow
-
-        base.handle_overwrite(allow=allows, deny=denies)
-
-        # Apply member specific permission overwrites
-        for overwrite in remaining_overwrites:
-            if overwrite.is_member() and overwrite.id == obj.id:
-                base.handle_overwrite(allow=overwrite.allow, deny=overwrite.deny)
-                break
-
-        # if you can't send a message in a channel then you can't have certain
-        # permissions as well
-        if not base.send_messages:
-            base.send_tts_messages = False
-            base.mention_everyone = False
-            base.embed_links = False
-            base.attach_files = False
-
-        # if you can't read a channel then you have no permissions there
-        if not base.read_messages:
-            denied = Permissions.all_channel()
-            base.value &= ~denied.value
-
-        return base
+        # Members with the same roles share their permissions unless they have
+        # their own overwrite, so the result is cached per role set.
+        return Permissions._from_value(self.guild._get_channel_permissions(self).resolve(self.guild, obj))
 
     async def delete(self, *, reason: Optional[str] = None) -> None:
         """|coro|
@@ -1557,6 +1596,8 @@ class Messageable:
         after: Optional[SnowflakeTime] = None,
         around: Optional[SnowflakeTime] = None,
         oldest_first: Optional[bool] = None,
+        raw: bool = False,
+        prefetch: bool = False,
     ) -> HistoryIterator:
         """Returns an :class:`~nextcord.AsyncIterator` that enables receiving the destination's message history.
 
@@ -1602,6 +1643,16 @@ class Messageable:
         oldest_first: Optional[:class:`bool`]
             If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
             ``after`` is specified, otherwise ``False``.
+        raw: :class:`bool`
+            If set to ``True``, return the message payloads as received from Discord instead of
+            :class:`~nextcord.Message` objects. This is much cheaper when exporting a large history.
+
+            .. versionadded:: 2.0
+        prefetch: :class:`bool`
+            If set to ``True``, request the next page of messages as soon as a page is received,
+            so that it is fetched while the current one is consumed.
+
+            .. versionadded:: 2.0
 
         Raises
         ------
@@ -1612,10 +1663,85 @@ class Messageable:
 
         Yields
         -------
-        :class:`~nextcord.Message`
-            The message with the message data parsed.
+        Union[:class:`~nextcord.Message`, :class:`dict`]
+            The message with the message data parsed, or the message payload if ``raw`` is set.
         """
-        return HistoryIterator(self, limit=limit, before=before, after=after, around=around, oldest_first=oldest_first)
+        return HistoryIterator(
+            self,
+            limit=limit,
+            before=before,
+            after=after,
+            around=around,
+            oldest_first=oldest_first,
+            raw=raw,
+            prefetch=prefetch,
+        )
+
+    def scan_history(
+        self,
+        *,
+        partitions: int = 4,
+        before: Optional[SnowflakeTime] = None,
+        after: Optional[SnowflakeTime] = None,
+        oldest_first: bool = True,
+        raw: bool = False,
+    ) -> PartitionedHistoryIterator:
+        """Returns an :class:`~nextcord.AsyncIterator` that receives the destination's
+        message history between two points in time, fetching several parts of it at once.
+
+        Message IDs encode their creation time, so the range is split in ``partitions``
+        windows of equal duration that are fetched concurrently, then returned one after
+        another so that messages are in order. This makes reading a large history up to
+        ``partitions`` times faster, depending on the rate limits of the channel. Windows
+        that are not being returned yet read at most two pages ahead. Call ``close()``
+        on the returned iterator to stop the background fetching when not iterating
+        to the end.
+
+        You must have :attr:`~nextcord.Permissions.read_message_history` permissions to use this.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for message in channel.scan_history(after=last_week, partitions=8):
+                index.add(message)
+
+        Parameters
+        -----------
+        partitions: :class:`int`
+            The number of windows fetched concurrently. Defaults to ``4``.
+        before: Optional[Union[:class:`~nextcord.abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages before this date or message. Defaults to now.
+            If the datetime is naive, it is assumed to be local time.
+        after: Optional[Union[:class:`~nextcord.abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages after this date or message. Defaults to the creation of the channel.
+            If the datetime is naive, it is assumed to be local time.
+        oldest_first: :class:`bool`
+            If set to ``True``, the default, return messages in oldest->newest order.
+        raw: :class:`bool`
+            If set to ``True``, return the message payloads as received from Discord instead of
+            :class:`~nextcord.Message` objects.
+
+        Raises
+        ------
+        ValueError
+            ``partitions`` is less than 1.
+        ~nextcord.Forbidden
+            You do not have permissions to get channel message history.
+        ~nextcord.HTTPException
+            The request to get message history failed.
+
+        Yields
+        -------
+        Union[:class:`~nextcord.Message`, :class:`dict`]
+            The message with the message data parsed, or the message payload if ``raw`` is set.
+        """
+        return PartitionedHistoryIterator(
+            self, partitions, before=before, after=after, oldest_first=oldest_first, raw=raw
+        )
 
 
 class Connectable(Protocol):
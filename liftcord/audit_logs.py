@@ -174,24 +174,70 @@ def _transform_type(entry: AuditLogEntry, data: Union[int]) -> Union[enums.Chann
         return enums.try_enum(enums.ChannelType, data)
 
 class AuditLogDiff:
+    # values that need a transformer are kept raw in _pending until first accessed,
+    # and aliases of those values are read through to them in _aliases
+    __slots__ = ('__dict__', '_entry', '_pending', '_aliases')
+
+    def __init__(self, entry: Optional[AuditLogEntry] = None) -> None:
+        self._entry: Optional[AuditLogEntry] = entry
+        self._pending: Dict[str, Tuple[Transformer, Any]] = {}
+        self._aliases: Dict[str, str] = {}
+
     def __len__(self) -> int:
+        self._resolve()
         return len(self.__dict__)
 
     def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        self._resolve()
         yield from self.__dict__.items()
 
     def __repr__(self) -> str:
+        self._resolve()
         values = ' '.join('%s=%r' % item for item in self.__dict__.items())
         return f'<AuditLogDiff {values}>'
 
-    if TYPE_CHECKING:
+    def __getattr__(self, item: str) -> Any:
+        # only called when the attribute was not found the normal way
+        if item in AuditLogDiff.__slots__:
+            raise AttributeError(item)
 
-        def __getattr__(self, item: str) -> Any:
-            ...
+        if item in self._aliases:
+            value = getattr(self, self._aliases.pop(item))
+            setattr(self, item, value)
+            return value
+
+        try:
+            transformer, value = self._pending.pop(item)
+        except KeyError:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {item!r}') from None
+
+        value = transformer(self._entry, value)  # type: ignore
+        setattr(self, item, value)
+        return value
+
+    if TYPE_CHECKING:
 
         def __setattr__(self, key: str, value: Any) -> Any:
             ...
 
+    def _set(self, attr: str, value: Any, transformer: Optional[Transformer]) -> None:
+        self.__dict__.pop(attr, None)
+        if transformer is None:
+            self._pending.pop(attr, None)
+            setattr(self, attr, value)
+        else:
+            self._pending[attr] = (transformer, value)
+
+    def _alias(self, alias: str, attr: str) -> None:
+        if attr in self.__dict__:
+            setattr(self, alias, self.__dict__[attr])
+        elif attr in self._pending:
+            self._aliases[alias] = attr
+
+    def _resolve(self) -> None:
+        for attr in list(self._pending) + list(self._aliases):
+            getattr(self, attr)
+
 
 Transformer = Callable[["AuditLogEntry", Any], Any]
 
@@ -234,18 +280,32 @@ class AuditLogChanges:
     # fmt: on
 
     def __init__(self, entry: AuditLogEntry, data: List[AuditLogChangePayload]):
-        self.before = AuditLogDiff()
-        self.after = AuditLogDiff()
+        self._entry: AuditLogEntry = entry
+        self._data: List[AuditLogChangePayload] = data
+
+    @property
+    def before(self) -> AuditLogDiff:
+        return self._diffs[0]
+
+    @property
+    def after(self) -> AuditLogDiff:
+        return self._diffs[1]
+
+    @utils.cached_property
+    def _diffs(self) -> Tuple[AuditLogDiff, AuditLogDiff]:
+        entry = self._entry
+        before = AuditLogDiff(entry)
+        after = AuditLogDiff(entry)
 
-        for elem in data:
+        for elem in self._data:
             attr = elem['key']
 
             # special cases for role add/remove
             if attr == '$add':
-                self._handle_role(self.before, self.after, entry, elem['new_value'])  # type: ignore
+                self._handle_role(before, after, entry, elem['new_value'])  # type: ignore
                 continue
             elif attr == '$remove':
-                self._handle_role(self.after, self.before, entry, elem['new_value'])  # type: ignore
+                self._handle_role(after, before, entry, elem['new_value'])  # type: ignore
                 continue
 
             try:
@@ -258,33 +318,23 @@ class AuditLogChanges:
 
             transformer: Optional[Transformer]
 
-            try:
-                before = elem['old_value']
-            except KeyError:
-                before = None
+            # transformers only run on values that are present, once they are accessed
+            if 'old_value' in elem:
+                before._set(attr, elem['old_value'], transformer)
             else:
-                if transformer:
-                    before = transformer(entry, before)
-
-            setattr(self.before, attr, before)
+                before._set(attr, None, None)
 
-            try:
-                after = elem['new_value']
-            except KeyError:
-                after = None
+            if 'new_value' in elem:
+                after._set(attr, elem['new_value'], transformer)
             else:
-                if transformer:
-                    after = transformer(entry, after)
-
-            setattr(self.after, attr, after)
+                after._set(attr, None, None)
 
         # add an alias
-        if hasattr(self.after, 'colour'):
-            self.after.color = self.after.colour
-            self.before.color = self.before.colour
-        if hasattr(self.after, 'expire_behavior'):
-            self.after.expire_behaviour = self.after.expire_behavior
-            self.before.expire_behaviour = self.before.expire_behavior
+        for alias, attr in (('color', 'colour'), ('expire_behaviour', 'expire_behavior')):
+            before._alias(alias, attr)
+            after._alias(alias, attr)
+
+        return before, after
 
     def __repr__(self) -> str:
         return f'<AuditLogChanges before={self.before!r} after={self.after!r}>'
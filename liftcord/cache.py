@@ -0,0 +1,643 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import OrderedDict
+import collections.abc
+import sys
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+from .utils import get_slots
+
+__all__ = (
+    'CacheLimits',
+    'CacheBackend',
+    'MemoryCache',
+)
+
+if TYPE_CHECKING:
+    from .message import Message
+
+    EvictCallback = Callable[[Any, Any], None]
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+_slots_by_type: Dict[type, Tuple[str, ...]] = {}
+_missing: Any = object()
+
+
+def _estimate_size(obj: Any) -> int:
+    # A shallow estimate: the object itself plus whatever its slots (or
+    # instance dict) point to directly. Nested entities are stored in their
+    # own caches and are accounted for there.
+    cls = type(obj)
+    try:
+        slots = _slots_by_type[cls]
+    except KeyError:
+        slots = _slots_by_type[cls] = tuple(s for s in get_slots(cls) if not s.startswith('__'))
+
+    size = sys.getsizeof(obj)
+    for slot in slots:
+        try:
+            size += sys.getsizeof(getattr(obj, slot))
+        except AttributeError:
+            continue
+
+    try:
+        attrs = obj.__dict__
+    except AttributeError:
+        pass
+    else:
+        size += sys.getsizeof(attrs)
+        for value in attrs.values():
+            size += sys.getsizeof(value)
+
+    return size
+
+
+class CacheLimits:
+    """Limits applied to an entity store of the internal cache.
+
+    This is passed to :class:`Client` through the ``cache_limits`` mapping,
+    which maps an entity name to its limits. The entity names are ``'users'``,
+    ``'guilds'``, ``'emojis'``, ``'stickers'``, ``'members'``, ``'channels'``
+    and ``'threads'``. The last three are stored per guild, so their limits
+    apply to every guild separately.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    ------------
+    max_size: Optional[:class:`int`]
+        The maximum number of entries in the store. ``None`` means unbounded.
+    max_bytes: Optional[:class:`int`]
+        The maximum estimated size of the store in bytes. ``None`` means unbounded.
+    ttl: Optional[:class:`float`]
+        The number of seconds an entry is kept. With the ``'lru'`` policy this
+        counts from when it was last written or accessed, and with the ``'fifo'``
+        policy from when it was first inserted, as overwrites keep an entry's
+        place. ``None`` disables expiry.
+    policy: :class:`str`
+        The eviction order, either ``'lru'`` (least recently used, the default)
+        or ``'fifo'`` (oldest inserted first).
+    """
+
+    __slots__ = ('max_size', 'max_bytes', 'ttl', 'policy')
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        policy: str = 'lru',
+    ) -> None:
+        if max_size is not None and max_size <= 0:
+            raise ValueError('max_size must be greater than 0')
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError('max_bytes must be greater than 0')
+        if ttl is not None and ttl <= 0:
+            raise ValueError('ttl must be greater than 0')
+        if policy not in ('lru', 'fifo'):
+            raise ValueError(f'policy must be either \'lru\' or \'fifo\' not {policy!r}')
+
+        self.max_size: Optional[int] = max_size
+        self.max_bytes: Optional[int] = max_bytes
+        self.ttl: Optional[float] = ttl
+        self.policy: str = policy
+
+    def __repr__(self) -> str:
+        return (
+            f'<CacheLimits max_size={self.max_size} max_bytes={self.max_bytes} '
+            f'ttl={self.ttl} policy={self.policy!r}>'
+        )
+
+
+class CacheBackend(collections.abc.MutableMapping):
+    """The base class for the stores backing the internal cache.
+
+    The library keeps users, guilds, emojis and stickers, as well as each
+    guild's members, channels and threads, in stores created through the
+    ``cache_backend`` passed to :class:`Client`. A backend is a
+    :class:`~collections.abc.MutableMapping` keyed by ID that is constructed
+    with the entity name, its :class:`CacheLimits` (or ``None``) and an
+    optional ``on_evict`` callback that must be called with the key and
+    value of every entry the backend drops on its own.
+
+    Subclasses must implement ``__getitem__``, ``__setitem__``, ``__delitem__``,
+    ``__iter__`` and ``__len__``.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    ------------
+    name: :class:`str`
+        The name of the entity kept in this store.
+    limits: Optional[:class:`CacheLimits`]
+        The limits this store was created with.
+    """
+
+    __slots__ = ('name', 'limits', 'on_evict')
+
+    def __init__(self, name: str, limits: Optional[CacheLimits] = None, *, on_evict: Optional[EvictCallback] = None) -> None:
+        self.name: str = name
+        self.limits: Optional[CacheLimits] = limits
+        self.on_evict: Optional[EvictCallback] = on_evict
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} name={self.name!r} len={len(self)}>'
+
+    @property
+    def memory_usage(self) -> int:
+        """:class:`int`: The estimated size of the stored entries in bytes."""
+        return sum(_estimate_size(value) for value in self.values())
+
+
+class MemoryCache(CacheBackend):
+    """The default in-process :class:`CacheBackend`.
+
+    Entries are kept in insertion or recency order and evicted from the
+    oldest end whenever :attr:`CacheLimits.max_size` or
+    :attr:`CacheLimits.max_bytes` is exceeded, or when they outlive
+    :attr:`CacheLimits.ttl`. A running estimate of the store size is kept
+    in :attr:`memory_usage`.
+
+    .. versionadded:: 2.0
+    """
+
+    __slots__ = ('_data', '_sizes', '_touched', '_bytes', '_lru')
+
+    def __init__(self, name: str, limits: Optional[CacheLimits] = None, *, on_evict: Optional[EvictCallback] = None) -> None:
+        super().__init__(name, limits or CacheLimits(), on_evict=on_evict)
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._sizes: Dict[Any, int] = {}
+        self._touched: Dict[Any, float] = {}
+        self._bytes: int = 0
+        self._lru: bool = self.limits.policy == 'lru'  # type: ignore
+
+    @property
+    def memory_usage(self) -> int:
+        return self._bytes
+
+    def _drop(self, key: Any) -> Any:
+        value = self._data.pop(key)
+        self._bytes -= self._sizes.pop(key, 0)
+        self._touched.pop(key, None)
+        return value
+
+    def _evict_oldest(self) -> None:
+        key = next(iter(self._data))
+        value = self._drop(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _expire(self) -> None:
+        ttl = self.limits.ttl  # type: ignore
+        if ttl is None or not self._data:
+            return
+
+        deadline = time.monotonic() - ttl
+        touched = self._touched
+        # entries are ordered by the time they were last touched
+        while self._data and touched[next(iter(self._data))] < deadline:
+            self._evict_oldest()
+
+    def __getitem__(self, key: Any) -> Any:
+        value = self._data[key]
+        ttl = self.limits.ttl  # type: ignore
+        if ttl is not None:
+            now = time.monotonic()
+            if self._touched[key] < now - ttl:
+                self._drop(key)
+                if self.on_evict is not None:
+                    self.on_evict(key, value)
+                raise KeyError(key)
+            if self._lru:
+                self._touched[key] = now
+
+        if self._lru:
+            self._data.move_to_end(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        limits: CacheLimits = self.limits  # type: ignore
+        data = self._data
+        exists = key in data
+        data[key] = value
+        if not exists or self._lru:
+            data.move_to_end(key)
+            self._touched[key] = time.monotonic()
+
+        size = _estimate_size(value)
+        self._bytes += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+        self._expire()
+        if limits.max_size is not None:
+            while len(data) > limits.max_size:
+                self._evict_oldest()
+
+        if limits.max_bytes is not None:
+            while self._bytes > limits.max_bytes and len(data) > 1:
+                self._evict_oldest()
+
+    def __delitem__(self, key: Any) -> None:
+        self._drop(key)
+
+    def pop(self, key: Any, *args: Any) -> Any:
+        try:
+            return self._drop(key)
+        except KeyError:
+            if args:
+                return args[0]
+            raise
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, _missing) is not _missing
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expire()
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._data)
+
+    def values(self) -> Any:
+        self._expire()
+        return self._data.values()
+
+    def items(self) -> Any:
+        self._expire()
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._sizes.clear()
+        self._touched.clear()
+        self._bytes = 0
+
+
+
+class MessageCache(collections.abc.Sequence):
+    """Internal storage for the message cache.
+
+    Messages are kept in insertion order (or recency order with the ``'lru'``
+    policy) and indexed by message ID, with secondary indexes per channel
+    and per guild so that lookups and bulk removals don't need to scan the
+    whole cache.
+    """
+
+    __slots__ = ('max_messages', 'max_per_channel', 'max_per_guild', '_lru', '_messages', '_by_channel', '_by_guild')
+
+    def __init__(
+        self,
+        max_messages: int,
+        *,
+        policy: str = 'fifo',
+        max_per_channel: Optional[int] = None,
+        max_per_guild: Optional[int] = None,
+    ) -> None:
+        if policy not in ('lru', 'fifo'):
+            raise ValueError(f'policy must be either \'lru\' or \'fifo\' not {policy!r}')
+
+        self.max_messages: int = max_messages
+        # quotas keep a single busy channel or guild from evicting everyone else
+        self.max_per_channel: Optional[int] = max_per_channel
+        self.max_per_guild: Optional[int] = max_per_guild
+        self._lru: bool = policy == 'lru'
+        self._messages: Dict[int, Message] = {}
+        # these are used as ordered sets of message IDs
+        self._by_channel: Dict[int, Dict[int, None]] = {}
+        self._by_guild: Dict[Optional[int], Dict[int, None]] = {}
+
+    def __repr__(self) -> str:
+        return f'<MessageCache len={len(self._messages)} max_messages={self.max_messages}>'
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __iter__(self) -> Iterator[Message]:
+        return iter(self._messages.values())
+
+    def __reversed__(self) -> Iterator[Message]:
+        return reversed(self._messages.values())  # type: ignore
+
+    def __getitem__(self, idx: Any) -> Any:
+        # O(n), only kept for Sequence compatibility
+        return list(self._messages.values())[idx]
+
+    def __contains__(self, message: Any) -> bool:
+        try:
+            return self._messages[message.id] is message
+        except (AttributeError, KeyError):
+            return False
+
+    @staticmethod
+    def _guild_id(message: Message) -> Optional[int]:
+        guild = message.guild
+        return guild and guild.id
+
+    def _index(self, message: Message) -> None:
+        message_id = message.id
+        self._messages[message_id] = message
+        try:
+            self._by_channel[message.channel.id][message_id] = None
+        except KeyError:
+            self._by_channel[message.channel.id] = {message_id: None}
+
+        guild_id = self._guild_id(message)
+        try:
+            self._by_guild[guild_id][message_id] = None
+        except KeyError:
+            self._by_guild[guild_id] = {message_id: None}
+
+    def _unindex(self, message: Message) -> None:
+        message_id = message.id
+        del self._messages[message_id]
+
+        channel_id = message.channel.id
+        by_channel = self._by_channel[channel_id]
+        del by_channel[message_id]
+        if not by_channel:
+            del self._by_channel[channel_id]
+
+        guild_id = self._guild_id(message)
+        by_guild = self._by_guild[guild_id]
+        del by_guild[message_id]
+        if not by_guild:
+            del self._by_guild[guild_id]
+
+    def append(self, message: Message) -> None:
+        old = self._messages.get(message.id)
+        if old is not None:
+            self._unindex(old)
+
+        self._index(message)
+        messages = self._messages
+
+        limit = self.max_per_channel
+        if limit is not None:
+            by_channel = self._by_channel[message.channel.id]
+            while len(by_channel) > limit:
+                self._unindex(messages[next(iter(by_channel))])
+
+        limit = self.max_per_guild
+        guild_id = self._guild_id(message)
+        if limit is not None and guild_id is not None:
+            by_guild = self._by_guild[guild_id]
+            while len(by_guild) > limit:
+                self._unindex(messages[next(iter(by_guild))])
+
+        while len(messages) > self.max_messages:
+            self._unindex(next(iter(messages.values())))
+
+    def get(self, message_id: Optional[int]) -> Optional[Message]:
+        message = self._messages.get(message_id)  # type: ignore
+        if message is not None and self._lru:
+            # re-insert to move it to the most recently used end
+            self._unindex(message)
+            self._index(message)
+        return message
+
+    def pop(self, message_id: int) -> Optional[Message]:
+        message = self._messages.get(message_id)
+        if message is not None:
+            self._unindex(message)
+        return message
+
+    def remove(self, message: Message) -> None:
+        if message not in self:
+            raise ValueError('message not in cache')
+        self._unindex(message)
+
+    def pop_many(self, message_ids: Iterable[int]) -> List[Message]:
+        get = self._messages.get
+        found = [message for message in map(get, message_ids) if message is not None]
+        found.sort(key=lambda m: m.id)
+        for message in found:
+            self._unindex(message)
+        return found
+
+    def channel_messages(self, channel_id: int) -> List[Message]:
+        messages = self._messages
+        return [messages[message_id] for message_id in self._by_channel.get(channel_id, ())]
+
+    def guild_messages(self, guild_id: Optional[int]) -> List[Message]:
+        messages = self._messages
+        return [messages[message_id] for message_id in self._by_guild.get(guild_id, ())]
+
+    def remove_channel(self, channel_id: int) -> List[Message]:
+        removed = self.channel_messages(channel_id)
+        for message in removed:
+            self._unindex(message)
+        return removed
+
+    def remove_guild(self, guild_id: int) -> List[Message]:
+        removed = self.guild_messages(guild_id)
+        for message in removed:
+            self._unindex(message)
+        return removed
+
+    def clear(self) -> None:
+        self._messages.clear()
+        self._by_channel.clear()
+        self._by_guild.clear()
+
+
+def _entity_names(entity: Any) -> Tuple[str]:
+    return (entity.name,)
+
+
+class NameIndex(Generic[V]):
+    """Internal index of cached objects by their case-folded names.
+
+    Exact lookups are a dictionary lookup and prefix searches are a binary
+    search over the sorted names. An object can be indexed under several
+    names, e.g. a member's username and nickname; by default only its
+    ``name`` attribute is used. Objects whose names changed since they were
+    last added are filtered out of the results.
+
+    If ``resolve`` is given, only IDs are kept and results are looked up
+    through it, for stores that create their objects on access.
+
+    New names are only merged into the sorted names by the next prefix
+    search, and removed ones are dropped from them in bulk, so that adding
+    many objects does not shift the sorted list once per name.
+    """
+
+    __slots__ = ('_names', '_resolve', '_entries', '_keys', '_pending', '_stale', '_indexed')
+
+    def __init__(
+        self,
+        names: Callable[[V], Iterable[Optional[str]]] = _entity_names,
+        *,
+        resolve: Optional[Callable[[int], Optional[V]]] = None,
+    ) -> None:
+        self._names: Callable[[V], Iterable[Optional[str]]] = names
+        self._resolve: Optional[Callable[[int], Optional[V]]] = resolve
+        self._entries: Dict[str, Dict[int, Optional[V]]] = {}
+        self._keys: List[str] = []
+        self._pending: List[str] = []  # new names that are not in _keys yet
+        self._stale: Set[str] = set()  # names still in _keys without entries
+        self._indexed: Dict[int, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def _keys_of(self, value: V) -> FrozenSet[str]:
+        return frozenset(name.casefold() for name in self._names(value) if name)
+
+    def _values(self, entries: Dict[int, Optional[V]]) -> Iterable[Tuple[int, V]]:
+        resolve = self._resolve
+        if resolve is None:
+            return entries.items()  # type: ignore
+        resolved = ((id, resolve(id)) for id in list(entries))
+        return [(id, value) for id, value in resolved if value is not None]
+
+    def add(self, id: int, value: V) -> None:
+        keys = self._keys_of(value)
+        if self._resolve is not None:
+            value = None  # type: ignore
+        if self._indexed.get(id) == keys:
+            for key in keys:
+                self._entries[key][id] = value
+            return
+
+        self.remove(id)
+        for key in keys:
+            try:
+                entries = self._entries[key]
+            except KeyError:
+                entries = self._entries[key] = {}
+                if key in self._stale:
+                    self._stale.discard(key)
+                else:
+                    self._pending.append(key)
+            entries[id] = value
+        self._indexed[id] = keys
+
+    def remove(self, id: int) -> None:
+        for key in self._indexed.pop(id, ()):
+            entries = self._entries[key]
+            del entries[id]
+            if not entries:
+                del self._entries[key]
+                self._stale.add(key)
+
+    def get(self, name: str) -> List[V]:
+        key = name.casefold()
+        entries = self._entries.get(key)
+        if not entries:
+            return []
+        return [value for _, value in self._values(entries) if key in self._keys_of(value)]
+
+    def search(self, prefix: str, *, limit: Optional[int] = None) -> List[V]:
+        prefix = prefix.casefold()
+        keys = self._sorted_keys()
+        found: Dict[int, V] = {}
+        index = bisect.bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            entries = self._entries.get(keys[index])
+            index += 1
+            if entries is None:
+                continue
+
+            for id, value in self._values(entries):
+                if id in found or not any(key.startswith(prefix) for key in self._keys_of(value)):
+                    continue
+
+                found[id] = value
+                if limit is not None and len(found) >= limit:
+                    return list(found.values())
+
+        return list(found.values())
+
+    def _sorted_keys(self) -> List[str]:
+        keys = self._keys
+        if self._pending:
+            # sorting a sorted list with a tail of new names is mostly a merge
+            keys.extend(self._pending)
+            keys.sort()
+            self._pending.clear()
+
+        stale = self._stale
+        if len(stale) * 4 > len(keys):
+            # removed names are only skipped by searches until they pile up
+            keys[:] = [key for key in keys if key not in stale]
+            stale.clear()
+        return keys
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys.clear()
+        self._pending.clear()
+        self._stale.clear()
+        self._indexed.clear()
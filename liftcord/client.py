@@ -46,11 +46,13 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import signal
 import sys
 import traceback
-from typing import Any, Callable, Coroutine, Dict, Generator, List, Optional, Sequence, TYPE_CHECKING, Tuple, TypeVar, Union
+import time
+from typing import Any, AsyncIterator, Callable, Coroutine, Dict, Generator, Iterable, List, Optional, Sequence, TYPE_CHECKING, Tuple, TypeVar, Union
 
 import aiohttp
 
@@ -67,16 +69,20 @@ from .errors import *
 from .enums import Status, VoiceRegion
 from .flags import ApplicationFlags, Intents
 from .gateway import *
+from .gateway import HAS_ZSTANDARD, LoopWatchdog
 from .activity import ActivityTypes, BaseActivity, create_activity
 from .voice_client import VoiceClient
 from .http import HTTPClient
+from .codec import Codec
+from .metrics import MetricsSink, _measure
 from .state import ConnectionState
+from . import snapshot
 from . import utils
 from .utils import MISSING
 from .object import Object
 from .backoff import ExponentialBackoff
 from .webhook import Webhook
-from .iterators import GuildIterator
+from .iterators import AuditLogIterator, GuildIterator, HistoryIterator
 from .appinfo import AppInfo
 from .ui.view import View
 from .stage_instance import StageInstance
@@ -84,8 +90,10 @@ from .threads import Thread
 from .sticker import GuildSticker, StandardSticker, StickerPack, _sticker_factory
 
 if TYPE_CHECKING:
-    from .abc import SnowflakeTime, PrivateChannel, GuildChannel, Snowflake
+    from .abc import SnowflakeTime, PrivateChannel, GuildChannel, Snowflake, Messageable
+    from .audit_logs import AuditLogEntry
     from .channel import DMChannel
+    from .cursors import CursorStore
     from .message import Message
     from .member import Member
     from .voice_client import VoiceProtocol
@@ -99,6 +107,19 @@ Coro = TypeVar('Coro', bound=Callable[..., Coroutine[Any, Any, Any]])
 
 _log = logging.getLogger(__name__)
 
+# Extracts the ``key`` that Client.wait_for waiters can be indexed by.
+_WAIT_FOR_KEYS: Dict[str, Callable[..., Any]] = {
+    'message': lambda message: message.channel.id,
+    'message_edit': lambda before, after: after.channel.id,
+    'message_delete': lambda message: message.channel.id,
+    'typing': lambda channel, user, when: channel.id,
+    'reaction_add': lambda reaction, user: reaction.message.id,
+    'reaction_remove': lambda reaction, user: reaction.message.id,
+    'raw_reaction_add': lambda payload: payload.message_id,
+    'raw_reaction_remove': lambda payload: payload.message_id,
+    'interaction': lambda interaction: interaction.message.id,
+}
+
 def _cancel_tasks(loop: asyncio.AbstractEventLoop) -> None:
     tasks = {t for t in asyncio.all_tasks(loop=loop) if not t.done()}
 
@@ -130,6 +151,42 @@ def _cleanup_loop(loop: asyncio.AbstractEventLoop) -> None:
         _log.info('Closing the event loop.')
         loop.close()
 
+async def _interleave(
+    sources: List[Any], read: Callable[[Any], AsyncIterator[Any]], concurrency: int
+) -> AsyncIterator[Tuple[Any, Any]]:
+    # Runs ``read`` over up to ``concurrency`` sources at once and yields ``(source, page)``
+    # as pages arrive, or ``(source, exc)`` if reading a source failed.
+    # bounded so that slow consumers stop the sources from being read ahead
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def pump(source: Any) -> None:
+        pages = read(source)
+        try:
+            async with semaphore:
+                async for page in pages:
+                    await queue.put((source, page))
+        except Exception as exc:
+            await queue.put((source, exc))
+        finally:
+            await pages.aclose()
+        # not reached when cancelled, as nothing is left to drain the queue then
+        await queue.put(None)
+
+    tasks = [asyncio.ensure_future(pump(source)) for source in sources]
+    remaining = len(tasks)
+    try:
+        while remaining:
+            item = await queue.get()
+            if item is None:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 class Client:
     r"""Represents a client connection that connects to Discord.
     This class is used to interact with the Discord WebSocket and API.
@@ -144,6 +201,50 @@ class Client:
 
         .. versionchanged:: 1.3
             Allow disabling the message cache and change the default size to ``1000``.
+    message_cache_policy: :class:`str`
+        How messages are evicted once the message cache is full. ``'fifo'``, the default,
+        evicts the oldest cached message, ``'lru'`` evicts the least recently looked up one.
+
+        .. versionadded:: 2.0
+    max_messages_per_channel: Optional[:class:`int`]
+        The maximum number of messages from a single channel kept in the message cache.
+        Once reached, the channel's oldest messages are evicted first, leaving the rest
+        of the cache untouched. Defaults to ``None`` (no quota).
+
+        .. versionadded:: 2.0
+    max_messages_per_guild: Optional[:class:`int`]
+        Same as ``max_messages_per_channel`` but for all channels of a single guild.
+
+        .. versionadded:: 2.0
+    message_cache_check: Optional[Callable[[:class:`.Message`], :class:`bool`]]
+        A predicate called with every received message to decide whether it
+        should be stored in the message cache. Defaults to ``None``, caching
+        every message.
+
+        .. versionadded:: 2.0
+    lazy_messages: :class:`bool`
+        Whether messages received through :func:`on_message` keep their raw payload
+        and only build :attr:`.Message.attachments`, :attr:`.Message.embeds`,
+        :attr:`.Message.stickers`, :attr:`.Message.components`, :attr:`.Message.mentions`
+        and :attr:`.Message.reference` the first time they are accessed. This lowers
+        the cost of every message event at the expense of keeping the payload of
+        cached messages alive. Defaults to ``False``.
+
+        .. versionadded:: 2.0
+    skip_unused_events: :class:`bool`
+        Whether gateway events that only exist to be dispatched, such as ``TYPING_START``,
+        are discarded without being parsed when no event handler, listener or
+        :meth:`wait_for` call is waiting on them. Defaults to ``True``.
+
+        .. versionadded:: 2.0
+    cache_presences: :class:`bool`
+        Whether ``PRESENCE_UPDATE`` events are always applied to the cache. If this is
+        ``False`` and ``skip_unused_events`` is enabled, presence updates are discarded
+        unless something listens to :func:`on_presence_update` or :func:`on_user_update`,
+        so :attr:`.Member.status` and :attr:`.Member.activities` stay as they were last
+        received. Defaults to ``True``.
+
+        .. versionadded:: 2.0
     loop: Optional[:class:`asyncio.AbstractEventLoop`]
         The :class:`asyncio.AbstractEventLoop` to use for asynchronous operations.
         Defaults to ``None``, in which case the default event loop is used via
@@ -192,6 +293,30 @@ class Client:
         WebSocket in the case of not receiving a HEARTBEAT_ACK. Useful if
         processing the initial packets take too long to the point of disconnecting
         you. The default timeout is 60 seconds.
+    heartbeat_mode: :class:`str`
+        How gateway and voice connections send their heartbeats. ``'thread'``, the
+        default, starts a thread per connection. ``'asyncio'`` runs the heartbeats of
+        every connection from a single timer task on the event loop, which avoids
+        hundreds of threads with many shards or voice connections.
+
+        .. versionadded:: 2.0
+    loop_watchdog: Optional[:class:`float`]
+        When set, a single watchdog thread for the whole process logs a warning with
+        the traceback of the event loop thread whenever the loop has been blocked for
+        this many seconds. The per connection warning of the ``'thread'`` heartbeat
+        mode is only logged after 10 seconds and is not available in the ``'asyncio'``
+        mode. Defaults to ``None``, which disables the watchdog.
+
+        .. versionadded:: 2.0
+    metrics_sink: Optional[:class:`MetricsSink`]
+        Receives instrumentation of the client: the time taken to decode and parse
+        each gateway event type, the run time of each event listener, and event loop
+        lag and stalls. See :class:`MetricsSink` for the measurements and
+        :class:`InMemoryMetrics` for a sink that can be inspected from the bot. This
+        also starts the ``loop_watchdog``, with a threshold of 10 seconds unless set.
+        Defaults to ``None``, which disables instrumentation.
+
+        .. versionadded:: 2.0
     guild_ready_timeout: :class:`float`
         The maximum number of seconds to wait for the GUILD_CREATE stream to end before
         preparing the member cache and firing READY. The default timeout is 2 seconds.
@@ -212,6 +337,57 @@ class Client:
         this is ``False`` then those events will not be dispatched (due to performance considerations).
         To enable these events, this must be set to ``True``. Defaults to ``False``.
 
+        .. versionadded:: 2.0
+    cache_limits: Optional[Dict[:class:`str`, :class:`CacheLimits`]]
+        Per-entity limits for the internal cache, keyed by entity name
+        (``'users'``, ``'guilds'``, ``'emojis'``, ``'stickers'``, ``'members'``,
+        ``'channels'`` or ``'threads'``). Entities without limits are stored
+        in unbounded dictionaries.
+
+        .. versionadded:: 2.0
+    cache_backend: Optional[Type[:class:`CacheBackend`]]
+        The :class:`CacheBackend` used to create every entity store of the
+        internal cache. Defaults to :class:`MemoryCache` for entities that have
+        limits set in ``cache_limits``.
+
+        .. versionadded:: 2.0
+    snapshot_path: Optional[:class:`str`]
+        The path of a cache snapshot used to restart without reconnecting from scratch.
+        When the client is closed, its guilds, channels, threads, roles, members, emojis,
+        stickers and gateway session are written there, and the session is left open. The
+        next start restores the cache from the snapshot and resumes that session instead
+        of identifying, so guilds are not received and chunked again. Snapshots older
+        than a few minutes, or taken with different intents or shard count, are ignored.
+        Defaults to ``None``, which disables snapshots.
+
+        .. versionadded:: 2.0
+    compact_members: :class:`bool`
+        Whether each guild stores its members in packed columns instead of keeping a
+        :class:`Member` object per member, which takes a fraction of the memory for
+        very large guilds. Members are then created when they are looked up, so a
+        :class:`Member` kept around does not reflect later updates; look it up again
+        through :meth:`Guild.get_member` instead. This overrides ``cache_backend`` for
+        members and cannot be combined with ``cache_limits`` for ``'members'``.
+        Defaults to ``False``.
+
+        .. versionadded:: 2.0
+    codec: Optional[:class:`Codec`]
+        The codec used to decode and encode gateway and HTTP payloads. Defaults to
+        :class:`OrjsonCodec` if ``orjson`` is installed, :class:`MsgspecCodec` if
+        ``msgspec`` is installed and :class:`JSONCodec` otherwise.
+
+        .. versionadded:: 2.0
+    gateway_codec: Optional[:class:`Codec`]
+        The codec used for the gateway connection only. Its :attr:`Codec.encoding`
+        is requested when connecting, so passing an :class:`ETFCodec` switches the
+        gateway to ETF. Defaults to ``codec``.
+
+        .. versionadded:: 2.0
+    gateway_compression: :class:`str`
+        The transport compression used for the gateway connection, either
+        ``'zlib-stream'`` (the default) or ``'zstd-stream'``. The latter requires
+        the ``zstandard`` library.
+
         .. versionadded:: 2.0
 
     Attributes
@@ -230,7 +406,7 @@ class Client:
         # self.ws is set in the connect method
         self.ws: DiscordWebSocket = None  # type: ignore
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
-        self._listeners: Dict[str, List[Tuple[asyncio.Future, Callable[..., bool]]]] = {}
+        self._listeners: Dict[str, Dict[Optional[int], Dict[asyncio.Future, Callable[..., bool]]]] = {}
         self.shard_id: Optional[int] = options.get('shard_id')
         self.shard_count: Optional[int] = options.get('shard_count')
 
@@ -238,7 +414,30 @@ class Client:
         proxy: Optional[str] = options.pop('proxy', None)
         proxy_auth: Optional[aiohttp.BasicAuth] = options.pop('proxy_auth', None)
         unsync_clock: bool = options.pop('assume_unsync_clock', True)
-        self.http: HTTPClient = HTTPClient(connector, proxy=proxy, proxy_auth=proxy_auth, unsync_clock=unsync_clock, loop=self.loop)
+        codec: Optional[Codec] = options.pop('codec', None)
+        if codec is not None and not isinstance(codec, Codec):
+            raise TypeError(f'codec parameter must be Codec not {type(codec)!r}')
+
+        gateway_codec: Optional[Codec] = options.pop('gateway_codec', None)
+        if gateway_codec is not None and not isinstance(gateway_codec, Codec):
+            raise TypeError(f'gateway_codec parameter must be Codec not {type(gateway_codec)!r}')
+
+        gateway_compression: str = options.pop('gateway_compression', 'zlib-stream')
+        if gateway_compression not in ('zlib-stream', 'zstd-stream'):
+            raise ValueError(f'gateway_compression must be zlib-stream or zstd-stream not {gateway_compression!r}')
+        if gateway_compression == 'zstd-stream' and not HAS_ZSTANDARD:
+            raise RuntimeError('zstandard library needed in order to use zstd-stream compression')
+
+        self.http: HTTPClient = HTTPClient(
+            connector,
+            proxy=proxy,
+            proxy_auth=proxy_auth,
+            unsync_clock=unsync_clock,
+            loop=self.loop,
+            codec=codec,
+            gateway_codec=gateway_codec,
+            gateway_compression=gateway_compression,
+        )
 
         self._handlers: Dict[str, Callable] = {
             'ready': self._handle_ready
@@ -249,12 +448,17 @@ class Client:
         }
 
         self._enable_debug_events: bool = options.pop('enable_debug_events', False)
+        self._snapshot_path: Optional[str] = options.pop('snapshot_path', None)
+        self._loop_watchdog: Optional[float] = options.pop('loop_watchdog', None)
+        if self._loop_watchdog is not None and self._loop_watchdog <= 0:
+            raise ValueError('loop_watchdog must be greater than 0')
         self._connection: ConnectionState = self._get_state(**options)
         self._connection.shard_count = self.shard_count
         self._closed: bool = False
         self._ready: asyncio.Event = asyncio.Event()
         self._connection._get_websocket = self._get_websocket
         self._connection._get_client = lambda: self
+        self._connection._has_listeners = self._has_listeners
 
         if VoiceClient.warn_nacl:
             VoiceClient.warn_nacl = False
@@ -272,6 +476,41 @@ class Client:
     def _handle_ready(self) -> None:
         self._ready.set()
 
+    def _restore_snapshot(self) -> Dict[Optional[int], Tuple[str, int]]:
+        if self._snapshot_path is None:
+            return {}
+
+        data = snapshot.read(self._snapshot_path, self.http.codec, max_age=snapshot.MAX_AGE)
+        if data is None:
+            return {}
+
+        if data['shard_count'] != self.shard_count:
+            _log.info('Not restoring the cache snapshot, it was taken with a different shard count.')
+            return {}
+
+        return self._connection._restore_snapshot(data)
+
+    def _save_snapshot(self, sessions: Dict[Optional[int], Tuple[Optional[str], Optional[int]]]) -> bool:
+        if self._snapshot_path is None or self._connection.user is None:
+            return False
+
+        resumable = {
+            shard_id: (session_id, sequence)
+            for shard_id, (session_id, sequence) in sessions.items()
+            if session_id is not None and sequence is not None
+        }
+        if not resumable:
+            return False
+
+        try:
+            snapshot.write(self._snapshot_path, self.http.codec, self._connection._dump_snapshot(resumable))
+        except Exception:
+            _log.exception('Failed to write the cache snapshot to %s.', self._snapshot_path)
+            return False
+
+        _log.info('Wrote the cache snapshot to %s.', self._snapshot_path)
+        return True
+
     @property
     def latency(self) -> float:
         """:class:`float`: Measures latency between a HEARTBEAT and a HEARTBEAT_ACK in seconds.
@@ -324,6 +563,21 @@ class Client:
         """
         return utils.SequenceProxy(self._connection._messages or [])
 
+    def cache_memory_usage(self) -> Dict[str, int]:
+        """Returns the estimated size of the internal cache in bytes, per entity.
+
+        Stores created by a :class:`MemoryCache` keep a running estimate, other
+        stores are measured when this is called.
+
+        .. versionadded:: 2.0
+
+        Returns
+        --------
+        Dict[:class:`str`, :class:`int`]
+            A mapping of entity name to its estimated size in bytes.
+        """
+        return self._connection.cache_memory_usage()
+
     @property
     def private_channels(self) -> List[PrivateChannel]:
         """List[:class:`.abc.PrivateChannel`]: The private channels that the connected client is participating on.
@@ -368,6 +622,10 @@ class Client:
         return self._ready.is_set()
 
     async def _run_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> None:
+        metrics = self._connection.metrics
+        if metrics is not None:
+            return await self._run_measured_event(metrics, coro, event_name, *args, **kwargs)
+
         try:
             await coro(*args, **kwargs)
         except asyncio.CancelledError:
@@ -378,28 +636,59 @@ class Client:
             except asyncio.CancelledError:
                 pass
 
+    async def _run_measured_event(
+        self, metrics: MetricsSink, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any
+    ) -> None:
+        tags = {'event': event_name, 'listener': getattr(coro, '__qualname__', repr(coro))}
+        busy = [0.0]
+        start = time.perf_counter()
+        try:
+            await _measure(coro(*args, **kwargs), busy)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            metrics.increment('client.listener.errors', tags=tags)
+            try:
+                await self.on_error(event_name, *args, **kwargs)
+            except asyncio.CancelledError:
+                pass
+        finally:
+            metrics.observe('client.listener', time.perf_counter() - start, tags)
+            metrics.observe('client.listener.busy', busy[0], tags)
+
     def _schedule_event(self, coro: Callable[..., Coroutine[Any, Any, Any]], event_name: str, *args: Any, **kwargs: Any) -> asyncio.Task:
         wrapped = self._run_event(coro, event_name, *args, **kwargs)
         # Schedules the task
         return asyncio.create_task(wrapped, name=f'nextcord: {event_name}')
 
+    def _has_listeners(self, event: str) -> bool:
+        return event in self._listeners or hasattr(self, 'on_' + event)
+
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         _log.debug('Dispatching event %s', event)
         method = 'on_' + event
 
-        listeners = self._listeners.get(event)
-        if listeners:
-            removed = []
-            for i, (future, condition) in enumerate(listeners):
-                if future.cancelled():
-                    removed.append(i)
+        waiters = self._listeners.get(event)
+        if waiters:
+            # finished waiters remove themselves through a done callback
+            listeners = list(waiters.get(None, {}).items())
+            if len(waiters) > int(None in waiters):
+                try:
+                    key = _WAIT_FOR_KEYS[event](*args)
+                except Exception:
+                    key = None
+
+                if key is not None:
+                    listeners.extend(waiters.get(key, {}).items())
+
+            for future, condition in listeners:
+                if future.done():
                     continue
 
                 try:
                     result = condition(*args)
                 except Exception as exc:
                     future.set_exception(exc)
-                    removed.append(i)
                 else:
                     if result:
                         if len(args) == 0:
@@ -408,13 +697,6 @@ class Client:
                             future.set_result(args[0])
                         else:
                             future.set_result(args)
-                        removed.append(i)
-
-            if len(removed) == len(listeners):
-                self._listeners.pop(event)
-            else:
-                for idx in reversed(removed):
-                    del listeners[idx]
 
         try:
             coro = getattr(self, method)
@@ -497,6 +779,10 @@ class Client:
         data = await self.http.static_login(token.strip())
         self._connection.user = ClientUser(state=self._connection, data=data)
 
+        metrics = self._connection.metrics
+        if self._loop_watchdog is not None or metrics is not None:
+            LoopWatchdog.watch(self.loop, self._loop_watchdog or 10.0, sink=metrics)
+
     async def connect(self, *, reconnect: bool = True) -> None:
         """|coro|
 
@@ -527,6 +813,10 @@ class Client:
             'initial': True,
             'shard_id': self.shard_id,
         }
+        session = self._restore_snapshot().get(self.shard_id)
+        if session is not None:
+            ws_params.update(resume=True, session=session[0], sequence=session[1])
+
         while not self.is_closed():
             try:
                 coro = DiscordWebSocket.from_client(self, **ws_params)
@@ -599,7 +889,11 @@ class Client:
                 pass
 
         if self.ws is not None and self.ws.open:
-            await self.ws.close(code=1000)
+            if self._save_snapshot({self.shard_id: (self.ws.session_id, self.ws.sequence)}):
+                # closing with 1000 would invalidate the session the snapshot resumes
+                await self.ws.close(code=4000)
+            else:
+                await self.ws.close(code=1000)
 
         await self.http.close()
         self._ready.clear()
@@ -933,12 +1227,28 @@ class Client:
         """
         await self._ready.wait()
 
+    def _remove_listener(self, event: str, key: Optional[int], future: asyncio.Future) -> None:
+        waiters = self._listeners.get(event)
+        if waiters is None:
+            return
+
+        listeners = waiters.get(key)
+        if listeners is None:
+            return
+
+        listeners.pop(future, None)
+        if not listeners:
+            del waiters[key]
+            if not waiters:
+                del self._listeners[event]
+
     def wait_for(
         self,
         event: str,
         *,
         check: Optional[Callable[..., bool]] = None,
         timeout: Optional[float] = None,
+        key: Optional[int] = None,
     ) -> Any:
         """|coro|
 
@@ -1007,11 +1317,21 @@ class Client:
         timeout: Optional[:class:`float`]
             The number of seconds to wait before timing out and raising
             :exc:`asyncio.TimeoutError`.
+        key: Optional[:class:`int`]
+            Only run ``check`` for events with this key, which is much faster
+            when many waiters are pending for the same event. The key is the
+            channel ID for ``message``, ``message_edit``, ``message_delete`` and
+            ``typing``, and the message ID for ``reaction_add``, ``reaction_remove``,
+            ``raw_reaction_add``, ``raw_reaction_remove`` and ``interaction``.
+
+            .. versionadded:: 2.0
 
         Raises
         -------
         asyncio.TimeoutError
             If a timeout is provided and it was reached.
+        ValueError
+            A ``key`` was given for an event that cannot be keyed.
 
         Returns
         --------
@@ -1028,13 +1348,12 @@ class Client:
             check = _check
 
         ev = event.lower()
-        try:
-            listeners = self._listeners[ev]
-        except KeyError:
-            listeners = []
-            self._listeners[ev] = listeners
+        if key is not None and ev not in _WAIT_FOR_KEYS:
+            raise ValueError(f'the {event!r} event cannot be waited for with a key')
 
-        listeners.append((future, check))
+        waiters = self._listeners.setdefault(ev, {})
+        waiters.setdefault(key, {})[future] = check
+        future.add_done_callback(functools.partial(self._remove_listener, ev, key))
         return asyncio.wait_for(future, timeout)
 
     # event registration
@@ -1189,6 +1508,176 @@ class Client:
         """
         return GuildIterator(self, limit=limit, before=before, after=after)
 
+    async def export_history(
+        self,
+        channels: Iterable[Messageable],
+        *,
+        limit: Optional[int] = None,
+        before: SnowflakeTime = None,
+        after: SnowflakeTime = None,
+        oldest_first: Optional[bool] = None,
+        raw: bool = True,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Tuple[Messageable, List[Any]]]:
+        """Retrieves the message history of several channels concurrently, page by page.
+
+        Each channel is read with :meth:`abc.Messageable.history` with ``prefetch`` set,
+        and up to ``concurrency`` channels are read at the same time. Requests go through
+        the same rate limiter as every other request, and the messages of different
+        channels are limited separately by Discord.
+
+        Pages are yielded as soon as they are received, so the pages of different
+        channels are interleaved, while the pages of a channel are in order.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for channel, messages in client.export_history(guild.text_channels):
+                archive.write(channel.id, messages)
+
+        Parameters
+        -----------
+        channels: Iterable[:class:`abc.Messageable`]
+            The channels to read.
+        limit: Optional[:class:`int`]
+            The number of messages to retrieve per channel. Defaults to ``None``,
+            which retrieves every message.
+        before: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages before this date or message.
+        after: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+            Retrieve messages after this date or message.
+        oldest_first: Optional[:class:`bool`]
+            If set to ``True``, return messages in oldest->newest order. Defaults to ``True`` if
+            ``after`` is specified, otherwise ``False``.
+        raw: :class:`bool`
+            Whether to return the message payloads as received from Discord instead of
+            :class:`.Message` objects. Defaults to ``True``.
+        concurrency: :class:`int`
+            The number of channels read at the same time. Defaults to ``4``.
+
+        Raises
+        ------
+        :exc:`.Forbidden`
+            You do not have permissions to get the message history of a channel.
+        :exc:`.HTTPException`
+            Getting the message history failed.
+
+        Yields
+        -------
+        Tuple[:class:`abc.Messageable`, List[Union[:class:`.Message`, :class:`dict`]]]
+            A channel and a page of its messages.
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        async def read(channel: Messageable) -> AsyncIterator[List[Any]]:
+            iterator = HistoryIterator(
+                channel, limit, before=before, after=after, oldest_first=oldest_first, raw=raw, prefetch=True
+            )
+            try:
+                while True:
+                    page = await iterator._next_page()
+                    if not page:
+                        break
+                    yield page
+            finally:
+                if iterator._prefetched is not None:
+                    iterator._prefetched.cancel()
+
+        pages = _interleave(list(channels), read, concurrency)
+        try:
+            async for channel, page in pages:
+                if isinstance(page, Exception):
+                    raise page
+                yield channel, page
+        finally:
+            await pages.aclose()
+
+    async def sync_audit_logs(
+        self,
+        guilds: Iterable[Guild],
+        store: CursorStore,
+        *,
+        limit: Optional[int] = None,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Tuple[Guild, List[AuditLogEntry]]]:
+        """Retrieves the audit log entries created since the last sync for several guilds concurrently.
+
+        This is the batched form of :meth:`Guild.sync_audit_logs`. Up to ``concurrency``
+        guilds are read at the same time, and the requests go through the same rate
+        limiter as every other request. Audit logs are limited per guild by Discord,
+        so polling many guilds this way is bound by the global rate limit.
+
+        The cursor of a guild is advanced once the consumer asks for the next page, and
+        ``store`` is flushed once when the sync finishes or stops. A guild whose audit
+        logs cannot be retrieved, for example because of missing permissions, is logged
+        and skipped without advancing its cursor, so it is retried on the next sync.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            store = nextcord.FileCursorStore('audit_cursors.json')
+            while True:
+                async for guild, entries in client.sync_audit_logs(client.guilds, store):
+                    archive.write(guild.id, entries)
+                await asyncio.sleep(60)
+
+        Parameters
+        -----------
+        guilds: Iterable[:class:`.Guild`]
+            The guilds to read.
+        store: :class:`.CursorStore`
+            The store the cursors are read from and written to.
+        limit: Optional[:class:`int`]
+            The maximum number of entries to retrieve per guild. Defaults to ``None``,
+            which retrieves every new entry.
+        concurrency: :class:`int`
+            The number of guilds read at the same time. Defaults to ``4``.
+
+        Raises
+        ------
+        ValueError
+            ``concurrency`` is less than 1.
+
+        Yields
+        -------
+        Tuple[:class:`.Guild`, List[:class:`.AuditLogEntry`]]
+            A guild and a page of its new entries, in oldest->newest order.
+        """
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+
+        async def read(guild: Guild) -> AsyncIterator[List[AuditLogEntry]]:
+            cursor = await store.get(guild.id)
+            after = Object(id=cursor) if cursor is not None else None
+            iterator = AuditLogIterator(guild, limit=limit, after=after, oldest_first=True)
+            async for entries in iterator.pages():
+                yield entries
+
+        pages = _interleave(list(guilds), read, concurrency)
+        try:
+            async for guild, entries in pages:
+                if isinstance(entries, HTTPException):
+                    # one guild failing, usually without view_audit_log, must not stop the others
+                    _log.warning('Skipping the audit log sync of guild %s: %s', guild.id, entries)
+                    continue
+                elif isinstance(entries, Exception):
+                    raise entries
+
+                yield guild, entries
+                await store.set(guild.id, entries[-1].id)
+        finally:
+            await pages.aclose()
+            await store.flush()
+
     async def fetch_template(self, code: Union[Template, str]) -> Template:
         """|coro|
 
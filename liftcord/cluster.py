@@ -0,0 +1,690 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import math
+import multiprocessing
+import os
+import shutil
+import socket
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from . import utils
+from .activity import create_activity
+from .client import _cleanup_loop
+from .enums import Status
+from .errors import ClientException
+from .gateway import IdentifyBuckets
+from .http import HTTPClient
+from .shard import AutoShardedClient
+
+if TYPE_CHECKING:
+    from .activity import BaseActivity
+    from .guild import Guild
+
+    Address = Union[str, Tuple[str, int]]
+
+__all__ = (
+    'Cluster',
+    'ClusterWorker',
+)
+
+_log = logging.getLogger(__name__)
+
+_HEADER = struct.Struct('!I')
+
+
+def _shard_ranges(shard_count: int, cluster_count: int) -> List[List[int]]:
+    # contiguous ranges, the first clusters take one extra shard when uneven
+    per, extra = divmod(shard_count, cluster_count)
+    ranges = []
+    start = 0
+    for cluster_id in range(cluster_count):
+        end = start + per + (cluster_id < extra)
+        ranges.append(list(range(start, end)))
+        start = end
+    return ranges
+
+
+def _guild_summary(guild: Guild) -> Dict[str, Any]:
+    return {
+        'id': guild.id,
+        'name': guild.name,
+        'shard_id': guild.shard_id,
+        'owner_id': guild.owner_id,
+        'member_count': guild.member_count,
+        'unavailable': guild.unavailable,
+    }
+
+
+class _Channel:
+    # length prefixed JSON messages over a local stream socket
+    __slots__ = ('reader', 'writer', 'lock')
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+        self.lock = asyncio.Lock()
+
+    async def send(self, payload: Dict[str, Any]) -> None:
+        data = utils._to_json(payload).encode('utf-8')
+        async with self.lock:
+            self.writer.write(_HEADER.pack(len(data)) + data)
+            await self.writer.drain()
+
+    async def recv(self) -> Optional[Dict[str, Any]]:
+        try:
+            header = await self.reader.readexactly(_HEADER.size)
+            data = await self.reader.readexactly(_HEADER.unpack(header)[0])
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+        return utils._from_json(data)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+def _resolve(future: asyncio.Future, payload: Dict[str, Any]) -> None:
+    if future.done():
+        return
+    if 'error' in payload:
+        future.set_exception(ClientException(payload['error']))
+    else:
+        future.set_result(payload.get('data'))
+
+
+class Cluster:
+    """Runs an :class:`AutoShardedClient` across several worker processes.
+
+    The shards reported by the Bot Gateway endpoint (or ``shard_count``) are
+    split in contiguous ranges, one per process. The process running the
+    cluster acts as the coordinator: it spaces out every IDENTIFY according to
+    the ``max_concurrency`` of the session start limit and relays requests
+    between the workers over a local socket, see :class:`ClusterWorker`.
+
+    Workers are started with the ``spawn`` method, so ``factory`` must be
+    importable from the worker process, e.g. a subclass of
+    :class:`AutoShardedClient` defined at module level.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    factory: Callable[..., :class:`AutoShardedClient`]
+        Creates the client of a worker. It is called with the ``shard_ids`` and
+        ``shard_count`` keyword arguments.
+    cluster_count: Optional[:class:`int`]
+        The number of worker processes. Defaults to the number of CPUs and is
+        never more than the number of shards.
+    shard_count: Optional[:class:`int`]
+        The total number of shards. Defaults to the recommended shard count.
+    path: Optional[:class:`str`]
+        The path of the Unix socket the workers connect to. Defaults to a
+        temporary file. Platforms without Unix sockets use a loopback TCP
+        socket instead.
+    timeout: :class:`float`
+        How long to wait for a worker to answer a request, in seconds.
+
+    Attributes
+    -----------
+    cluster_count: :class:`int`
+        The number of worker processes.
+    shard_count: Optional[:class:`int`]
+        The total number of shards.
+    max_concurrency: :class:`int`
+        The number of shards allowed to IDENTIFY at the same time.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., AutoShardedClient],
+        *,
+        cluster_count: Optional[int] = None,
+        shard_count: Optional[int] = None,
+        path: Optional[str] = None,
+        timeout: float = 30.0,
+    ) -> None:
+        if cluster_count is None:
+            cluster_count = os.cpu_count() or 1
+        if cluster_count < 1:
+            raise ValueError('cluster_count must be at least 1')
+
+        self.factory: Callable[..., AutoShardedClient] = factory
+        self.cluster_count: int = cluster_count
+        self.shard_count: Optional[int] = shard_count
+        self.max_concurrency: int = 1
+        self.timeout: float = timeout
+        self._path: Optional[str] = path
+        self._tempdir: Optional[str] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._identify: Optional[IdentifyBuckets] = None
+        self._workers: Dict[int, _Channel] = {}
+        self._pending: Dict[int, Tuple[int, asyncio.Future]] = {}
+        self._nonce: int = 0
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+
+    async def fetch_gateway(self, token: str) -> Tuple[int, int]:
+        """|coro|
+
+        Retrieves the recommended shard count and the ``max_concurrency``
+        of the session start limit from the Bot Gateway endpoint.
+
+        Returns
+        --------
+        Tuple[:class:`int`, :class:`int`]
+            The shard count and the maximum concurrency.
+        """
+        http = HTTPClient()
+        try:
+            await http.static_login(token)
+            shard_count, _, limit = await http.get_bot_gateway()
+        finally:
+            await http.close()
+
+        return shard_count, limit['max_concurrency']
+
+    async def start(self, token: str) -> None:
+        """|coro|
+
+        Starts the coordinator and the worker processes, then waits for
+        every worker to exit.
+        """
+        shard_count, self.max_concurrency = await self.fetch_gateway(token)
+        if self.shard_count is None:
+            self.shard_count = shard_count
+
+        self.cluster_count = min(self.cluster_count, self.shard_count)
+        self._identify = IdentifyBuckets(self.max_concurrency)
+        address = await self._listen()
+
+        context = multiprocessing.get_context('spawn')
+        for cluster_id, shard_ids in enumerate(_shard_ranges(self.shard_count, self.cluster_count)):
+            args = (self.factory, token, cluster_id, self.cluster_count, shard_ids, self.shard_count, address)
+            process = context.Process(target=_run_worker, args=args, name=f'liftcord-cluster-{cluster_id}')
+            process.start()
+            self._processes.append(process)
+            _log.info('Started cluster %s with shards %s.', cluster_id, shard_ids)
+
+        loop = asyncio.get_running_loop()
+        try:
+            await asyncio.gather(*(loop.run_in_executor(None, process.join) for process in self._processes))
+        finally:
+            await self.close()
+
+    def run(self, token: str) -> None:
+        """A blocking call that runs :meth:`start` in a new event loop."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self.start(token))
+        except KeyboardInterrupt:
+            _log.info('Received signal to terminate the cluster.')
+            loop.run_until_complete(self.close())
+        finally:
+            _cleanup_loop(loop)
+
+    async def close(self) -> None:
+        """|coro|
+
+        Asks every worker to close its client, then stops the coordinator.
+        Workers that do not exit within :attr:`timeout` are terminated.
+        """
+        for channel in list(self._workers.values()):
+            try:
+                await channel.send({'op': 'shutdown'})
+            except ConnectionError:
+                pass
+
+        loop = asyncio.get_running_loop()
+        for process in self._processes:
+            await loop.run_in_executor(None, process.join, self.timeout)
+            if process.is_alive():
+                _log.warning('Cluster process %s did not exit in time, terminating it.', process.name)
+                process.terminate()
+                await loop.run_in_executor(None, process.join)
+
+        for channel in self._workers.values():
+            channel.close()
+        self._workers.clear()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+
+    async def _listen(self) -> Address:
+        if hasattr(socket, 'AF_UNIX'):
+            path = self._path
+            if path is None:
+                self._tempdir = tempfile.mkdtemp(prefix='liftcord-')
+                path = os.path.join(self._tempdir, 'cluster.sock')
+            self._server = await asyncio.start_unix_server(self._accept, path=path)
+            return path
+
+        self._server = await asyncio.start_server(self._accept, '127.0.0.1', 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return (host, port)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        channel = _Channel(reader, writer)
+        hello = await channel.recv()
+        if hello is None or hello.get('op') != 'hello':
+            channel.close()
+            return
+
+        cluster_id = hello['cluster_id']
+        self._workers[cluster_id] = channel
+        _log.debug('Cluster %s has connected to the coordinator.', cluster_id)
+
+        try:
+            while True:
+                payload = await channel.recv()
+                if payload is None:
+                    break
+                if payload['op'] == 'reply':
+                    try:
+                        _, future = self._pending[payload['nonce']]
+                    except KeyError:
+                        continue
+                    _resolve(future, payload)
+                else:
+                    asyncio.ensure_future(self._handle(channel, payload))
+        finally:
+            if self._workers.get(cluster_id) is channel:
+                del self._workers[cluster_id]
+            for owner, future in self._pending.values():
+                if owner == cluster_id and not future.done():
+                    future.set_exception(ClientException(f'Cluster {cluster_id} has disconnected.'))
+            _log.debug('Cluster %s has disconnected from the coordinator.', cluster_id)
+
+    async def _handle(self, channel: _Channel, payload: Dict[str, Any]) -> None:
+        op = payload['op']
+        reply: Dict[str, Any] = {'op': 'reply', 'nonce': payload['nonce']}
+        try:
+            if op == 'identify':
+                await self._identify.acquire(payload['shard_id'])  # type: ignore
+                reply['data'] = None
+            elif op == 'request':
+                reply['data'] = await self._route(payload['name'], payload['args'], payload.get('cluster_id'))
+            else:
+                raise ClientException(f'Unknown cluster operation {op!r}.')
+        except ClientException as exc:
+            reply['error'] = str(exc)
+        except Exception as exc:
+            reply['error'] = f'{exc.__class__.__name__}: {exc}'
+
+        try:
+            await channel.send(reply)
+        except ConnectionError:
+            pass
+
+    async def _route(self, name: str, args: List[Any], cluster_id: Optional[int]) -> Any:
+        if cluster_id is not None:
+            return await self._call(cluster_id, name, args)
+
+        calls = [self._call(cluster_id, name, args) for cluster_id in range(self.cluster_count)]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+        for cluster_id, result in enumerate(results):
+            if isinstance(result, Exception):
+                _log.warning('Cluster %s failed to handle %r: %s', cluster_id, name, result)
+                results[cluster_id] = None
+        return results
+
+    async def _call(self, cluster_id: int, name: str, args: List[Any]) -> Any:
+        try:
+            channel = self._workers[cluster_id]
+        except KeyError:
+            raise ClientException(f'Cluster {cluster_id} is not connected.') from None
+
+        self._nonce += 1
+        nonce = self._nonce
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = (cluster_id, future)
+        try:
+            await channel.send({'op': 'call', 'nonce': nonce, 'name': name, 'args': args})
+            return await asyncio.wait_for(future, timeout=self.timeout)
+        finally:
+            self._pending.pop(nonce, None)
+
+
+class ClusterWorker:
+    """The connection of a worker process to its :class:`Cluster` coordinator.
+
+    It is available as :attr:`AutoShardedClient.cluster` in the clients
+    started by a :class:`Cluster`.
+
+    Requests are dispatched by name to the handlers of the target workers.
+    The arguments and the return values of handlers go through JSON.
+    The built-in handlers are:
+
+    - ``get_guild``: a summary of a guild by ID, or ``None``.
+    - ``change_presence``: changes the presence of every shard of the worker.
+    - ``stats``: the shards, guild and user counts and latency of the worker.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    client: :class:`AutoShardedClient`
+        The client of this worker.
+    cluster_id: :class:`int`
+        The ID of this worker.
+    cluster_count: :class:`int`
+        The number of workers in the cluster.
+    shard_ids: List[:class:`int`]
+        The shards run by this worker.
+    shard_count: :class:`int`
+        The total number of shards.
+    timeout: :class:`float`
+        How long to wait for the coordinator to answer, in seconds.
+    """
+
+    def __init__(
+        self,
+        client: AutoShardedClient,
+        *,
+        cluster_id: int,
+        cluster_count: int,
+        shard_ids: List[int],
+        shard_count: int,
+        address: Address,
+        timeout: float = 30.0,
+    ) -> None:
+        self.client: AutoShardedClient = client
+        self.cluster_id: int = cluster_id
+        self.cluster_count: int = cluster_count
+        self.shard_ids: List[int] = list(shard_ids)
+        self.shard_count: int = shard_count
+        self.timeout: float = timeout
+        self._address: Address = address
+        self._channel: Optional[_Channel] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._nonce: int = 0
+        self._shard_clusters: Dict[int, int] = {
+            shard_id: owner
+            for owner, ids in enumerate(_shard_ranges(shard_count, cluster_count))
+            for shard_id in ids
+        }
+        self._handlers: Dict[str, Callable[..., Any]] = {
+            'get_guild': self._get_guild,
+            'change_presence': self._change_presence,
+            'stats': self._stats,
+        }
+
+    async def connect(self) -> None:
+        """|coro|
+
+        Connects to the coordinator.
+        """
+        if isinstance(self._address, str):
+            reader, writer = await asyncio.open_unix_connection(self._address)
+        else:
+            reader, writer = await asyncio.open_connection(*self._address)
+
+        self._channel = _Channel(reader, writer)
+        await self._channel.send({'op': 'hello', 'cluster_id': self.cluster_id, 'shard_ids': self.shard_ids})
+        self._reader = asyncio.ensure_future(self._read())
+
+    async def close(self) -> None:
+        """|coro|
+
+        Closes the connection to the coordinator.
+        """
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._channel is not None:
+            self._channel.close()
+            self._channel = None
+
+    def add_handler(self, name: str, func: Callable[..., Any]) -> None:
+        """Registers a handler that other workers can call with :meth:`request`.
+
+        The handler may be a coroutine function. Its arguments and return
+        value must be JSON serialisable.
+        """
+        self._handlers[name] = func
+
+    def cluster_for(self, guild_id: int) -> int:
+        """:class:`int`: Returns the ID of the worker running the shard of a guild."""
+        return self._shard_clusters[(guild_id >> 22) % self.shard_count]
+
+    async def request(self, name: str, *args: Any, cluster_id: Optional[int] = None) -> Any:
+        """|coro|
+
+        Calls a handler on another worker.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the handler.
+        \\*args
+            The arguments passed to the handler.
+        cluster_id: Optional[:class:`int`]
+            The worker to call. If ``None``, every worker is called,
+            including this one.
+
+        Raises
+        -------
+        ClientException
+            The handler failed or the worker could not be reached.
+
+        Returns
+        --------
+        Any
+            The return value of the handler, or a list of the return values
+            of every worker ordered by ID when ``cluster_id`` is ``None``.
+            Workers that failed have ``None`` in that list.
+        """
+        return await self._send({'op': 'request', 'name': name, 'args': args, 'cluster_id': cluster_id})
+
+    async def identify(self, shard_id: int) -> None:
+        """|coro|
+
+        Waits for the coordinator to allow a shard to IDENTIFY.
+        """
+        await self._send({'op': 'identify', 'shard_id': shard_id}, timeout=None)
+
+    async def fetch_guild(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        """|coro|
+
+        Looks up a guild in the worker running its shard.
+
+        Returns
+        --------
+        Optional[Dict[:class:`str`, Any]]
+            The ``id``, ``name``, ``shard_id``, ``owner_id``, ``member_count``
+            and ``unavailable`` keys of the guild, or ``None`` if not found.
+        """
+        cluster_id = self.cluster_for(guild_id)
+        if cluster_id == self.cluster_id:
+            return self._get_guild(guild_id)
+        return await self.request('get_guild', guild_id, cluster_id=cluster_id)
+
+    async def broadcast_presence(self, *, activity: Optional[BaseActivity] = None, status: Optional[Status] = None) -> None:
+        """|coro|
+
+        Changes the presence of every shard of the cluster.
+        The parameters are the same as :meth:`AutoShardedClient.change_presence`.
+        """
+        payload = None if activity is None else activity.to_dict()
+        await self.request('change_presence', payload, None if status is None else str(status))
+
+    async def fetch_stats(self) -> List[Optional[Dict[str, Any]]]:
+        """|coro|
+
+        Retrieves the shards, guild and user counts and latency of every worker.
+        """
+        return await self.request('stats')
+
+    def _get_guild(self, guild_id: int) -> Optional[Dict[str, Any]]:
+        guild = self.client.get_guild(guild_id)
+        return None if guild is None else _guild_summary(guild)
+
+    async def _change_presence(self, activity: Optional[Dict[str, Any]], status: Optional[str]) -> None:
+        await self.client.change_presence(
+            activity=create_activity(activity), status=None if status is None else Status(status)
+        )
+
+    def _stats(self) -> Dict[str, Any]:
+        latency = self.client.latency
+        return {
+            'cluster_id': self.cluster_id,
+            'shard_ids': self.shard_ids,
+            'guilds': len(self.client.guilds),
+            'users': len(self.client.users),
+            'latency': None if math.isnan(latency) else latency,
+        }
+
+    async def _send(self, payload: Dict[str, Any], *, timeout: Optional[float] = utils.MISSING) -> Any:
+        if self._channel is None:
+            raise ClientException('Not connected to the cluster coordinator.')
+
+        self._nonce += 1
+        payload['nonce'] = nonce = self._nonce
+        future = asyncio.get_running_loop().create_future()
+        self._pending[nonce] = future
+        try:
+            await self._channel.send(payload)
+            return await asyncio.wait_for(future, timeout=self.timeout if timeout is utils.MISSING else timeout)
+        finally:
+            self._pending.pop(nonce, None)
+
+    async def _read(self) -> None:
+        channel = self._channel
+        try:
+            while True:
+                payload = await channel.recv()  # type: ignore
+                if payload is None:
+                    break
+                op = payload['op']
+                if op == 'reply':
+                    future = self._pending.get(payload['nonce'])
+                    if future is not None:
+                        _resolve(future, payload)
+                elif op == 'call':
+                    asyncio.ensure_future(self._dispatch(payload))
+                elif op == 'shutdown':
+                    asyncio.ensure_future(self.client.close())
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ClientException('Lost the connection to the cluster coordinator.'))
+
+    async def _dispatch(self, payload: Dict[str, Any]) -> None:
+        reply: Dict[str, Any] = {'op': 'reply', 'nonce': payload['nonce']}
+        try:
+            handler = self._handlers[payload['name']]
+        except KeyError:
+            reply['error'] = f'No cluster handler named {payload["name"]!r}.'
+        else:
+            try:
+                result = handler(*payload['args'])
+                if inspect.isawaitable(result):
+                    result = await result
+                reply['data'] = result
+            except Exception as exc:
+                _log.exception('Cluster handler %r raised an exception.', payload['name'])
+                reply['error'] = f'{exc.__class__.__name__}: {exc}'
+
+        if self._channel is not None:
+            try:
+                await self._channel.send(reply)
+            except ConnectionError:
+                pass
+
+
+def _run_worker(
+    factory: Callable[..., AutoShardedClient],
+    token: str,
+    cluster_id: int,
+    cluster_count: int,
+    shard_ids: List[int],
+    shard_count: int,
+    address: Address,
+) -> None:
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    client = factory(shard_ids=shard_ids, shard_count=shard_count)
+    if not isinstance(client, AutoShardedClient):
+        raise TypeError(f'cluster factory must return an AutoShardedClient not {client.__class__!r}')
+
+    worker = ClusterWorker(
+        client,
+        cluster_id=cluster_id,
+        cluster_count=cluster_count,
+        shard_ids=shard_ids,
+        shard_count=shard_count,
+        address=address,
+    )
+    client.cluster = worker
+
+    async def runner():
+        await worker.connect()
+        try:
+            await client.start(token)
+        finally:
+            if not client.is_closed():
+                await client.close()
+            await worker.close()
+
+    try:
+        loop.run_until_complete(runner())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        _cleanup_loop(loop)
@@ -0,0 +1,256 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, ClassVar, Optional, Union
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    HAS_ORJSON = False
+else:
+    HAS_ORJSON = True
+
+try:
+    import msgspec
+except ModuleNotFoundError:
+    HAS_MSGSPEC = False
+else:
+    HAS_MSGSPEC = True
+
+try:
+    import erlpack
+except ModuleNotFoundError:
+    HAS_ERLPACK = False
+else:
+    HAS_ERLPACK = True
+
+from . import etf
+
+__all__ = (
+    'Codec',
+    'JSONCodec',
+    'OrjsonCodec',
+    'MsgspecCodec',
+    'ETFCodec',
+)
+
+
+class Codec:
+    """The base class for payload codecs.
+
+    A codec turns the raw payloads received from the gateway and the HTTP API
+    into Python objects and back. Received data is handed to :meth:`decode`
+    as-is, so codecs that understand :class:`bytes` skip the intermediate
+    :class:`str` entirely.
+
+    A custom codec can be passed to :class:`Client` through the ``codec``
+    parameter.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    ------------
+    encoding: :class:`str`
+        The gateway encoding this codec implements, as passed in the
+        ``encoding`` query parameter of the gateway URL.
+    """
+
+    encoding: ClassVar[str] = 'json'
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        """Decodes a received payload.
+
+        Parameters
+        -----------
+        data: Union[:class:`bytes`, :class:`str`]
+            The raw payload.
+
+        Returns
+        --------
+        Any
+            The decoded object.
+        """
+        raise NotImplementedError
+
+    def encode(self, obj: Any) -> Union[bytes, str]:
+        """Encodes an object into a payload to send.
+
+        Parameters
+        -----------
+        obj: Any
+            The object to encode.
+
+        Returns
+        --------
+        Union[:class:`bytes`, :class:`str`]
+            The encoded payload. :class:`bytes` are sent as binary websocket frames.
+        """
+        raise NotImplementedError
+
+
+class JSONCodec(Codec):
+    """A :class:`Codec` using the standard library :mod:`json` module.
+
+    .. versionadded:: 2.0
+    """
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        # json.loads detects the encoding of bytes input itself
+        return json.loads(data)
+
+    def encode(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+
+
+class OrjsonCodec(JSONCodec):
+    """A :class:`Codec` using ``orjson``.
+
+    .. versionadded:: 2.0
+
+    Raises
+    -------
+    RuntimeError
+        The ``orjson`` library is not installed.
+    """
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise RuntimeError('orjson library needed in order to use OrjsonCodec')
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def encode(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+
+class MsgspecCodec(JSONCodec):
+    """A :class:`Codec` using ``msgspec``.
+
+    .. versionadded:: 2.0
+
+    Raises
+    -------
+    RuntimeError
+        The ``msgspec`` library is not installed.
+    """
+
+    def __init__(self) -> None:
+        if not HAS_MSGSPEC:
+            raise RuntimeError('msgspec library needed in order to use MsgspecCodec')
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def encode(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode('utf-8')
+
+
+class ETFCodec(Codec):
+    """A :class:`Codec` for the Erlang External Term Format gateway encoding.
+
+    ETF frames are smaller than their JSON counterparts and are cheaper to
+    decode for member chunk heavy workloads. Snowflakes, which Discord sends
+    as integers over ETF, are converted back to strings so the decoded
+    payloads are identical to the JSON ones.
+
+    This codec can only be used for the gateway, pass it as the
+    ``gateway_codec`` parameter of :class:`Client`.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    accelerated: Optional[:class:`bool`]
+        Whether to decode with the C-accelerated ``erlpack`` library instead
+        of the pure Python decoder. Defaults to using it if it is installed.
+
+    Raises
+    -------
+    RuntimeError
+        ``accelerated`` is ``True`` but ``erlpack`` is not installed.
+    """
+
+    encoding: ClassVar[str] = 'etf'
+
+    def __init__(self, *, accelerated: Optional[bool] = None) -> None:
+        if accelerated is None:
+            accelerated = HAS_ERLPACK
+        elif accelerated and not HAS_ERLPACK:
+            raise RuntimeError('erlpack library needed in order to use an accelerated ETFCodec')
+
+        self.accelerated: bool = accelerated
+
+    def decode(self, data: Union[bytes, str]) -> Any:
+        if isinstance(data, str):
+            data = data.encode('latin-1')
+        if self.accelerated:
+            return etf.normalise(erlpack.unpack(data))
+        return etf.unpack(data)
+
+    def encode(self, obj: Any) -> bytes:
+        return etf.pack(obj)
+
+
+_default: Optional[Codec] = None
+
+
+def default_codec() -> Codec:
+    """Returns the fastest JSON codec that is installed."""
+    global _default
+    if _default is None:
+        if HAS_ORJSON:
+            _default = OrjsonCodec()
+        elif HAS_MSGSPEC:
+            _default = MsgspecCodec()
+        else:
+            _default = JSONCodec()
+    return _default
@@ -0,0 +1,169 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict, Optional
+
+from . import utils
+
+__all__ = (
+    'CursorStore',
+    'MemoryCursorStore',
+    'FileCursorStore',
+)
+
+
+class CursorStore:
+    """The base class for stores that remember how far an incremental sync has read.
+
+    A cursor is the ID of the newest entry that was handed to the consumer for a
+    given key, usually a guild ID. :meth:`Guild.sync_audit_logs` and
+    :meth:`Client.sync_audit_logs` read the cursor before requesting anything and
+    only ask Discord for newer entries.
+
+    Subclasses must implement :meth:`get` and :meth:`set`. Stores that write to
+    slower storage can buffer the writes and persist them in :meth:`flush`.
+
+    .. versionadded:: 2.0
+    """
+
+    __slots__ = ()
+
+    async def get(self, key: int) -> Optional[int]:
+        """|coro|
+
+        Returns the cursor stored for ``key``, or ``None`` if there is none.
+        """
+        raise NotImplementedError
+
+    async def set(self, key: int, value: int) -> None:
+        """|coro|
+
+        Stores ``value`` as the cursor for ``key``.
+        """
+        raise NotImplementedError
+
+    async def flush(self) -> None:
+        """|coro|
+
+        Persists any buffered cursors. Called once a sync finishes or stops.
+        The default implementation does nothing.
+        """
+        pass
+
+
+class MemoryCursorStore(CursorStore):
+    """A :class:`CursorStore` that keeps the cursors in a :class:`dict`.
+
+    The cursors are lost when the process exits.
+
+    .. versionadded:: 2.0
+    """
+
+    __slots__ = ('_cursors',)
+
+    def __init__(self) -> None:
+        self._cursors: Dict[int, int] = {}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} len={len(self._cursors)}>'
+
+    async def get(self, key: int) -> Optional[int]:
+        return self._cursors.get(key)
+
+    async def set(self, key: int, value: int) -> None:
+        self._cursors[key] = value
+
+
+class FileCursorStore(MemoryCursorStore):
+    """A :class:`CursorStore` that persists the cursors to a JSON file.
+
+    The file is read when the store is created, if it exists. Cursors are kept
+    in memory as they change and the whole file is rewritten on :meth:`flush`,
+    through a temporary file so that a crash never leaves it half written.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The path of the file.
+    """
+
+    __slots__ = ('path', '_dirty')
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path: str = path
+        self._dirty: bool = False
+
+        try:
+            with open(path, 'r', encoding='utf-8') as fp:
+                data = utils._from_json(fp.read())
+        except FileNotFoundError:
+            pass
+        else:
+            self._cursors = {int(key): int(value) for key, value in data.items()}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} path={self.path!r} len={len(self._cursors)}>'
+
+    async def set(self, key: int, value: int) -> None:
+        if self._cursors.get(key) != value:
+            self._cursors[key] = value
+            self._dirty = True
+
+    async def flush(self) -> None:
+        if not self._dirty:
+            return
+
+        data = utils._to_json({str(key): value for key, value in self._cursors.items()})
+        tmp = f'{self.path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as fp:
+            fp.write(data)
+        os.replace(tmp, self.path)
+        self._dirty = False
@@ -0,0 +1,336 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any, Callable, Dict, List, Tuple
+
+__all__ = (
+    'unpack',
+    'pack',
+)
+
+# External Term Format tags
+# ref: https://www.erlang.org/doc/apps/erts/erl_ext_dist.html
+FORMAT_VERSION = 131
+NEW_FLOAT_EXT = 70
+COMPRESSED = 80
+SMALL_INTEGER_EXT = 97
+INTEGER_EXT = 98
+FLOAT_EXT = 99
+ATOM_EXT = 100
+SMALL_TUPLE_EXT = 104
+LARGE_TUPLE_EXT = 105
+NIL_EXT = 106
+STRING_EXT = 107
+LIST_EXT = 108
+BINARY_EXT = 109
+SMALL_BIG_EXT = 110
+LARGE_BIG_EXT = 111
+SMALL_ATOM_EXT = 115
+MAP_EXT = 116
+ATOM_UTF8_EXT = 118
+SMALL_ATOM_UTF8_EXT = 119
+
+_ATOMS: Dict[str, Any] = {'nil': None, 'true': True, 'false': False}
+
+_unpack_u16 = struct.Struct('>H').unpack_from
+_unpack_i32 = struct.Struct('>i').unpack_from
+_unpack_u32 = struct.Struct('>I').unpack_from
+_unpack_f64 = struct.Struct('>d').unpack_from
+
+
+def _is_snowflake_key(key: Any) -> bool:
+    # Discord sends snowflakes as integers over ETF but as strings over JSON.
+    # They're converted back to strings so the parsers see identical payloads.
+    return type(key) is str and (key == 'id' or key.endswith('_id') or key in ('permissions', 'allow', 'deny'))
+
+
+# keys whose values are lists of snowflakes but do not end with '_ids'
+_SNOWFLAKE_LIST_KEYS = frozenset(('roles', 'mention_roles', 'exempt_roles', 'exempt_channels', 'include_roles', 'applied_tags'))
+
+
+def _is_snowflake_list_key(key: Any) -> bool:
+    return type(key) is str and (key in _SNOWFLAKE_LIST_KEYS or key.endswith('_ids'))
+
+
+class _Decoder:
+    __slots__ = ('data', 'offset', 'handlers')
+
+    def __init__(self, data: bytes) -> None:
+        self.data: memoryview = memoryview(data)
+        self.offset: int = 0
+        self.handlers: Dict[int, Callable[[], Any]] = {
+            SMALL_INTEGER_EXT: self.small_integer,
+            INTEGER_EXT: self.integer,
+            NEW_FLOAT_EXT: self.new_float,
+            FLOAT_EXT: self.float,
+            ATOM_EXT: self.atom,
+            SMALL_ATOM_EXT: self.small_atom,
+            ATOM_UTF8_EXT: self.atom,
+            SMALL_ATOM_UTF8_EXT: self.small_atom,
+            SMALL_TUPLE_EXT: self.small_tuple,
+            LARGE_TUPLE_EXT: self.large_tuple,
+            NIL_EXT: self.nil,
+            STRING_EXT: self.string,
+            LIST_EXT: self.list,
+            BINARY_EXT: self.binary,
+            SMALL_BIG_EXT: self.small_big,
+            LARGE_BIG_EXT: self.large_big,
+            MAP_EXT: self.map,
+        }
+
+    def decode(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+        try:
+            handler = self.handlers[tag]
+        except KeyError:
+            raise ValueError(f'unsupported ETF tag {tag} at offset {self.offset - 1}') from None
+        return handler()
+
+    def small_integer(self) -> int:
+        value = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def integer(self) -> int:
+        value = _unpack_i32(self.data, self.offset)[0]
+        self.offset += 4
+        return value
+
+    def new_float(self) -> float:
+        value = _unpack_f64(self.data, self.offset)[0]
+        self.offset += 8
+        return value
+
+    def float(self) -> float:
+        raw = bytes(self.data[self.offset : self.offset + 31])
+        self.offset += 31
+        return float(raw.rstrip(b'\x00'))
+
+    def _atom(self, length: int) -> Any:
+        start = self.offset
+        self.offset += length
+        name = str(self.data[start : self.offset], 'utf-8')
+        return _ATOMS.get(name, name)
+
+    def atom(self) -> Any:
+        length = _unpack_u16(self.data, self.offset)[0]
+        self.offset += 2
+        return self._atom(length)
+
+    def small_atom(self) -> Any:
+        length = self.data[self.offset]
+        self.offset += 1
+        return self._atom(length)
+
+    def _tuple(self, arity: int) -> Tuple[Any, ...]:
+        decode = self.decode
+        return tuple(decode() for _ in range(arity))
+
+    def small_tuple(self) -> Tuple[Any, ...]:
+        arity = self.data[self.offset]
+        self.offset += 1
+        return self._tuple(arity)
+
+    def large_tuple(self) -> Tuple[Any, ...]:
+        arity = _unpack_u32(self.data, self.offset)[0]
+        self.offset += 4
+        return self._tuple(arity)
+
+    def nil(self) -> List[Any]:
+        return []
+
+    def string(self) -> str:
+        # Erlang "strings" are lists of bytes
+        length = _unpack_u16(self.data, self.offset)[0]
+        self.offset += 2
+        start = self.offset
+        self.offset += length
+        return str(self.data[start : self.offset], 'latin-1')
+
+    def list(self) -> List[Any]:
+        length = _unpack_u32(self.data, self.offset)[0]
+        self.offset += 4
+        decode = self.decode
+        value = [decode() for _ in range(length)]
+        tail = decode()
+        if tail != []:
+            value.append(tail)
+        return value
+
+    def binary(self) -> str:
+        length = _unpack_u32(self.data, self.offset)[0]
+        self.offset += 4
+        start = self.offset
+        self.offset += length
+        return str(self.data[start : self.offset], 'utf-8')
+
+    def _big(self, length: int) -> int:
+        sign = self.data[self.offset]
+        start = self.offset + 1
+        self.offset = start + length
+        value = int.from_bytes(self.data[start : self.offset], 'little')
+        return -value if sign else value
+
+    def small_big(self) -> int:
+        length = self.data[self.offset]
+        self.offset += 1
+        return self._big(length)
+
+    def large_big(self) -> int:
+        length = _unpack_u32(self.data, self.offset)[0]
+        self.offset += 4
+        return self._big(length)
+
+    def map(self) -> Dict[Any, Any]:
+        arity = _unpack_u32(self.data, self.offset)[0]
+        self.offset += 4
+        decode = self.decode
+        value = {}
+        for _ in range(arity):
+            key = decode()
+            item = decode()
+            if type(item) is int:
+                if _is_snowflake_key(key):
+                    item = str(item)
+            elif type(item) is list and item and _is_snowflake_list_key(key):
+                item = [str(i) if type(i) is int else i for i in item]
+            value[key] = item
+        return value
+
+
+def unpack(data: bytes) -> Any:
+    """Decodes an ETF payload into the same objects a JSON payload decodes to."""
+    if not data or data[0] != FORMAT_VERSION:
+        raise ValueError('invalid ETF payload, missing version byte')
+
+    if data[1] == COMPRESSED:
+        size = _unpack_u32(data, 2)[0]
+        data = bytes([FORMAT_VERSION]) + zlib.decompress(data[6:], bufsize=size)
+
+    decoder = _Decoder(data)
+    decoder.offset = 1
+    return decoder.decode()
+
+
+def normalise(value: Any, key: Any = None) -> Any:
+    """Converts the output of an accelerated decoder to match :func:`unpack`."""
+    tp = type(value)
+    if tp is dict:
+        result = {}
+        for k, v in value.items():
+            k = normalise(k)
+            result[k] = normalise(v, k)
+        return result
+    if tp is list:
+        if _is_snowflake_list_key(key):
+            return [str(i) if type(i) is int else normalise(i) for i in value]
+        return [normalise(i) for i in value]
+    if tp is bytes:
+        return value.decode('utf-8')
+    if tp is int and _is_snowflake_key(key):
+        return str(value)
+    return value
+
+
+def _pack(obj: Any, buf: bytearray) -> None:
+    if obj is None:
+        buf += b'\x77\x03nil'
+    elif obj is True:
+        buf += b'\x77\x04true'
+    elif obj is False:
+        buf += b'\x77\x05false'
+    elif isinstance(obj, int):
+        if 0 <= obj <= 255:
+            buf.append(SMALL_INTEGER_EXT)
+            buf.append(obj)
+        elif -(2 ** 31) <= obj < 2 ** 31:
+            buf.append(INTEGER_EXT)
+            buf += obj.to_bytes(4, 'big', signed=True)
+        else:
+            magnitude = abs(obj)
+            raw = magnitude.to_bytes((magnitude.bit_length() + 7) // 8, 'little')
+            if len(raw) > 255:
+                raise ValueError('integer is too large to be encoded')
+            buf.append(SMALL_BIG_EXT)
+            buf.append(len(raw))
+            buf.append(obj < 0)
+            buf += raw
+    elif isinstance(obj, float):
+        buf.append(NEW_FLOAT_EXT)
+        buf += struct.pack('>d', obj)
+    elif isinstance(obj, (str, bytes, bytearray)):
+        raw = obj.encode('utf-8') if isinstance(obj, str) else obj
+        buf.append(BINARY_EXT)
+        buf += len(raw).to_bytes(4, 'big')
+        buf += raw
+    elif isinstance(obj, (list, tuple)):
+        if not obj:
+            buf.append(NIL_EXT)
+            return
+        buf.append(LIST_EXT)
+        buf += len(obj).to_bytes(4, 'big')
+        for item in obj:
+            _pack(item, buf)
+        buf.append(NIL_EXT)
+    elif isinstance(obj, dict):
+        buf.append(MAP_EXT)
+        buf += len(obj).to_bytes(4, 'big')
+        for key, value in obj.items():
+            _pack(key, buf)
+            _pack(value, buf)
+    else:
+        raise TypeError(f'Object of type {obj.__class__.__name__} is not ETF serializable')
+
+
+def pack(obj: Any) -> bytes:
+    """Encodes an object into an ETF payload."""
+    buf = bytearray([FORMAT_VERSION])
+    _pack(obj, buf)
+    return bytes(buf)
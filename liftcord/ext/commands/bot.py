@@ -150,6 +150,9 @@ class BotBase(GroupMixin):
 
     # internal helpers
 
+    def _has_listeners(self, event: str) -> bool:
+        return super()._has_listeners(event) or bool(self.extra_events.get('on_' + event))  # type: ignore
+
     def dispatch(self, event_name: str, *args: Any, **kwargs: Any) -> None:
         # super() will resolve to Client
         super().dispatch(event_name, *args, **kwargs)  # type: ignore
@@ -302,18 +302,15 @@ class UserConverter(IDConverter[liftcord.User]):
         if len(arg) > 5 and arg[-5] == '#':
             discrim = arg[-4:]
             name = arg[:-5]
-            predicate = lambda u: u.name == name and u.discriminator == discrim
-            result = liftcord.utils.find(predicate, state._users.values())
+            result = liftcord.utils.get(state._users_named(name), discriminator=discrim)
             if result is not None:
                 return result
 
-        predicate = lambda u: u.name == arg
-        result = liftcord.utils.find(predicate, state._users.values())
-
-        if result is None:
+        users = state._users_named(arg)
+        if not users:
             raise UserNotFound(argument)
 
-        return result
+        return users[0]
 
 
 class PartialMessageConverter(Converter[liftcord.PartialMessage]):
@@ -430,8 +427,10 @@ class GuildChannelConverter(IDConverter[liftcord.abc.GuildChannel]):
         if match is None:
             # not a mention
             if guild:
-                iterable: Iterable[CT] = getattr(guild, attribute)
-                result: Optional[CT] = liftcord.utils.get(iterable, name=argument)
+                # go through the name index rather than every channel of the guild
+                candidates = [c for c in guild._channels_named(argument) if isinstance(c, type)]
+                if candidates:
+                    result = min(candidates, key=lambda c: (c.position, c.id))
             else:
 
                 def check(c):
@@ -701,7 +700,7 @@ class RoleConverter(IDConverter[liftcord.Role]):
         if match:
             result = guild.get_role(int(match.group(1)))
         else:
-            result = liftcord.utils.get(guild._roles.values(), name=argument)
+            result = next(iter(guild._roles_named(argument)), None)
 
         if result is None:
             raise RoleNotFound(argument)
@@ -787,7 +786,7 @@ class EmojiConverter(IDConverter[liftcord.Emoji]):
                 result = liftcord.utils.get(guild.emojis, name=argument)
 
             if result is None:
-                result = liftcord.utils.get(bot.emojis, name=argument)
+                result = next(iter(ctx._state._emojis_named(argument)), None)
         else:
             emoji_id = int(match.group(1))
 
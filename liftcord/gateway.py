@@ -46,18 +46,28 @@ DEALINGS IN THE SOFTWARE.
 import asyncio
 from collections import namedtuple, deque
 import concurrent.futures
+import functools
 import logging
 import struct
 import sys
 import time
 import threading
 import traceback
+import weakref
 import zlib
 
 import aiohttp
 
+try:
+    import zstandard
+except ModuleNotFoundError:
+    HAS_ZSTANDARD = False
+else:
+    HAS_ZSTANDARD = True
+
 from . import utils
 from .activity import BaseActivity
+from .codec import default_codec
 from .enums import SpeakingState
 from .errors import ConnectionClosed, InvalidArgument
 
@@ -71,6 +81,64 @@ __all__ = (
     'ReconnectWebSocket',
 )
 
+ZLIB_SUFFIX = b'\x00\x00\xff\xff'
+
+
+class _ZlibStreamInflater:
+    """Inflates a ``zlib-stream`` transport.
+
+    Frames that arrive whole are decompressed directly. Fragmented frames are
+    collected into a single growable buffer that is reused for the lifetime
+    of the connection rather than reallocated for every frame.
+    """
+
+    __slots__ = ('_zlib', '_buffer', '_size')
+
+    def __init__(self, initial_size=65536):
+        self._zlib = zlib.decompressobj()
+        self._buffer = bytearray(initial_size)
+        self._size = 0
+
+    def feed(self, data, /):
+        complete = data[-4:] == ZLIB_SUFFIX
+        if complete and not self._size:
+            return self._zlib.decompress(data)
+
+        end = self._size + len(data)
+        capacity = len(self._buffer)
+        if end > capacity:
+            self._buffer.extend(bytes(max(end, capacity * 2) - capacity))
+
+        self._buffer[self._size:end] = data
+        if not complete:
+            self._size = end
+            return None
+
+        self._size = 0
+        with memoryview(self._buffer) as view, view[:end] as frame:
+            return self._zlib.decompress(frame)
+
+
+class _ZstdStreamInflater:
+    """Inflates a ``zstd-stream`` transport."""
+
+    __slots__ = ('_zstd',)
+
+    def __init__(self):
+        if not HAS_ZSTANDARD:
+            raise RuntimeError('zstandard library needed in order to use zstd-stream compression')
+        self._zstd = zstandard.ZstdDecompressor().decompressobj()
+
+    def feed(self, data, /):
+        return self._zstd.decompress(data)
+
+
+def _create_inflater(compression):
+    if compression == 'zstd-stream':
+        return _ZstdStreamInflater()
+    return _ZlibStreamInflater()
+
+
 class ReconnectWebSocket(Exception):
     """Signals to safely reconnect the websocket."""
     def __init__(self, shard_id, *, resume=True):
@@ -126,6 +194,36 @@ class GatewayRatelimiter:
                 await asyncio.sleep(delta)
 
 
+class IdentifyBuckets:
+    """Spaces out IDENTIFYs according to the ``max_concurrency`` of the session
+    start limit: shards are grouped in buckets by ``shard_id % max_concurrency``
+    and each bucket allows one IDENTIFY every ``per`` seconds.
+    """
+
+    def __init__(self, max_concurrency=1, *, per=5.0):
+        self.max_concurrency = max(max_concurrency, 1)
+        self.per = per
+        self._locks = {}
+        self._next = {}
+
+    def bucket_for(self, shard_id):
+        return (shard_id or 0) % self.max_concurrency
+
+    async def acquire(self, shard_id):
+        bucket = self.bucket_for(shard_id)
+        try:
+            lock = self._locks[bucket]
+        except KeyError:
+            lock = self._locks[bucket] = asyncio.Lock()
+
+        async with lock:
+            delay = self._next.get(bucket, 0.0) - time.monotonic()
+            if delay > 0:
+                _log.debug('Shard ID %s is waiting %.2f seconds to IDENTIFY in bucket %s.', shard_id, delay, bucket)
+                await asyncio.sleep(delay)
+            self._next[bucket] = time.monotonic() + self.per
+
+
 class KeepAliveHandler(threading.Thread):
     def __init__(self, *args, **kwargs):
         ws = kwargs.pop('ws', None)
@@ -229,6 +327,259 @@ class VoiceKeepAliveHandler(KeepAliveHandler):
         self.latency = ack_time - self._last_send
         self.recent_ack_latencies.append(self.latency)
 
+class HeartbeatScheduler:
+    """A timer wheel running the heartbeats of every connection of an event loop
+    from a single task, instead of one thread per connection.
+    """
+
+    TICK = 0.25
+    SLOTS = 256
+
+    _schedulers = weakref.WeakKeyDictionary()
+
+    def __init__(self, loop):
+        self.loop = loop
+        self._slots = [{} for _ in range(self.SLOTS)]
+        self._handlers = {}
+        self._position = 0
+        self._task = None
+
+    @classmethod
+    def for_loop(cls, loop):
+        try:
+            return cls._schedulers[loop]
+        except KeyError:
+            scheduler = cls._schedulers[loop] = cls(loop)
+            return scheduler
+
+    def schedule(self, handler, delay):
+        # rounded down so that beats are never late, at most a tick early
+        ticks = max(int(delay / self.TICK), 1)
+        self.cancel(handler)
+        slot = (self._position + ticks) % self.SLOTS
+        self._slots[slot][handler] = (ticks - 1) // self.SLOTS
+        self._handlers[handler] = slot
+
+        if self._task is None or self._task.done():
+            self._task = self.loop.create_task(self._run())
+
+    def cancel(self, handler):
+        slot = self._handlers.pop(handler, None)
+        if slot is not None:
+            del self._slots[slot][handler]
+
+    def _advance(self):
+        self._position = position = (self._position + 1) % self.SLOTS
+        slot = self._slots[position]
+        due = []
+        for handler, rounds in slot.items():
+            if rounds:
+                slot[handler] = rounds - 1
+            else:
+                due.append(handler)
+
+        for handler in due:
+            del slot[handler]
+            del self._handlers[handler]
+            try:
+                handler.run()
+            except Exception:
+                _log.exception('Heartbeat handler %r raised an exception.', handler)
+
+    async def _run(self):
+        next_tick = self.loop.time()
+        while self._handlers:
+            next_tick += self.TICK
+            delay = next_tick - self.loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._advance()
+
+
+class AsyncKeepAliveHandler:
+    """Same as :class:`KeepAliveHandler` except that it beats from the event
+    loop through the :class:`HeartbeatScheduler` of that loop.
+    """
+
+    def __init__(self, *, ws, interval, shard_id=None):
+        self.ws = ws
+        self.interval = interval
+        self.shard_id = shard_id
+        self.msg = 'Keeping shard ID %s websocket alive with sequence %s.'
+        self.behind_msg = 'Can\'t keep up, shard ID %s websocket is %.1fs behind.'
+        self._scheduler = HeartbeatScheduler.for_loop(ws.loop)
+        self._stopped = False
+        self._last_ack = time.perf_counter()
+        self._last_send = time.perf_counter()
+        self._last_recv = time.perf_counter()
+        self.latency = float('inf')
+        self.heartbeat_timeout = ws._max_heartbeat_timeout
+
+    get_payload = KeepAliveHandler.get_payload
+    tick = KeepAliveHandler.tick
+    ack = KeepAliveHandler.ack
+
+    def start(self):
+        self._scheduler.schedule(self, self.interval)
+
+    def stop(self):
+        self._stopped = True
+        self._scheduler.cancel(self)
+
+    def run(self):
+        if self._last_recv + self.heartbeat_timeout < time.perf_counter():
+            _log.warning("Shard ID %s has stopped responding to the gateway. Closing and restarting.", self.shard_id)
+            self.stop()
+            self.ws.loop.create_task(self._close())
+            return
+
+        data = self.get_payload()
+        _log.debug(self.msg, self.shard_id, data['d'])
+        self.ws.loop.create_task(self._send(data))
+
+    async def _send(self, data):
+        try:
+            await self.ws.send_heartbeat(data)
+        except Exception:
+            self.stop()
+            return
+
+        self._last_send = time.perf_counter()
+        if not self._stopped:
+            self._scheduler.schedule(self, self.interval)
+
+    async def _close(self):
+        try:
+            await self.ws.close(4000)
+        except Exception:
+            _log.exception('An error occurred while stopping the gateway. Ignoring.')
+
+
+class AsyncVoiceKeepAliveHandler(AsyncKeepAliveHandler):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.recent_ack_latencies = deque(maxlen=20)
+        self.msg = 'Keeping shard ID %s voice websocket alive with timestamp %s.'
+        self.behind_msg = 'High socket latency, shard ID %s heartbeat is %.1fs behind'
+
+    get_payload = VoiceKeepAliveHandler.get_payload
+    ack = VoiceKeepAliveHandler.ack
+
+
+class _WatchedLoop:
+    __slots__ = ('loop', 'thread_id', 'threshold', 'sink', 'sent', 'warn_at', 'lag')
+
+    def __init__(self, loop, thread_id, threshold, sink):
+        self.loop = loop
+        self.thread_id = thread_id
+        self.threshold = threshold
+        self.sink = sink
+        self.sent = None
+        self.warn_at = threshold
+        self.lag = 0.0
+
+    def answer(self):
+        self.lag = time.monotonic() - self.sent
+        self.sent = None
+        self.warn_at = self.threshold
+        if self.sink is not None:
+            self.sink.observe('loop.lag', self.lag)
+
+
+class LoopWatchdog(threading.Thread):
+    """A single thread for the whole process that warns, with the traceback of
+    the blocked thread, when an event loop does not run a callback for longer
+    than a threshold.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        super().__init__(name='liftcord-loop-watchdog', daemon=True)
+        self._loops = {}
+        self._lock = threading.Lock()
+        self._stop_ev = threading.Event()
+
+    @classmethod
+    def watch(cls, loop, threshold, *, thread_id=None, sink=None):
+        """Starts watching ``loop``, which runs in the current thread unless
+        ``thread_id`` is given. The loop lag and stalls are reported to the
+        :class:`MetricsSink` ``sink`` if given.
+        """
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = cls()
+                cls._instance.start()
+            watchdog = cls._instance
+
+        with watchdog._lock:
+            watchdog._loops[loop] = _WatchedLoop(loop, thread_id or threading.get_ident(), threshold, sink)
+        return watchdog
+
+    @classmethod
+    def unwatch(cls, loop):
+        watchdog = cls._instance
+        if watchdog is not None:
+            with watchdog._lock:
+                watchdog._loops.pop(loop, None)
+
+    def stop(self):
+        self._stop_ev.set()
+
+    def run(self):
+        while True:
+            with self._lock:
+                watched = list(self._loops.values())
+            interval = min((entry.threshold for entry in watched), default=1.0) / 2
+            if self._stop_ev.wait(max(interval, 0.01)):
+                return
+
+            for entry in watched:
+                self.check(entry)
+
+    def check(self, entry):
+        if entry.loop.is_closed():
+            self.unwatch(entry.loop)
+            return
+
+        now = time.monotonic()
+        if entry.sent is None:
+            entry.sent = now
+            try:
+                entry.loop.call_soon_threadsafe(entry.answer)
+            except RuntimeError:
+                # closed in the meantime
+                self.unwatch(entry.loop)
+            return
+
+        blocked = now - entry.sent
+        if blocked < entry.warn_at:
+            return
+
+        entry.warn_at += entry.threshold
+        msg = 'Event loop blocked for more than %.1f seconds.'
+        try:
+            frame = sys._current_frames()[entry.thread_id]
+        except KeyError:
+            stack = None
+            _log.warning(msg, blocked)
+        else:
+            stack = ''.join(traceback.format_stack(frame))
+            _log.warning(f'{msg}\nLoop thread traceback (most recent call last):\n%s', blocked, stack)
+
+        if entry.sink is not None:
+            try:
+                task = asyncio.current_task(entry.loop)
+            except RuntimeError:
+                task = None
+
+            try:
+                entry.sink.stall(blocked, stack, None if task is None else task.get_name())
+            except Exception:
+                _log.exception('Metrics sink %r failed to record a stall.', entry.sink)
+
+
 class DiscordClientWebSocketResponse(aiohttp.ClientWebSocketResponse):
     async def close(self, *, code: int = 4000, message: bytes = b'') -> bool:
         return await super().close(code=code, message=message)
@@ -293,19 +644,21 @@ class DiscordWebSocket:
 
         # an empty dispatcher to prevent crashes
         self._dispatch = lambda *args: None
-        # generic event listeners
-        self._dispatch_listeners = []
+        # generic event listeners, indexed by event then future
+        self._dispatch_listeners = {}
         # the keep alive
         self._keep_alive = None
+        self._keep_alive_cls = KeepAliveHandler
+        self._metrics = None
         self.thread_id = threading.get_ident()
 
         # ws related stuff
         self.session_id = None
         self.sequence = None
-        self._zlib = zlib.decompressobj()
-        self._buffer = bytearray()
+        self._inflater = _ZlibStreamInflater()
         self._close_code = None
         self._rate_limiter = GatewayRatelimiter()
+        self._codec = default_codec()
 
     @property
     def open(self):
@@ -315,6 +668,8 @@ class DiscordWebSocket:
         return self._rate_limiter.is_ratelimited()
 
     def debug_log_receive(self, data, /):
+        if type(data) is bytes and self._codec.encoding == 'json':
+            data = data.decode('utf-8')
         self._dispatch('socket_raw_receive', data)
 
     def log_receive(self, _, /):
@@ -344,6 +699,11 @@ class DiscordWebSocket:
         ws.session_id = session
         ws.sequence = sequence
         ws._max_heartbeat_timeout = client._connection.heartbeat_timeout
+        ws._metrics = client._connection.metrics
+        if client._connection.heartbeat_mode == 'asyncio':
+            ws._keep_alive_cls = AsyncKeepAliveHandler
+        ws._codec = client.http.gateway_codec
+        ws._inflater = _create_inflater(client.http.gateway_compression)
 
         if client._enable_debug_events:
             ws.send = ws.debug_send
@@ -385,9 +745,17 @@ class DiscordWebSocket:
 
         future = self.loop.create_future()
         entry = EventListener(event=event, predicate=predicate, result=result, future=future)
-        self._dispatch_listeners.append(entry)
+        self._dispatch_listeners.setdefault(event, {})[future] = entry
+        future.add_done_callback(functools.partial(self._remove_dispatch_listener, event))
         return future
 
+    def _remove_dispatch_listener(self, event, future):
+        listeners = self._dispatch_listeners.get(event)
+        if listeners is not None:
+            listeners.pop(future, None)
+            if not listeners:
+                del self._dispatch_listeners[event]
+
     async def identify(self):
         """Sends the IDENTIFY packet."""
         payload = {
@@ -442,19 +810,22 @@ class DiscordWebSocket:
 
     async def received_message(self, msg, /):
         if type(msg) is bytes:
-            self._buffer.extend(msg)
-
-            if len(msg) < 4 or msg[-4:] != b'\x00\x00\xff\xff':
+            msg = self._inflater.feed(msg)
+            if msg is None:
                 return
-            msg = self._zlib.decompress(self._buffer)
-            msg = msg.decode('utf-8')
-            self._buffer = bytearray()
 
         self.log_receive(msg)
-        msg = utils._from_json(msg)
+        metrics = self._metrics
+        if metrics is not None:
+            start = time.perf_counter()
 
-        _log.debug('For Shard ID %s: WebSocket Event: %s', self.shard_id, msg)
+        # the codec takes the decompressed bytes directly
+        msg = self._codec.decode(msg)
         event = msg.get('t')
+        if metrics is not None:
+            metrics.observe('gateway.decode', time.perf_counter() - start, {'event': event or str(msg.get('op'))})
+
+        _log.debug('For Shard ID %s: WebSocket Event: %s', self.shard_id, msg)
         if event:
             self._dispatch('socket_event_type', event)
 
@@ -489,7 +860,7 @@ class DiscordWebSocket:
 
             if op == self.HELLO:
                 interval = data['heartbeat_interval'] / 1000.0
-                self._keep_alive = KeepAliveHandler(ws=self, interval=interval, shard_id=self.shard_id)
+                self._keep_alive = self._keep_alive_cls(ws=self, interval=interval, shard_id=self.shard_id)
                 # send a heartbeat immediately
                 await self.send_as_json(self._keep_alive.get_payload())
                 self._keep_alive.start()
@@ -530,32 +901,32 @@ class DiscordWebSocket:
         except KeyError:
             _log.debug('Unknown event %s.', event)
         else:
-            func(data)
-
-        # remove the dispatched listeners
-        removed = []
-        for index, entry in enumerate(self._dispatch_listeners):
-            if entry.event != event:
-                continue
+            if self._connection._is_event_needed(event):
+                if metrics is None:
+                    func(data)
+                else:
+                    start = time.perf_counter()
+                    func(data)
+                    metrics.observe('gateway.parse', time.perf_counter() - start, {'event': event})
+
+        # resolve the dispatched listeners, they remove themselves once done
+        listeners = self._dispatch_listeners.get(event)
+        if not listeners:
+            return
 
+        for entry in tuple(listeners.values()):
             future = entry.future
-            if future.cancelled():
-                removed.append(index)
+            if future.done():
                 continue
 
             try:
                 valid = entry.predicate(data)
             except Exception as exc:
                 future.set_exception(exc)
-                removed.append(index)
             else:
                 if valid:
                     ret = data if entry.result is None else entry.result(data)
                     future.set_result(ret)
-                    removed.append(index)
-
-        for index in reversed(removed):
-            del self._dispatch_listeners[index]
 
     @property
     def latency(self):
@@ -608,15 +979,21 @@ class DiscordWebSocket:
     async def debug_send(self, data, /):
         await self._rate_limiter.block()
         self._dispatch('socket_raw_send', data)
-        await self.socket.send_str(data)
+        await self._send_frame(data)
 
     async def send(self, data, /):
         await self._rate_limiter.block()
-        await self.socket.send_str(data)
+        await self._send_frame(data)
+
+    async def _send_frame(self, data, /):
+        if type(data) is bytes:
+            await self.socket.send_bytes(data)
+        else:
+            await self.socket.send_str(data)
 
     async def send_as_json(self, data):
         try:
-            await self.send(utils._to_json(data))
+            await self.send(self._codec.encode(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -624,7 +1001,7 @@ class DiscordWebSocket:
     async def send_heartbeat(self, data):
         # This bypasses the rate limit handling code since it has a higher priority
         try:
-            await self.socket.send_str(utils._to_json(data))
+            await self._send_frame(self._codec.encode(data))
         except RuntimeError as exc:
             if not self._can_handle_close():
                 raise ConnectionClosed(self.socket, shard_id=self.shard_id) from exc
@@ -650,7 +1027,7 @@ class DiscordWebSocket:
             }
         }
 
-        sent = utils._to_json(payload)
+        sent = self._codec.encode(payload)
         _log.debug('Sending "%s" to change status', sent)
         await self.send(sent)
 
@@ -746,6 +1123,7 @@ class DiscordVoiceWebSocket:
         self.ws = socket
         self.loop = loop
         self._keep_alive = None
+        self._keep_alive_cls = VoiceKeepAliveHandler
         self._close_code = None
         self.secret_key = None
         if hook:
@@ -796,6 +1174,8 @@ class DiscordVoiceWebSocket:
         ws._connection = client
         ws._max_heartbeat_timeout = 60.0
         ws.thread_id = threading.get_ident()
+        if client._state.heartbeat_mode == 'asyncio':
+            ws._keep_alive_cls = AsyncVoiceKeepAliveHandler
 
         if resume:
             await ws.resume()
@@ -856,7 +1236,7 @@ class DiscordVoiceWebSocket:
             await self.load_secret_key(data)
         elif op == self.HELLO:
             interval = data['heartbeat_interval'] / 1000.0
-            self._keep_alive = VoiceKeepAliveHandler(ws=self, interval=min(interval, 5.0))
+            self._keep_alive = self._keep_alive_cls(ws=self, interval=min(interval, 5.0))
             self._keep_alive.start()
 
         await self._hook(self, msg)
@@ -45,13 +45,18 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import array
 import copy
 import unicodedata
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
     Dict,
+    Iterable,
+    Iterator,
     List,
+    MutableMapping,
     NamedTuple,
     Sequence,
     Set,
@@ -65,10 +70,10 @@ from typing import (
 
 from . import utils, abc
 from .role import Role
-from .member import Member, VoiceState
+from .member import ColumnarMemberCache, Member, VoiceState
 from .emoji import Emoji
 from .errors import InvalidData
-from .permissions import PermissionOverwrite
+from .permissions import PermissionMatrix, PermissionOverwrite, Permissions
 from .colour import Colour
 from .errors import InvalidArgument, ClientException
 from .channel import *
@@ -86,6 +91,8 @@ from .enums import (
     NSFWLevel,
 )
 from .mixins import Hashable
+from .object import Object
+from .cache import NameIndex
 from .user import User
 from .invite import Invite
 from .iterators import AuditLogIterator, MemberIterator
@@ -107,6 +114,8 @@ MISSING = utils.MISSING
 
 if TYPE_CHECKING:
     from .abc import Snowflake, SnowflakeTime
+    from .audit_logs import AuditLogEntry
+    from .cursors import CursorStore
     from .types.guild import Ban as BanPayload, Guild as GuildPayload, MFALevel, GuildFeature
     from .types.threads import (
         Thread as ThreadPayload,
@@ -126,6 +135,10 @@ if TYPE_CHECKING:
     ByCategoryItem = Tuple[Optional[CategoryChannel], List[GuildChannel]]
 
 
+def _member_names(member: Member) -> Tuple[str, Optional[str]]:
+    return member.name, member.nick
+
+
 class BanEntry(NamedTuple):
     reason: Optional[str]
     user: User
@@ -295,6 +308,10 @@ class Guild(Hashable):
         '_public_updates_channel_id',
         '_stage_instances',
         '_threads',
+        '_member_index',
+        '_role_index',
+        '_channel_index',
+        '_channel_permissions',
     )
 
     _PREMIUM_GUILD_LIMITS: ClassVar[Dict[Optional[int], _GuildLimit]] = {
@@ -306,24 +323,101 @@ class Guild(Hashable):
     }
 
     def __init__(self, *, data: GuildPayload, state: ConnectionState):
-        self._channels: Dict[int, GuildChannel] = {}
-        self._members: Dict[int, Member] = {}
+        # the name indexes are only built the first time a lookup needs them
+        self._member_index: Optional[NameIndex[Member]] = None
+        self._channel_index: Optional[NameIndex[GuildChannel]] = None
+        self._channels: MutableMapping[int, GuildChannel] = state._create_cache('channels', on_evict=self._unindex_channel)
+        self._members: MutableMapping[int, Member] = state._create_cache('members', on_evict=self._unindex_member)
         self._voice_states: Dict[int, VoiceState] = {}
-        self._threads: Dict[int, Thread] = {}
+        self._threads: MutableMapping[int, Thread] = state._create_cache('threads')
         self._state: ConnectionState = state
         self._from_data(data)
 
+    def _get_member_index(self) -> NameIndex[Member]:
+        index = self._member_index
+        if index is None:
+            members = self._members
+            # columnar stores create members on access, index their IDs only
+            resolve = members.get if isinstance(members, ColumnarMemberCache) else None
+            self._member_index = index = NameIndex(_member_names, resolve=resolve)
+            for member in self._members.values():
+                index.add(member.id, member)
+        return index
+
+    def _get_role_index(self) -> NameIndex[Role]:
+        index = self._role_index
+        if index is None:
+            self._role_index = index = NameIndex()
+            for role in self._roles.values():
+                index.add(role.id, role)
+        return index
+
+    def _get_channel_index(self) -> NameIndex[GuildChannel]:
+        index = self._channel_index
+        if index is None:
+            self._channel_index = index = NameIndex()
+            for channel in self._channels.values():
+                index.add(channel.id, channel)
+        return index
+
+    def _index_member(self, member: Member, /) -> None:
+        if self._member_index is not None:
+            self._member_index.add(member.id, member)
+
+    def _unindex_member(self, member_id: int, *args: Any) -> None:
+        if self._member_index is not None:
+            self._member_index.remove(member_id)
+
+    def _index_role(self, role: Role, /) -> None:
+        if self._role_index is not None:
+            self._role_index.add(role.id, role)
+
+    def _index_channel(self, channel: GuildChannel, /) -> None:
+        if self._channel_index is not None:
+            self._channel_index.add(channel.id, channel)
+
+    def _unindex_channel(self, channel_id: int, *args: Any) -> None:
+        if self._channel_index is not None:
+            self._channel_index.remove(channel_id)
+
+    def _roles_named(self, name: str, /) -> List[Role]:
+        return [role for role in self._get_role_index().get(name) if role.name == name]
+
+    def _channels_named(self, name: str, /) -> List[GuildChannel]:
+        return [channel for channel in self._get_channel_index().get(name) if channel.name == name]
+
+    def _get_channel_permissions(self, channel: GuildChannel, /) -> abc._ChannelPermissions:
+        compiled = self._channel_permissions.get(channel.id)
+        # channels get a new list of overwrites on every update
+        if compiled is None or compiled.overwrites is not channel._overwrites:
+            compiled = abc._ChannelPermissions(channel._overwrites, self.id)
+            self._channel_permissions[channel.id] = compiled
+        return compiled
+
+    def _invalidate_role_permissions(self, role_id: int, /) -> None:
+        if role_id == self.id:
+            # every member has the @everyone role
+            for compiled in self._channel_permissions.values():
+                compiled.resolved.clear()
+        else:
+            for compiled in self._channel_permissions.values():
+                compiled.invalidate_role(role_id)
+
     def _add_channel(self, channel: GuildChannel, /) -> None:
         self._channels[channel.id] = channel
+        self._index_channel(channel)
 
     def _remove_channel(self, channel: Snowflake, /) -> None:
         self._channels.pop(channel.id, None)
+        self._channel_permissions.pop(channel.id, None)
+        self._unindex_channel(channel.id)
 
     def _voice_state_for(self, user_id: int, /) -> Optional[VoiceState]:
         return self._voice_states.get(user_id)
 
     def _add_member(self, member: Member, /) -> None:
         self._members[member.id] = member
+        self._index_member(member)
 
     def _store_thread(self, payload: ThreadPayload, /) -> Thread:
         thread = Thread(guild=self, state=self._state, data=payload)
@@ -332,6 +426,7 @@ class Guild(Hashable):
 
     def _remove_member(self, member: Snowflake, /) -> None:
         self._members.pop(member.id, None)
+        self._unindex_member(member.id)
 
     def _add_thread(self, thread: Thread, /) -> None:
         self._threads[thread.id] = thread
@@ -404,10 +499,15 @@ class Guild(Hashable):
             r.position += not r.is_default()
 
         self._roles[role.id] = role
+        self._index_role(role)
+        self._invalidate_role_permissions(role.id)
 
     def _remove_role(self, role_id: int, /) -> Role:
         # this raises KeyError if it fails..
         role = self._roles.pop(role_id)
+        if self._role_index is not None:
+            self._role_index.remove(role_id)
+        self._invalidate_role_permissions(role_id)
 
         # since it didn't, we can change the positions now
         # basically the same as above except we only decrement
@@ -437,6 +537,8 @@ class Guild(Hashable):
         self.unavailable: bool = guild.get('unavailable', False)
         self.id: int = int(guild['id'])
         self._roles: Dict[int, Role] = {}
+        self._role_index: Optional[NameIndex[Role]] = None
+        self._channel_permissions: Dict[int, abc._ChannelPermissions] = {}
         state = self._state  # speed up attribute access
         for r in guild.get('roles', []):
             role = Role(guild=self, data=r, state=state)
@@ -981,24 +1083,147 @@ class Guild(Hashable):
             then ``None`` is returned.
         """
 
-        result = None
-        members = self.members
+        index = self._get_member_index()
         if len(name) > 5 and name[-5] == '#':
             # The 5 length is checking to see if #0000 is in the string,
             # as a#0000 has a length of 6, the minimum for a potential
             # discriminator lookup.
             potential_discriminator = name[-4:]
+            username = name[:-5]
 
             # do the actual lookup and return if found
             # if it isn't found then we'll do a full name lookup below.
-            result = utils.get(members, name=name[:-5], discriminator=potential_discriminator)
-            if result is not None:
-                return result
+            for member in index.get(username):
+                if member.name == username and member.discriminator == potential_discriminator:
+                    return member
+
+        for member in index.get(name):
+            if member.nick == name or member.name == name:
+                return member
+
+        return None
 
-        def pred(m: Member) -> bool:
-            return m.nick == name or m.name == name
+    def search_members(self, prefix: str, /, *, limit: Optional[int] = None) -> List[Member]:
+        """Returns the cached members whose name or nickname starts with the prefix provided.
 
-        return utils.find(pred, members)
+        The search is case-insensitive and uses an index kept up to date with
+        the member cache, so it does not scan every member of the guild.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        prefix: :class:`str`
+            The prefix to search for.
+        limit: Optional[:class:`int`]
+            The maximum number of members to return. Defaults to ``None``,
+            which returns every matching member.
+
+        Returns
+        --------
+        List[:class:`Member`]
+            The matching members, sorted by the name or nickname that matched.
+        """
+        return self._get_member_index().search(prefix, limit=limit)
+
+    def bulk_permissions_for(
+        self,
+        members: Iterable[Member],
+        channels: Optional[Iterable[GuildChannel]] = None,
+    ) -> Dict[int, Dict[int, Permissions]]:
+        """Resolves the permissions of many members in many channels at once.
+
+        This gives the same results as calling :meth:`abc.GuildChannel.permissions_for`
+        for every member in every channel, except that members with the same roles
+        are only resolved once per channel, unless they have a permission overwrite
+        of their own there.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        members: Iterable[:class:`Member`]
+            The members to resolve the permissions of.
+        channels: Optional[Iterable[:class:`abc.GuildChannel`]]
+            The channels to resolve the permissions in. Defaults to ``None``,
+            which uses every channel of the guild.
+
+        Returns
+        --------
+        Dict[:class:`int`, Dict[:class:`int`, :class:`Permissions`]]
+            A mapping of channel ID to a mapping of member ID to the permissions
+            that member has in the channel.
+        """
+        members = list(members)
+        return {
+            channel.id: {member.id: Permissions._from_value(value) for member, value in zip(members, values)}
+            for channel, values in self._resolve_permissions(members, channels)
+        }
+
+    def permission_matrix(
+        self,
+        members: Optional[Iterable[Member]] = None,
+        channels: Optional[Iterable[GuildChannel]] = None,
+    ) -> PermissionMatrix:
+        """Resolves the permissions of members in channels into a :class:`PermissionMatrix`.
+
+        This resolves the permissions the same way :meth:`bulk_permissions_for` does,
+        but keeps them packed in a single array that can answer questions such as
+        which members can send messages in a given channel.
+
+        .. versionadded:: 2.0
+
+        Parameters
+        -----------
+        members: Optional[Iterable[:class:`Member`]]
+            The members to resolve the permissions of. Defaults to ``None``,
+            which uses every cached member of the guild.
+        channels: Optional[Iterable[:class:`abc.GuildChannel`]]
+            The channels to resolve the permissions in. Defaults to ``None``,
+            which uses every channel of the guild.
+
+        Returns
+        --------
+        :class:`PermissionMatrix`
+            The resolved permissions.
+        """
+        members = self.members if members is None else list(members)
+        channels = self.channels if channels is None else list(channels)
+        values = array.array('Q')
+        for _, row in self._resolve_permissions(members, channels):
+            values.extend(row)
+        return PermissionMatrix(members, channels, values)
+
+    def _resolve_permissions(
+        self, members: List[Member], channels: Optional[Iterable[GuildChannel]]
+    ) -> Iterator[Tuple[GuildChannel, List[int]]]:
+        # members with the same roles get the same permissions unless they own
+        # the guild or have an overwrite of their own, so each role set is only
+        # resolved once per channel
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for index, member in enumerate(members):
+            groups.setdefault(tuple(member._roles), []).append(index)
+
+        if channels is None:
+            channels = self._channels.values()
+
+        owner_id = self.owner_id
+        for channel in channels:
+            overwritten = self._get_channel_permissions(channel).members
+            row = [0] * len(members)
+            for indexes in groups.values():
+                shared: Optional[int] = None
+                for index in indexes:
+                    member = members[index]
+                    if member.id == owner_id or member.id in overwritten:
+                        row[index] = channel.permissions_for(member).value
+                        continue
+
+                    if shared is None:
+                        shared = channel.permissions_for(member).value
+                    row[index] = shared
+
+            yield channel, row
 
     def _create_channel(
         self,
@@ -1142,7 +1367,7 @@ class Guild(Hashable):
         channel = TextChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_voice_channel(
@@ -1229,7 +1454,7 @@ class Guild(Hashable):
         channel = VoiceChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_stage_channel(
@@ -1295,7 +1520,7 @@ class Guild(Hashable):
         channel = StageChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     async def create_category(
@@ -1339,7 +1564,7 @@ class Guild(Hashable):
         channel = CategoryChannel(state=self._state, guild=self, data=data)
 
         # temporarily add to the cache
-        self._channels[channel.id] = channel
+        self._add_channel(channel)
         return channel
 
     create_category_channel = create_category
@@ -2598,6 +2823,7 @@ class Guild(Hashable):
             role = Role(guild=self, data=d, state=self._state)
             roles.append(role)
             self._roles[role.id] = role
+            self._index_role(role)
 
         return roles
 
@@ -2806,6 +3032,60 @@ class Guild(Hashable):
             self, before=before, after=after, limit=limit, oldest_first=oldest_first, user_id=user_id, action_type=action
         )
 
+    async def sync_audit_logs(self, store: CursorStore, *, limit: Optional[int] = None) -> AsyncIterator[List[AuditLogEntry]]:
+        """Retrieves the audit log entries created since the last sync, page by page.
+
+        The ID of the newest entry that was yielded is kept in ``store``, keyed by the
+        guild's ID, and the next sync only requests entries after it. The first sync
+        of a guild retrieves every entry Discord still has.
+
+        The cursor is advanced once the consumer asks for the next page, so a page
+        that was not fully processed when the sync stopped is retrieved again.
+
+        You must have the :attr:`~Permissions.view_audit_log` permission to use this.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ----------
+
+        Polling a guild: ::
+
+            store = nextcord.FileCursorStore('audit_cursors.json')
+            async for entries in guild.sync_audit_logs(store):
+                for entry in entries:
+                    print(f'{entry.user} did {entry.action} to {entry.target}')
+
+        Parameters
+        -----------
+        store: :class:`CursorStore`
+            The store the cursor is read from and written to.
+        limit: Optional[:class:`int`]
+            The maximum number of entries to retrieve. Defaults to ``None``,
+            which retrieves every new entry.
+
+        Raises
+        -------
+        Forbidden
+            You are not allowed to fetch audit logs
+        HTTPException
+            An error occurred while fetching the audit logs.
+
+        Yields
+        --------
+        List[:class:`AuditLogEntry`]
+            A page of new entries, in oldest->newest order.
+        """
+        cursor = await store.get(self.id)
+        after = Object(id=cursor) if cursor is not None else None
+        iterator = AuditLogIterator(self, limit=limit, after=after, oldest_first=True)
+        try:
+            async for entries in iterator.pages():
+                yield entries
+                await store.set(self.id, entries[-1].id)
+        finally:
+            await store.flush()
+
     async def widget(self) -> Widget:
         """|coro|
 
@@ -2890,6 +3170,56 @@ class Guild(Hashable):
         if not self._state.is_guild_evicted(self):
             return await self._state.chunk_guild(self, cache=cache)
 
+    async def member_chunks(self, *, cache: bool = True, timeout: Optional[float] = 60.0) -> AsyncIterator[List[Member]]:
+        """Requests all members that belong to this guild like :meth:`chunk` does,
+        but yields them chunk by chunk as they are received.
+
+        If the guild is already being chunked, the members received so far are
+        yielded first and the request in progress is followed instead of
+        starting a new one. In order to use this, :meth:`Intents.members` must
+        be enabled.
+
+        .. versionadded:: 2.0
+
+        Examples
+        ---------
+
+        Usage ::
+
+            async for members in guild.member_chunks():
+                for member in members:
+                    print(member.name)
+
+        Parameters
+        -----------
+        cache: :class:`bool`
+            Whether to cache the members as well.
+        timeout: Optional[:class:`float`]
+            The number of seconds to wait for each chunk. ``None`` waits forever.
+
+        Raises
+        -------
+        ClientException
+            The members intent is not enabled.
+        asyncio.TimeoutError
+            A chunk was not received in time.
+
+        Yields
+        -------
+        List[:class:`Member`]
+            The members of each chunk.
+        """
+
+        if not self._state._intents.members:
+            raise ClientException('Intents.members must be enabled to use this.')
+
+        if self._state.is_guild_evicted(self):
+            return
+
+        request = await self._state._request_guild_chunks(self, cache=cache)
+        async for members in request.stream(timeout=timeout):
+            yield members
+
     async def query_members(
         self,
         query: Optional[str] = None,
@@ -46,6 +46,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import json
 import logging
 import sys
@@ -53,6 +54,7 @@ from typing import (
     Any,
     ClassVar,
     Coroutine,
+    Deque,
     Dict,
     Iterable,
     List,
@@ -60,17 +62,16 @@ from typing import (
     Sequence,
     TYPE_CHECKING,
     Tuple,
-    Type,
     TypeVar,
     Union,
 )
 from urllib.parse import quote as _uriquote
-import weakref
 
 import aiohttp
 
 from .errors import HTTPException, Forbidden, NotFound, LoginFailure, DiscordServerError, GatewayNotFound, InvalidArgument
 from .gateway import DiscordClientWebSocketResponse
+from .codec import Codec, default_codec
 from . import __version__, utils
 from .utils import MISSING
 
@@ -90,6 +91,7 @@ if TYPE_CHECKING:
         components,
         emoji,
         embed,
+        gateway,
         guild,
         integration,
         interactions,
@@ -108,24 +110,21 @@ if TYPE_CHECKING:
     )
     from .types.snowflake import Snowflake, SnowflakeList
 
-    from types import TracebackType
-
     T = TypeVar('T')
-    BE = TypeVar('BE', bound=BaseException)
-    MU = TypeVar('MU', bound='MaybeUnlock')
     Response = Coroutine[Any, Any, T]
 
 
-async def json_or_text(response: aiohttp.ClientResponse) -> Union[Dict[str, Any], str]:
-    text = await response.text(encoding='utf-8')
+async def json_or_text(response: aiohttp.ClientResponse, *, codec: Optional[Codec] = None) -> Union[Dict[str, Any], str]:
+    # the raw body is passed to the codec as-is to skip decoding it to a str first
+    data = await response.read()
     try:
         if response.headers['content-type'] == 'application/json':
-            return utils._from_json(text)
+            return (codec or default_codec()).decode(data)
     except KeyError:
         # Thanks Cloudflare
         pass
 
-    return text
+    return data.decode('utf-8')
 
 
 class Route:
@@ -150,26 +149,113 @@ class Route:
         # the bucket is just method + path w/ major parameters
         return f'{self.channel_id}:{self.guild_id}:{self.path}'
 
+    @property
+    def key(self) -> str:
+        # the key Discord's bucket hashes are learned under
+        return f'{self.method} {self.path}'
 
-class MaybeUnlock:
-    def __init__(self, lock: asyncio.Lock) -> None:
-        self.lock: asyncio.Lock = lock
-        self._unlock: bool = True
+    @property
+    def major_parameters(self) -> str:
+        return '+'.join(
+            str(parameter)
+            for parameter in (self.channel_id, self.guild_id, self.webhook_id, self.webhook_token)
+            if parameter is not None
+        )
 
-    def __enter__(self: MU) -> MU:
-        return self
 
-    def defer(self) -> None:
-        self._unlock = False
+class Ratelimit:
+    """Tracks the requests remaining in a single rate limit bucket.
+
+    Unlike a lock, concurrent requests are let through as long as the bucket
+    has requests remaining. The bucket's limit is learned from the
+    ``X-RateLimit-*`` headers, or is fixed to ``limit`` requests ``per``
+    seconds when ``per`` is given.
+    """
+
+    __slots__ = ('loop', 'limit', 'remaining', 'per', 'reset_at', 'outgoing', '_waiters')
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, limit: int = 1, per: Optional[float] = None) -> None:
+        self.loop: asyncio.AbstractEventLoop = loop
+        # until the first response comes in only a single request is let through
+        self.limit: int = limit
+        self.remaining: int = limit
+        self.per: Optional[float] = per
+        self.reset_at: float = 0.0
+        self.outgoing: int = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def is_inactive(self) -> bool:
+        return not self.outgoing and not self._waiters and self.reset_at <= self.loop.time()
+
+    def _wake(self) -> None:
+        remaining = self.remaining
+        if remaining <= 0 and self.reset_at:
+            # let the waiters go back to sleep until the reset instead
+            remaining = len(self._waiters)
+
+        while self._waiters and remaining > 0:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                remaining -= 1
+
+    async def acquire(self) -> None:
+        loop = self.loop
+        while True:
+            now = loop.time()
+            if self.reset_at and now >= self.reset_at:
+                self.remaining = self.limit
+                self.reset_at = 0.0
+
+            if self.remaining > 0:
+                self.remaining -= 1
+                self.outgoing += 1
+                if self.per is not None and not self.reset_at:
+                    self.reset_at = now + self.per
+                return
+
+            future = loop.create_future()
+            self._waiters.append(future)
+            delay = self.reset_at - now if self.reset_at else None
+            try:
+                await asyncio.wait_for(future, delay)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # this waiter was handed a wake it will not use, pass it on
+                    self._wake()
+                raise
+
+    def release(self) -> None:
+        self.outgoing -= 1
+        if not self.reset_at:
+            # no rate limit information came back, hand the request back
+            self.remaining = min(self.remaining + 1, self.limit)
+        self._wake()
+
+    def update(self, response: aiohttp.ClientResponse, *, use_clock: bool = False) -> None:
+        headers = response.headers
+        try:
+            limit = int(headers['X-Ratelimit-Limit'])
+            remaining = int(headers['X-Ratelimit-Remaining'])
+        except (KeyError, ValueError):
+            return
+
+        now = self.loop.time()
+        if self.reset_at > now:
+            # requests can only be used up within the same window
+            self.remaining = min(self.remaining, remaining)
+        else:
+            # the other requests in flight are not counted by this response yet
+            self.remaining = max(remaining - self.outgoing + 1, 0)
 
-    def __exit__(
-        self,
-        exc_type: Optional[Type[BE]],
-        exc: Optional[BE],
-        traceback: Optional[TracebackType],
-    ) -> None:
-        if self._unlock:
-            self.lock.release()
+        self.limit = limit
+        self.reset_at = now + utils._parse_ratelimit_header(response, use_clock=use_clock)
+
+    def exhaust(self, retry_after: float) -> None:
+        self.remaining = 0
+        self.reset_at = self.loop.time() + retry_after
 
 
 # For some reason, the Discord voice websocket expects this header to be
@@ -180,6 +266,9 @@ aiohttp.hdrs.WEBSOCKET = 'websocket'  # type: ignore
 class HTTPClient:
     """Represents an HTTP client sending HTTP requests to the Discord API."""
 
+    MAX_GLOBAL_REQUESTS: ClassVar[int] = 50
+    MAX_BUCKETS: ClassVar[int] = 1024
+
     def __init__(
         self,
         connector: Optional[aiohttp.BaseConnector] = None,
@@ -188,13 +277,21 @@ class HTTPClient:
         proxy_auth: Optional[aiohttp.BasicAuth] = None,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         unsync_clock: bool = True,
+        codec: Optional[Codec] = None,
+        gateway_codec: Optional[Codec] = None,
+        gateway_compression: str = 'zlib-stream',
     ) -> None:
         self.loop: asyncio.AbstractEventLoop = asyncio.get_event_loop() if loop is None else loop
+        self.codec: Codec = codec or default_codec()
+        self.gateway_codec: Codec = gateway_codec or self.codec
+        self.gateway_compression: str = gateway_compression
         self.connector = connector
         self.__session: aiohttp.ClientSession = MISSING  # filled in static_login
-        self._locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._buckets: Dict[str, Ratelimit] = {}
+        self._bucket_hashes: Dict[str, str] = {}
         self._global_over: asyncio.Event = asyncio.Event()
         self._global_over.set()
+        self._global_ratelimit: Ratelimit = Ratelimit(self.loop, limit=self.MAX_GLOBAL_REQUESTS, per=1.0)
         self.token: Optional[str] = None
         self.bot_token: bool = False
         self.proxy: Optional[str] = proxy
@@ -225,6 +322,18 @@ class HTTPClient:
 
         return await self.__session.ws_connect(url, **kwargs)
 
+    def _get_ratelimit(self, bucket: str) -> Ratelimit:
+        try:
+            return self._buckets[bucket]
+        except KeyError:
+            pass
+
+        if len(self._buckets) >= self.MAX_BUCKETS:
+            self._buckets = {key: value for key, value in self._buckets.items() if not value.is_inactive()}
+
+        self._buckets[bucket] = ratelimit = Ratelimit(self.loop)
+        return ratelimit
+
     async def request(
         self,
         route: Route,
@@ -233,15 +342,17 @@ class HTTPClient:
         form: Optional[Iterable[Dict[str, Any]]] = None,
         **kwargs: Any,
     ) -> Any:
-        bucket = route.bucket
         method = route.method
         url = route.url
 
-        lock = self._locks.get(bucket)
-        if lock is None:
-            lock = asyncio.Lock()
-            if bucket is not None:
-                self._locks[bucket] = lock
+        # routes are keyed by the bucket hash Discord gave them, once known
+        route_key = route.key
+        major_parameters = route.major_parameters
+        bucket_hash = self._bucket_hashes.get(route_key, route_key)
+        bucket = f'{bucket_hash}:{major_parameters}'
+        ratelimit = self._get_ratelimit(bucket)
+        # webhook token routes are not subject to the global rate limit
+        is_global_limited = route.webhook_token is None
 
         # header creation
         headers: Dict[str, str] = {
@@ -253,7 +364,7 @@ class HTTPClient:
         # some checking if it's a JSON request
         if 'json' in kwargs:
             headers['Content-Type'] = 'application/json'
-            kwargs['data'] = utils._to_json(kwargs.pop('json'))
+            kwargs['data'] = self.codec.encode(kwargs.pop('json'))
 
         try:
             reason = kwargs.pop('reason')
@@ -271,40 +382,53 @@ class HTTPClient:
         if self.proxy_auth is not None:
             kwargs['proxy_auth'] = self.proxy_auth
 
-        if not self._global_over.is_set():
-            # wait until the global lock is complete
-            await self._global_over.wait()
-
         response: Optional[aiohttp.ClientResponse] = None
         data: Optional[Union[Dict[str, Any], str]] = None
-        await lock.acquire()
-        with MaybeUnlock(lock) as maybe_lock:
-            for tries in range(5):
-                if files:
-                    for f in files:
-                        f.reset(seek=tries)
-
-                if form:
-                    form_data = aiohttp.FormData()
-                    for params in form:
-                        form_data.add_field(**params)
-                    kwargs['data'] = form_data
-
+        for tries in range(5):
+            if files:
+                for f in files:
+                    f.reset(seek=tries)
+
+            if form:
+                form_data = aiohttp.FormData()
+                for params in form:
+                    form_data.add_field(**params)
+                kwargs['data'] = form_data
+
+            if not self._global_over.is_set():
+                # wait until the global lock is complete
+                await self._global_over.wait()
+
+            if is_global_limited:
+                await self._global_ratelimit.acquire()
+                self._global_ratelimit.release()
+
+            acquired = ratelimit
+            await acquired.acquire()
+            try:
                 try:
                     async with self.__session.request(method, url, **kwargs) as response:
                         _log.debug('%s %s with %s has returned %s', method, url, kwargs.get('data'), response.status)
 
                         # even errors have text involved in them so this is safe to call
-                        data = await json_or_text(response)
+                        data = await json_or_text(response, codec=self.codec)
+
+                        # learn the real bucket of this route
+                        new_hash = response.headers.get('X-Ratelimit-Bucket')
+                        if new_hash is not None and new_hash != bucket_hash:
+                            self._bucket_hashes[route_key] = bucket_hash = new_hash
+                            bucket = f'{new_hash}:{major_parameters}'
+                            ratelimit = self._buckets.setdefault(bucket, ratelimit)
 
                         # check if we have rate limit header information
-                        remaining = response.headers.get('X-Ratelimit-Remaining')
-                        if remaining == '0' and response.status != 429:
-                            # we've depleted our current bucket
-                            delta = utils._parse_ratelimit_header(response, use_clock=self.use_clock)
-                            _log.debug('A rate limit bucket has been exhausted (bucket: %s, retry: %s).', bucket, delta)
-                            maybe_lock.defer()
-                            self.loop.call_later(delta, lock.release)
+                        if response.status != 429:
+                            ratelimit.update(response, use_clock=self.use_clock)
+                            if ratelimit.remaining == 0:
+                                _log.debug(
+                                    'A rate limit bucket has been exhausted (bucket: %s, retry: %.2f).',
+                                    bucket,
+                                    ratelimit.reset_at - self.loop.time(),
+                                )
 
                         # the request was successful so just return the text/json
                         if 300 > response.status >= 200:
@@ -319,25 +443,24 @@ class HTTPClient:
 
                             fmt = 'We are being rate limited. Retrying in %.2f seconds. Handled under the bucket "%s"'
 
-                            # sleep a bit
                             retry_after: float = data['retry_after']
                             _log.warning(fmt, retry_after, bucket)
 
                             # check if it's a global rate limit
                             is_global = data.get('global', False)
-                            if is_global:
-                                _log.warning('Global rate limit has been hit. Retrying in %.2f seconds.', retry_after)
-                                self._global_over.clear()
+                            if not is_global:
+                                # the retry waits in acquire until the bucket resets
+                                ratelimit.exhaust(retry_after)
+                                continue
 
+                            _log.warning('Global rate limit has been hit. Retrying in %.2f seconds.', retry_after)
+                            self._global_over.clear()
                             await asyncio.sleep(retry_after)
-                            _log.debug('Done sleeping for the rate limit. Retrying...')
 
                             # release the global lock now that the
                             # global rate limit has passed
-                            if is_global:
-                                self._global_over.set()
-                                _log.debug('Global rate limit is now over.')
-
+                            self._global_over.set()
+                            _log.debug('Global rate limit is now over.')
                             continue
 
                         # we've received a 500, 502, or 504, unconditional retry
@@ -362,15 +485,17 @@ class HTTPClient:
                         await asyncio.sleep(1 + tries * 2)
                         continue
                     raise
+            finally:
+                acquired.release()
 
-            if response is not None:
-                # We've run out of retries, raise.
-                if response.status >= 500:
-                    raise DiscordServerError(response, data)
+        if response is not None:
+            # We've run out of retries, raise.
+            if response.status >= 500:
+                raise DiscordServerError(response, data)
 
-                raise HTTPException(response, data)
+            raise HTTPException(response, data)
 
-            raise RuntimeError('Unreachable code in HTTP handling')
+        raise RuntimeError('Unreachable code in HTTP handling')
 
     async def get_from_cdn(self, url: str) -> bytes:
         async with self.__session.get(url) as resp:
@@ -1918,28 +2043,40 @@ class HTTPClient:
     def application_info(self) -> Response[appinfo.AppInfo]:
         return self.request(Route('GET', '/oauth2/applications/@me'))
 
-    async def get_gateway(self, *, encoding: str = 'json', zlib: bool = True) -> str:
+    async def get_gateway(self, *, encoding: Optional[str] = None, zlib: bool = True) -> str:
+        encoding = encoding or self.gateway_codec.encoding
         try:
             data = await self.request(Route('GET', '/gateway'))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
         if zlib:
-            value = '{0}?encoding={1}&v=9&compress=zlib-stream'
+            value = '{0}?encoding={1}&v=9&compress={2}'
         else:
             value = '{0}?encoding={1}&v=9'
-        return value.format(data['url'], encoding)
+        return value.format(data['url'], encoding, self.gateway_compression)
 
-    async def get_bot_gateway(self, *, encoding: str = 'json', zlib: bool = True) -> Tuple[int, str]:
+    async def get_bot_gateway(
+        self, *, encoding: Optional[str] = None, zlib: bool = True
+    ) -> Tuple[int, str, gateway.SessionStartLimit]:
+        encoding = encoding or self.gateway_codec.encoding
         try:
             data = await self.request(Route('GET', '/gateway/bot'))
         except HTTPException as exc:
             raise GatewayNotFound() from exc
 
         if zlib:
-            value = '{0}?encoding={1}&v=9&compress=zlib-stream'
+            value = '{0}?encoding={1}&v=9&compress={2}'
         else:
             value = '{0}?encoding={1}&v=9'
-        return data['shards'], value.format(data['url'], encoding)
+
+        limit: gateway.SessionStartLimit = {
+            'total': 1000,
+            'remaining': 1000,
+            'reset_after': 0,
+            'max_concurrency': 1,
+        }
+        limit.update(data.get('session_start_limit') or {})
+        return data['shards'], value.format(data['url'], encoding, self.gateway_compression), limit
 
     def get_user(self, user_id: Snowflake) -> Response[user.User]:
         return self.request(Route('GET', '/users/{user_id}', user_id=user_id))
@@ -46,8 +46,9 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import datetime
-from typing import Awaitable, TYPE_CHECKING, TypeVar, Optional, Any, Callable, Union, List, AsyncIterator
+from typing import Awaitable, TYPE_CHECKING, TypeVar, Optional, Any, Callable, Union, List, AsyncIterator, Deque
 
 from .errors import NoMoreItems
 from .utils import snowflake_time, time_snowflake, maybe_coroutine
@@ -57,6 +58,7 @@ from .audit_logs import AuditLogEntry
 __all__ = (
     'ReactionIterator',
     'HistoryIterator',
+    'PartitionedHistoryIterator',
     'AuditLogIterator',
     'GuildIterator',
     'MemberIterator',
@@ -137,8 +139,15 @@ class _AsyncIterator(AsyncIterator[T]):
     def filter(self, predicate: _Func[T, bool]) -> _FilteredAsyncIterator[T]:
         return _FilteredAsyncIterator(self, predicate)
 
+    async def next_page(self) -> List[T]:
+        # iterators without pages of their own return one element at a time
+        return [await self.next()]
+
+    def pages(self) -> _PagedAsyncIterator[T]:
+        return _PagedAsyncIterator(self)
+
     async def flatten(self) -> List[T]:
-        return [element async for element in self]
+        return [element async for page in self.pages() for element in page]
 
     async def __anext__(self) -> T:
         try:
@@ -151,24 +160,58 @@ def _identity(x):
     return x
 
 
+async def _next_item(buffer: Deque[T], fill: Callable[[], Awaitable[Any]]) -> T:
+    if not buffer:
+        await fill()
+
+    try:
+        return buffer.popleft()
+    except IndexError:
+        raise NoMoreItems()
+
+
+async def _next_page(buffer: Deque[T], fill: Callable[[], Awaitable[Any]]) -> List[T]:
+    if not buffer:
+        await fill()
+        if not buffer:
+            raise NoMoreItems()
+
+    page = list(buffer)
+    buffer.clear()
+    return page
+
+
+async def _apply(func: _Func[T, OT], page: List[T]) -> List[OT]:
+    # each element is passed and awaited in turn, as if iterated one by one
+    return [await maybe_coroutine(func, element) for element in page]
+
+
+class _PagedAsyncIterator(_AsyncIterator[List[T]]):
+    def __init__(self, iterator):
+        self.iterator = iterator
+
+    async def next(self) -> List[T]:
+        return await self.iterator.next_page()
+
+
 class _ChunkedAsyncIterator(_AsyncIterator[List[T]]):
     def __init__(self, iterator, max_size):
         self.iterator = iterator
         self.max_size = max_size
+        self._buffer: List[T] = []
 
     async def next(self) -> List[T]:
-        ret: List[T] = []
-        n = 0
-        while n < self.max_size:
+        buffer = self._buffer
+        while len(buffer) < self.max_size:
             try:
-                item = await self.iterator.next()
+                buffer.extend(await self.iterator.next_page())
             except NoMoreItems:
-                if ret:
-                    return ret
+                if buffer:
+                    break
                 raise
-            else:
-                ret.append(item)
-                n += 1
+
+        ret = buffer[:self.max_size]
+        del buffer[:self.max_size]
         return ret
 
 
@@ -176,12 +219,20 @@ class _MappedAsyncIterator(_AsyncIterator[T]):
     def __init__(self, iterator, func):
         self.iterator = iterator
         self.func = func
+        # elements of the underlying iterator, mapped as they are returned
+        self._buffer: Deque[Any] = deque()
 
     async def next(self) -> T:
         # this raises NoMoreItems and will propagate appropriately
-        item = await self.iterator.next()
+        item = await _next_item(self._buffer, self._fill)
         return await maybe_coroutine(self.func, item)
 
+    async def next_page(self) -> List[T]:
+        return await _apply(self.func, await _next_page(self._buffer, self._fill))
+
+    async def _fill(self) -> None:
+        self._buffer.extend(await self.iterator.next_page())
+
 
 class _FilteredAsyncIterator(_AsyncIterator[T]):
     def __init__(self, iterator, predicate):
@@ -191,17 +242,29 @@ class _FilteredAsyncIterator(_AsyncIterator[T]):
             predicate = _identity
 
         self.predicate = predicate
+        # elements of the underlying iterator, filtered as they are returned
+        self._buffer: Deque[T] = deque()
 
     async def next(self) -> T:
-        getter = self.iterator.next
         pred = self.predicate
         while True:
             # propagate NoMoreItems similar to _MappedAsyncIterator
-            item = await getter()
+            item = await _next_item(self._buffer, self._fill)
             ret = await maybe_coroutine(pred, item)
             if ret:
                 return item
 
+    async def next_page(self) -> List[T]:
+        pred = self.predicate
+        while True:
+            page = await _next_page(self._buffer, self._fill)
+            page = [element for element in page if await maybe_coroutine(pred, element)]
+            if page:
+                return page
+
+    async def _fill(self) -> None:
+        self._buffer.extend(await self.iterator.next_page())
+
 
 class ReactionIterator(_AsyncIterator[Union['User', 'Member']]):
     def __init__(self, message, emoji, limit=100, after=None):
@@ -214,16 +277,13 @@ class ReactionIterator(_AsyncIterator[Union['User', 'Member']]):
         self.emoji = emoji
         self.guild = message.guild
         self.channel_id = message.channel.id
-        self.users = asyncio.Queue()
+        self.users = deque()
 
     async def next(self) -> Union[User, Member]:
-        if self.users.empty():
-            await self.fill_users()
+        return await _next_item(self.users, self.fill_users)
 
-        try:
-            return self.users.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[Union[User, Member]]:
+        return await _next_page(self.users, self.fill_users)
 
     async def fill_users(self):
         # this is a hack because >circular imports<
@@ -242,16 +302,12 @@ class ReactionIterator(_AsyncIterator[Union['User', 'Member']]):
                 self.after = Object(id=int(data[-1]['id']))
 
             if self.guild is None or isinstance(self.guild, Object):
-                for element in reversed(data):
-                    await self.users.put(User(state=self.state, data=element))
+                self.users.extend(User(state=self.state, data=element) for element in reversed(data))
             else:
+                get_member = self.guild.get_member
                 for element in reversed(data):
-                    member_id = int(element['id'])
-                    member = self.guild.get_member(member_id)
-                    if member is not None:
-                        await self.users.put(member)
-                    else:
-                        await self.users.put(User(state=self.state, data=element))
+                    member = get_member(int(element['id']))
+                    self.users.append(member if member is not None else User(state=self.state, data=element))
 
 
 class HistoryIterator(_AsyncIterator['Message']):
@@ -286,9 +342,17 @@ class HistoryIterator(_AsyncIterator['Message']):
     oldest_first: Optional[:class:`bool`]
         If set to ``True``, return messages in oldest->newest order. Defaults to
         ``True`` if `after` is specified, otherwise ``False``.
+    raw: :class:`bool`
+        If set to ``True``, return the message payloads as received from Discord
+        instead of :class:`Message` objects.
+    prefetch: :class:`bool`
+        If set to ``True``, request the next page of messages as soon as a page
+        is received, so that it is fetched while the current page is consumed.
     """
 
-    def __init__(self, messageable, limit, before=None, after=None, around=None, oldest_first=None):
+    def __init__(
+        self, messageable, limit, before=None, after=None, around=None, oldest_first=None, *, raw=False, prefetch=False
+    ):
 
         if isinstance(before, datetime.datetime):
             before = Object(id=time_snowflake(before, high=False))
@@ -310,9 +374,13 @@ class HistoryIterator(_AsyncIterator['Message']):
 
         self._filter = None  # message dict -> bool
 
+        self.raw = raw
+        self.prefetch = prefetch
+        self._prefetched = None
+
         self.state = self.messageable._state
         self.logs_from = self.state.http.logs_from
-        self.messages = asyncio.Queue()
+        self.messages = deque()
 
         if self.around:
             if self.limit is None:
@@ -340,13 +408,10 @@ class HistoryIterator(_AsyncIterator['Message']):
                     self._filter = lambda m: int(m['id']) > self.after.id
 
     async def next(self) -> Message:
-        if self.messages.empty():
-            await self.fill_messages()
+        return await _next_item(self.messages, self.fill_messages)
 
-        try:
-            return self.messages.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[Message]:
+        return await _next_page(self.messages, self.fill_messages)
 
     def _get_retrieve(self):
         l = self.limit
@@ -358,24 +423,53 @@ class HistoryIterator(_AsyncIterator['Message']):
         return r > 0
 
     async def fill_messages(self):
+        self.messages.extend(await self._next_page())
+
+    async def _fetch_page(self):
         if not hasattr(self, 'channel'):
             # do the required set up
             channel = await self.messageable._get_channel()
             self.channel = channel
 
-        if self._get_retrieve():
-            data = await self._retrieve_messages(self.retrieve)
-            if len(data) < 100:
-                self.limit = 0  # terminate the infinite loop
+        if not self._get_retrieve():
+            return None
 
-            if self.reverse:
-                data = reversed(data)
-            if self._filter:
-                data = filter(self._filter, data)
+        data = await self._retrieve_messages(self.retrieve)
+        if len(data) < 100:
+            self.limit = 0  # terminate the infinite loop
+        return data
 
-            channel = self.channel
-            for element in data:
-                await self.messages.put(self.state.create_message(channel=channel, data=element))
+    async def _next_page(self):
+        if self._prefetched is not None:
+            data = await self._prefetched
+            self._prefetched = None
+        else:
+            data = await self._fetch_page()
+
+        if not data:
+            return []
+
+        if self.reverse:
+            data = list(reversed(data))
+        if self._filter:
+            kept = [element for element in data if self._filter(element)]
+            if len(kept) < len(data):
+                # this page crossed the bound, every later page would be filtered out
+                self.limit = 0
+            data = kept
+
+        if self.prefetch and self._get_retrieve():
+            # the next request only depends on the page we just received
+            self._prefetched = task = asyncio.ensure_future(self._fetch_page())
+            # retrieved when awaited, silenced if the iterator is abandoned
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        if self.raw:
+            return data
+
+        channel = self.channel
+        create_message = self.state.create_message
+        return [create_message(channel=channel, data=element) for element in data]
 
     async def _retrieve_messages(self, retrieve) -> List[Message]:
         """Retrieve messages and update next parameters."""
@@ -411,6 +505,142 @@ class HistoryIterator(_AsyncIterator['Message']):
         return []
 
 
+class PartitionedHistoryIterator(_AsyncIterator['Message']):
+    """Iterator for receiving a channel's message history between two points in
+    time, split in time partitions that are fetched concurrently.
+
+    Snowflakes are ordered by time, so the ``(after, before)`` range is split in
+    ``partitions`` disjoint ID windows of equal duration. Each window is read by a
+    prefetching :class:`HistoryIterator` in its own task, and the windows are
+    returned one after another so that messages stay in order. Windows that are
+    not being returned yet buffer up to two pages in memory, and :meth:`close`
+    stops the fetching if the iterator is abandoned.
+
+    Parameters
+    -----------
+    messageable: :class:`abc.Messageable`
+        Messageable class to retrieve message history from.
+    partitions: :class:`int`
+        The number of windows fetched concurrently.
+    before: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+        Message before which all messages must be. Defaults to now.
+    after: Optional[Union[:class:`abc.Snowflake`, :class:`datetime.datetime`]]
+        Message after which all messages must be. Defaults to the creation of the channel.
+    oldest_first: :class:`bool`
+        If set to ``True``, the default, return messages in oldest->newest order.
+    raw: :class:`bool`
+        If set to ``True``, return the message payloads instead of :class:`Message` objects.
+    """
+
+    BUFFERED_PAGES = 2
+
+    def __init__(self, messageable, partitions, before=None, after=None, oldest_first=True, raw=False):
+        if partitions < 1:
+            raise ValueError('history partitions must be at least 1')
+
+        if isinstance(before, datetime.datetime):
+            before = Object(id=time_snowflake(before, high=False))
+        if isinstance(after, datetime.datetime):
+            after = Object(id=time_snowflake(after, high=True))
+
+        self.messageable = messageable
+        self.partitions = partitions
+        self.before = before
+        self.after = after
+        self.oldest_first = oldest_first
+        self.raw = raw
+
+        self.messages = deque()
+        self._pages = None  # one queue of pages per window, in output order
+        self._current = 0
+        self._tasks = []
+
+    async def next(self) -> Message:
+        return await _next_item(self.messages, self._fill)
+
+    async def next_page(self) -> List[Message]:
+        return await _next_page(self.messages, self._fill)
+
+    def _windows(self, channel):
+        # messages in a channel are never older than the channel itself
+        after = self.after.id if self.after else max(channel.id - 1, 0)
+        before = self.before.id if self.before else time_snowflake(datetime.datetime.now(datetime.timezone.utc), high=True) + 1
+        if before - after <= 1:
+            return []
+
+        count = min(self.partitions, before - after - 1)
+        bounds = [after + (before - after) * index // count for index in range(count)] + [before - 1]
+        # window i holds the IDs in (bounds[i], bounds[i + 1]]
+        return [(bounds[index], bounds[index + 1] + 1) for index in range(count)]
+
+    @staticmethod
+    async def _read(iterator, pages):
+        # kept off the instance so that an abandoned iterator can be collected
+        try:
+            while True:
+                page = await iterator._next_page()
+                if not page:
+                    break
+                await pages.put(page)
+        except Exception as exc:
+            await pages.put(exc)
+        finally:
+            if iterator._prefetched is not None:
+                iterator._prefetched.cancel()
+        # not reached when cancelled, as nothing is left to drain the queue then
+        await pages.put(None)
+
+    async def _fill(self):
+        if self._pages is None:
+            channel = await self.messageable._get_channel()
+            windows = self._windows(channel)
+            if not self.oldest_first:
+                windows.reverse()
+
+            self._pages = []
+            for lower, upper in windows:
+                iterator = HistoryIterator(
+                    self.messageable,
+                    None,
+                    before=Object(id=upper),
+                    after=Object(id=lower),
+                    oldest_first=self.oldest_first,
+                    raw=self.raw,
+                    prefetch=True,
+                )
+                # windows that are not being returned yet only read a few pages ahead
+                pages = asyncio.Queue(maxsize=self.BUFFERED_PAGES)
+                self._pages.append(pages)
+                self._tasks.append(asyncio.ensure_future(self._read(iterator, pages)))
+
+        while self._current < len(self._pages):
+            page = await self._pages[self._current].get()
+            if page is None:
+                self._current += 1
+            elif isinstance(page, Exception):
+                self.close()
+                raise page
+            else:
+                self.messages.extend(page)
+                return
+
+        self.close()
+
+    def close(self) -> None:
+        """Stops fetching the windows in the background. This is done
+        automatically once the iterator is exhausted.
+        """
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        if self._pages is not None:
+            self._current = len(self._pages)
+
+    def __del__(self) -> None:
+        if hasattr(self, '_tasks'):
+            self.close()
+
+
 class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
     def __init__(self, guild, limit=None, before=None, after=None, oldest_first=None, user_id=None, action_type=None):
         if isinstance(before, datetime.datetime):
@@ -430,13 +660,13 @@ class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
         self.before = before
         self.user_id = user_id
         self.action_type = action_type
-        self.after = OLDEST_OBJECT
+        self.after = after or OLDEST_OBJECT
         self._users = {}
         self._state = guild._state
 
         self._filter = None  # entry dict -> bool
 
-        self.entries = asyncio.Queue()
+        self.entries = deque()
 
         if self.reverse:
             self._strategy = self._after_strategy
@@ -473,13 +703,10 @@ class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
         return data.get('users', []), entries
 
     async def next(self) -> AuditLogEntry:
-        if self.entries.empty():
-            await self._fill()
+        return await _next_item(self.entries, self._fill)
 
-        try:
-            return self.entries.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[AuditLogEntry]:
+        return await _next_page(self.entries, self._fill)
 
     def _get_retrieve(self):
         l = self.limit
@@ -512,7 +739,7 @@ class AuditLogIterator(_AsyncIterator['AuditLogEntry']):
                 if element['action_type'] is None:
                     continue
 
-                await self.entries.put(AuditLogEntry(data=element, users=self._users, guild=self.guild))
+                self.entries.append(AuditLogEntry(data=element, users=self._users, guild=self.guild))
 
 
 class GuildIterator(_AsyncIterator['Guild']):
@@ -560,7 +787,7 @@ class GuildIterator(_AsyncIterator['Guild']):
 
         self.state = self.bot._connection
         self.get_guilds = self.bot.http.get_guilds
-        self.guilds = asyncio.Queue()
+        self.guilds = deque()
 
         if self.before and self.after:
             self._retrieve_guilds = self._retrieve_guilds_before_strategy  # type: ignore
@@ -571,13 +798,10 @@ class GuildIterator(_AsyncIterator['Guild']):
             self._retrieve_guilds = self._retrieve_guilds_before_strategy  # type: ignore
 
     async def next(self) -> Guild:
-        if self.guilds.empty():
-            await self.fill_guilds()
+        return await _next_item(self.guilds, self.fill_guilds)
 
-        try:
-            return self.guilds.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[Guild]:
+        return await _next_page(self.guilds, self.fill_guilds)
 
     def _get_retrieve(self):
         l = self.limit
@@ -602,8 +826,7 @@ class GuildIterator(_AsyncIterator['Guild']):
             if self._filter:
                 data = filter(self._filter, data)
 
-            for element in data:
-                await self.guilds.put(self.create_guild(element))
+            self.guilds.extend(self.create_guild(element) for element in data)
 
     async def _retrieve_guilds(self, retrieve) -> List[Guild]:
         """Retrieve guilds and update next parameters."""
@@ -642,16 +865,13 @@ class MemberIterator(_AsyncIterator['Member']):
 
         self.state = self.guild._state
         self.get_members = self.state.http.get_members
-        self.members = asyncio.Queue()
+        self.members = deque()
 
     async def next(self) -> Member:
-        if self.members.empty():
-            await self.fill_members()
+        return await _next_item(self.members, self.fill_members)
 
-        try:
-            return self.members.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[Member]:
+        return await _next_page(self.members, self.fill_members)
 
     def _get_retrieve(self):
         l = self.limit
@@ -675,8 +895,7 @@ class MemberIterator(_AsyncIterator['Member']):
 
             self.after = Object(id=int(data[-1]['user']['id']))
 
-            for element in reversed(data):
-                await self.members.put(self.create_member(element))
+            self.members.extend(self.create_member(element) for element in reversed(data))
 
     def create_member(self, data):
         from .member import Member
@@ -728,17 +947,14 @@ class ArchivedThreadIterator(_AsyncIterator['Thread']):
         else:
             self.endpoint = self.http.get_public_archived_threads
 
-        self.queue: asyncio.Queue[Thread] = asyncio.Queue()
+        self.queue: Deque[Thread] = deque()
         self.has_more: bool = True
 
     async def next(self) -> Thread:
-        if self.queue.empty():
-            await self.fill_queue()
+        return await _next_item(self.queue, self.fill_queue)
 
-        try:
-            return self.queue.get_nowait()
-        except asyncio.QueueEmpty:
-            raise NoMoreItems()
+    async def next_page(self) -> List[Thread]:
+        return await _next_page(self.queue, self.fill_queue)
 
     @staticmethod
     def get_archive_timestamp(data: ThreadPayload) -> str:
@@ -757,8 +973,7 @@ class ArchivedThreadIterator(_AsyncIterator['Thread']):
 
         # This stuff is obviously WIP because 'members' is always empty
         threads: List[ThreadPayload] = data.get('threads', [])
-        for d in reversed(threads):
-            self.queue.put_nowait(self.create_thread(d))
+        self.queue.extend(self.create_thread(d) for d in reversed(threads))
 
         self.has_more = data.get('has_more', False)
         if self.limit is not None:
@@ -45,17 +45,19 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
+import array
 import datetime
 import inspect
 import itertools
 import sys
 from operator import attrgetter
-from typing import Any, Dict, List, Literal, Optional, TYPE_CHECKING, Tuple, Type, TypeVar, Union, overload
+from typing import Any, Dict, Iterator, List, Literal, Optional, TYPE_CHECKING, Tuple, Type, TypeVar, Union, overload
 
 from . import abc
 
 from . import utils
 from .asset import Asset
+from .cache import CacheBackend, CacheLimits
 from .utils import MISSING
 from .user import BaseUser, User, _UserTag
 from .activity import create_activity, ActivityTypes
@@ -71,6 +73,7 @@ __all__ = (
 
 if TYPE_CHECKING:
     from .asset import Asset
+    from .cache import EvictCallback
     from .channel import DMChannel, VoiceChannel, StageChannel
     from .flags import PublicUserFlags
     from .guild import Guild
@@ -927,3 +930,220 @@ class Member(abc.Messageable, _UserTag):
             The role or ``None`` if not found in the member's roles.
         """
         return self.guild.get_role(role_id) if self._roles.has(role_id) else None
+
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_NO_TIME = float('nan')
+_PENDING = 1
+
+
+def _to_timestamp(dt: Optional[datetime.datetime]) -> float:
+    if dt is None:
+        return _NO_TIME
+    return (dt - _EPOCH).total_seconds()
+
+
+def _from_timestamp(ts: float) -> Optional[datetime.datetime]:
+    if ts != ts:  # NaN
+        return None
+    return _EPOCH + datetime.timedelta(seconds=ts)
+
+
+class _MemberView(Member):
+    # A Member materialised from a row of a ColumnarMemberCache. Attribute
+    # writes (e.g. from _update or _presence_update) are written back to the
+    # columns, as long as the member is still stored.
+
+    __slots__ = ('_store',)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        store = getattr(self, '_store', None)
+        if store is not None:
+            store._write(self, name)
+
+
+class ColumnarMemberCache(CacheBackend):
+    """Internal member store that keeps every field in a column.
+
+    IDs, timestamps, flags and role sets are packed in :class:`array.array`
+    columns, role sets and nicknames are interned, and rarely set fields
+    (guild avatars, activities and non-offline statuses) are kept in sparse
+    dictionaries. Members are materialised from their row when they are
+    looked up, and attribute changes made to a looked up member are written
+    back to the store.
+    """
+
+    __slots__ = (
+        '_rows',
+        '_ids',
+        '_users',
+        '_joined_at',
+        '_premium_since',
+        '_role_sets',
+        '_role_set_ids',
+        '_role_set_index',
+        '_flags',
+        '_nicks',
+        '_avatars',
+        '_activities',
+        '_client_status',
+        '_guild',
+        '_state',
+    )
+
+    def __init__(self, name: str, limits: Optional[CacheLimits] = None, *, on_evict: Optional[EvictCallback] = None) -> None:
+        super().__init__(name, limits, on_evict=on_evict)
+        self._rows: Dict[int, int] = {}
+        self._ids: array.array[int] = array.array('Q')
+        self._users: List[User] = []
+        self._joined_at: array.array[float] = array.array('d')
+        self._premium_since: array.array[float] = array.array('d')
+        self._role_sets: array.array[int] = array.array('I')
+        self._role_set_ids: List[Tuple[int, ...]] = [()]
+        self._role_set_index: Dict[Tuple[int, ...], int] = {(): 0}
+        self._flags: array.array[int] = array.array('B')
+        self._nicks: List[Optional[str]] = []
+        self._avatars: Dict[int, str] = {}
+        self._activities: Dict[int, Tuple[ActivityTypes, ...]] = {}
+        self._client_status: Dict[int, Dict[Optional[str], str]] = {}
+        self._guild: Optional[Guild] = None
+        self._state: Optional[ConnectionState] = None
+
+    def _columns(self) -> Tuple[Any, ...]:
+        return (
+            self._ids,
+            self._users,
+            self._joined_at,
+            self._premium_since,
+            self._role_sets,
+            self._flags,
+            self._nicks,
+        )
+
+    def _intern_roles(self, roles: utils.SnowflakeList) -> int:
+        key = tuple(roles)
+        try:
+            return self._role_set_index[key]
+        except KeyError:
+            index = self._role_set_index[key] = len(self._role_set_ids)
+            self._role_set_ids.append(key)
+            return index
+
+    def _write(self, member: Member, name: str) -> None:
+        member_id = member._user.id
+        row = self._rows.get(member_id)
+        if row is None:
+            # the member was removed, it's a detached copy now
+            return
+
+        if name == 'nick':
+            nick = member.nick
+            self._nicks[row] = sys.intern(nick) if nick else nick
+        elif name == '_roles':
+            self._role_sets[row] = self._intern_roles(member._roles)
+        elif name == 'joined_at':
+            self._joined_at[row] = _to_timestamp(member.joined_at)
+        elif name == 'premium_since':
+            self._premium_since[row] = _to_timestamp(member.premium_since)
+        elif name == 'pending':
+            flags = self._flags[row]
+            self._flags[row] = flags | _PENDING if member.pending else flags & ~_PENDING
+        elif name == '_user':
+            self._users[row] = member._user
+        elif name == '_avatar':
+            if member._avatar is None:
+                self._avatars.pop(member_id, None)
+            else:
+                self._avatars[member_id] = member._avatar
+        elif name == 'activities':
+            if member.activities:
+                self._activities[member_id] = member.activities
+            else:
+                self._activities.pop(member_id, None)
+        elif name in ('_client_status', 'status'):
+            client_status = member._client_status
+            if client_status == {None: 'offline'}:
+                self._client_status.pop(member_id, None)
+            else:
+                self._client_status[member_id] = client_status
+
+    def __getitem__(self, key: int) -> Member:
+        row = self._rows[key]
+        member = _MemberView.__new__(_MemberView)
+        set_slot = object.__setattr__
+        set_slot(member, '_state', self._state)
+        set_slot(member, 'guild', self._guild)
+        set_slot(member, '_user', self._users[row])
+        set_slot(member, 'joined_at', _from_timestamp(self._joined_at[row]))
+        set_slot(member, 'premium_since', _from_timestamp(self._premium_since[row]))
+        set_slot(member, '_roles', utils.SnowflakeList(self._role_set_ids[self._role_sets[row]], is_sorted=True))
+        set_slot(member, 'nick', self._nicks[row])
+        set_slot(member, 'pending', bool(self._flags[row] & _PENDING))
+        set_slot(member, '_avatar', self._avatars.get(key))
+        set_slot(member, 'activities', self._activities.get(key, ()))
+        client_status = self._client_status.get(key)
+        set_slot(member, '_client_status', {None: 'offline'} if client_status is None else client_status)
+        set_slot(member, '_store', self)
+        return member
+
+    def __setitem__(self, key: int, member: Member) -> None:
+        if self._guild is None:
+            self._guild = member.guild
+            self._state = member._state
+
+        row = self._rows.get(key)
+        if row is None:
+            row = self._rows[key] = len(self._ids)
+            self._ids.append(key)
+            self._users.append(member._user)
+            self._joined_at.append(_NO_TIME)
+            self._premium_since.append(_NO_TIME)
+            self._role_sets.append(0)
+            self._flags.append(0)
+            self._nicks.append(None)
+
+        for name in ('_user', 'joined_at', 'premium_since', '_roles', 'pending', 'nick', '_avatar', 'activities', '_client_status'):
+            self._write(member, name)
+
+    def __delitem__(self, key: int) -> None:
+        row = self._rows.pop(key)
+        last = len(self._ids) - 1
+        columns = self._columns()
+        if row != last:
+            # move the last row into the hole so the columns stay dense
+            for column in columns:
+                column[row] = column[last]
+            self._rows[self._ids[row]] = row
+
+        for column in columns:
+            column.pop()
+
+        self._avatars.pop(key, None)
+        self._activities.pop(key, None)
+        self._client_status.pop(key, None)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._rows
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._rows))
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def clear(self) -> None:
+        self._rows.clear()
+        for column in self._columns():
+            del column[:]
+        self._avatars.clear()
+        self._activities.clear()
+        self._client_status.clear()
+
+    @property
+    def memory_usage(self) -> int:
+        size = sys.getsizeof(self._rows) + sum(sys.getsizeof(column) for column in self._columns())
+        size += sys.getsizeof(self._role_set_ids) + sum(sys.getsizeof(roles) for roles in self._role_set_ids)
+        for sparse in (self._avatars, self._activities, self._client_status):
+            size += sys.getsizeof(sparse)
+        return size
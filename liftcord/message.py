@@ -425,7 +425,7 @@ class MessageReference:
     def with_state(cls: Type[MR], state: ConnectionState, data: MessageReferencePayload) -> MR:
         self = cls.__new__(cls)
         self.message_id = utils._get_as_snowflake(data, 'message_id')
-        self.channel_id = int(data.pop('channel_id'))
+        self.channel_id = int(data['channel_id'])
         self.guild_id = utils._get_as_snowflake(data, 'guild_id')
         self.fail_if_not_exists = data.get('fail_if_not_exists', True)
         self._state = state
@@ -491,6 +491,35 @@ class MessageReference:
     to_message_reference_dict = to_dict
 
 
+class _LazySlot:
+    # A Message field that is built from the raw payload on first access when
+    # the message was created lazily, and stored in a private slot afterwards.
+    def __init__(self, name: str, function: Callable[[Any, Any], Any]) -> None:
+        self.name = name
+        self.function = function
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.name)
+        except AttributeError:
+            value = self.function(instance, instance._payload)
+            setattr(instance, self.name, value)
+            return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        setattr(instance, self.name, value)
+
+
+def lazy_slot(name: str) -> Callable[[Callable[[Any, Any], Any]], _LazySlot]:
+    def decorator(func: Callable[[Any, Any], Any]) -> _LazySlot:
+        return _LazySlot(name, func)
+
+    return decorator
+
+
 def flatten_handlers(cls):
     prefix = len('_handle_')
     handlers = [
@@ -503,6 +532,7 @@ def flatten_handlers(cls):
     handlers.append(('member', cls._handle_member))
     cls._HANDLERS = handlers
     cls._CACHED_SLOTS = [attr for attr in cls.__slots__ if attr.startswith('_cs_')]
+    cls._LAZY_FIELDS = [key for key, value in cls.__dict__.items() if isinstance(value, _LazySlot)]
     return cls
 
 
@@ -626,6 +656,13 @@ class Message(Hashable):
     __slots__ = (
         '_state',
         '_edited_timestamp',
+        '_payload',
+        '_lazy_embeds',
+        '_lazy_mentions',
+        '_lazy_attachments',
+        '_lazy_reference',
+        '_lazy_stickers',
+        '_lazy_components',
         '_cs_channel_mentions',
         '_cs_raw_mentions',
         '_cs_clean_content',
@@ -637,31 +674,24 @@ class Message(Hashable):
         'channel',
         'webhook_id',
         'mention_everyone',
-        'embeds',
         'id',
-        'mentions',
         'author',
-        'attachments',
         'nonce',
         'pinned',
         'role_mentions',
         'type',
         'flags',
         'reactions',
-        'reference',
         'application',
         'activity',
-        'stickers',
-        'components',
         'guild',
     )
 
     if TYPE_CHECKING:
         _HANDLERS: ClassVar[List[Tuple[str, Callable[..., None]]]]
         _CACHED_SLOTS: ClassVar[List[str]]
+        _LAZY_FIELDS: ClassVar[List[str]]
         guild: Optional[Guild]
-        reference: Optional[MessageReference]
-        mentions: List[Union[User, Member]]
         author: Union[User, Member]
         role_mentions: List[Role]
 
@@ -671,13 +701,13 @@ class Message(Hashable):
         state: ConnectionState,
         channel: MessageableChannel,
         data: MessagePayload,
+        lazy: bool = False,
     ):
         self._state: ConnectionState = state
+        self._payload: Optional[MessagePayload] = data
         self.id: int = int(data['id'])
         self.webhook_id: Optional[int] = utils._get_as_snowflake(data, 'webhook_id')
         self.reactions: List[Reaction] = [Reaction(message=self, data=d) for d in data.get('reactions', [])]
-        self.attachments: List[Attachment] = [Attachment(data=a, state=self._state) for a in data['attachments']]
-        self.embeds: List[Embed] = [Embed.from_dict(a) for a in data['embeds']]
         self.application: Optional[MessageApplicationPayload] = data.get('application')
         self.activity: Optional[MessageActivityPayload] = data.get('activity')
         self.channel: MessageableChannel = channel
@@ -689,8 +719,6 @@ class Message(Hashable):
         self.tts: bool = data['tts']
         self.content: str = data['content']
         self.nonce: Optional[Union[int, str]] = data.get('nonce')
-        self.stickers: List[StickerItem] = [StickerItem(data=d, state=state) for d in data.get('sticker_items', [])]
-        self.components: List[Component] = [_component_factory(d) for d in data.get('components', [])]
 
         try:
             # if the channel doesn't have a guild attribute, we handle that
@@ -698,35 +726,18 @@ class Message(Hashable):
         except AttributeError:
             self.guild = state._get_guild(utils._get_as_snowflake(data, 'guild_id'))
 
-        try:
-            ref = data['message_reference']
-        except KeyError:
-            self.reference = None
-        else:
-            self.reference = ref = MessageReference.with_state(state, ref)
-            try:
-                resolved = data['referenced_message']
-            except KeyError:
-                pass
-            else:
-                if resolved is None:
-                    ref.resolved = DeletedReferencedMessage(ref)
-                else:
-                    # Right now the channel IDs match but maybe in the future they won't.
-                    if ref.channel_id == channel.id:
-                        chan = channel
-                    else:
-                        chan, _ = state._get_guild_channel(resolved)
-
-                    # the channel will be the correct type here
-                    ref.resolved = self.__class__(channel=chan, data=resolved, state=state)  # type: ignore
-
-        for handler in ('author', 'member', 'mentions', 'mention_roles'):
+        for handler in ('author', 'member', 'mention_roles'):
             try:
                 getattr(self, f'_handle_{handler}')(data[handler])
             except KeyError:
                 continue
 
+        if not lazy:
+            # build every lazy field right away and drop the payload
+            for field in self._LAZY_FIELDS:
+                getattr(self, field)
+            self._payload = None
+
     def __repr__(self) -> str:
         name = self.__class__.__name__
         return (
@@ -899,6 +910,55 @@ class Message(Hashable):
         self.guild = new_guild
         self.channel = new_channel
 
+    @lazy_slot('_lazy_attachments')
+    def attachments(self, data: MessagePayload) -> List[Attachment]:
+        return [Attachment(data=a, state=self._state) for a in data['attachments']]
+
+    @lazy_slot('_lazy_embeds')
+    def embeds(self, data: MessagePayload) -> List[Embed]:
+        return [Embed.from_dict(a) for a in data['embeds']]
+
+    @lazy_slot('_lazy_stickers')
+    def stickers(self, data: MessagePayload) -> List[StickerItem]:
+        return [StickerItem(data=d, state=self._state) for d in data.get('sticker_items', [])]
+
+    @lazy_slot('_lazy_components')
+    def components(self, data: MessagePayload) -> List[Component]:
+        return [_component_factory(d) for d in data.get('components', [])]
+
+    @lazy_slot('_lazy_mentions')
+    def mentions(self, data: MessagePayload) -> List[Union[User, Member]]:
+        self._handle_mentions(data.get('mentions', []))
+        return self._lazy_mentions
+
+    @lazy_slot('_lazy_reference')
+    def reference(self, data: MessagePayload) -> Optional[MessageReference]:
+        try:
+            ref = data['message_reference']
+        except KeyError:
+            return None
+
+        state = self._state
+        ref = MessageReference.with_state(state, ref)
+        try:
+            resolved = data['referenced_message']
+        except KeyError:
+            pass
+        else:
+            if resolved is None:
+                ref.resolved = DeletedReferencedMessage(ref)
+            else:
+                # Right now the channel IDs match but maybe in the future they won't.
+                if ref.channel_id == self.channel.id:
+                    chan = self.channel
+                else:
+                    chan, _ = state._get_guild_channel(resolved)
+
+                # the channel will be the correct type here
+                ref.resolved = self.__class__(channel=chan, data=resolved, state=state)  # type: ignore
+
+        return ref
+
     @utils.cached_slot_property('_cs_raw_mentions')
     def raw_mentions(self) -> List[int]:
         """List[:class:`int`]: A property that returns an array of user IDs matched with
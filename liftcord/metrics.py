@@ -0,0 +1,281 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections import deque
+import time
+import types
+from typing import Any, Deque, Dict, Generator, List, NamedTuple, Optional, Tuple
+
+__all__ = (
+    'MetricsSink',
+    'InMemoryMetrics',
+    'Histogram',
+    'Stall',
+)
+
+Tags = Dict[str, str]
+
+
+class MetricsSink:
+    """Receives the measurements of a :class:`Client`.
+
+    This is passed to :class:`Client` through the ``metrics_sink`` option.
+    The default implementation discards everything; subclass it to forward
+    the measurements to a metrics system, or use :class:`InMemoryMetrics`.
+
+    The measurements are:
+
+    - ``gateway.decode``: histogram of the time taken to decode a gateway
+      payload, tagged with its ``event``.
+    - ``gateway.parse``: histogram of the time taken by the ``parse_*``
+      handler of an event, tagged with its ``event``.
+    - ``client.listener``: histogram of the run time of an event listener,
+      tagged with its ``event`` and ``listener`` name.
+    - ``client.listener.busy``: same as above, except that the time the listener
+      spent waiting is left out, so this is how long it held the event loop.
+    - ``client.listener.errors``: counter of the listeners that raised,
+      tagged the same way.
+    - ``loop.lag``: histogram of the delay between scheduling a callback on the
+      event loop and it running.
+    - :meth:`stall`: the event loop has been blocked for longer than the
+      ``loop_watchdog`` threshold.
+
+    All times are in seconds. Every method except :meth:`stall` is called from
+    the event loop.
+
+    .. versionadded:: 2.0
+    """
+
+    def increment(self, name: str, value: int = 1, tags: Optional[Tags] = None) -> None:
+        """Adds ``value`` to a counter."""
+        pass
+
+    def observe(self, name: str, value: float, tags: Optional[Tags] = None) -> None:
+        """Records a value in a histogram."""
+        pass
+
+    def stall(self, duration: float, stack: Optional[str], task: Optional[str]) -> None:
+        """Called from the watchdog thread while the event loop is blocked.
+
+        Parameters
+        -----------
+        duration: :class:`float`
+            How long the loop has been blocked so far.
+        stack: Optional[:class:`str`]
+            The traceback of the event loop thread, if it could be sampled.
+        task: Optional[:class:`str`]
+            The name of the task running on the loop, if any. Listeners run in
+            tasks named after their event.
+        """
+        pass
+
+
+class Histogram:
+    """The distribution of the values of a histogram of :class:`InMemoryMetrics`.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    count: :class:`int`
+        The number of values.
+    total: :class:`float`
+        The sum of the values.
+    max: :class:`float`
+        The largest value.
+    buckets: List[:class:`int`]
+        The number of values up to each bound of :attr:`BOUNDS`, the last
+        bucket counting the values above every bound.
+    """
+
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    BOUNDS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.buckets: List[int] = [0] * (len(self.BOUNDS) + 1)
+
+    def __repr__(self) -> str:
+        return f'<Histogram count={self.count} mean={self.mean:.6f} max={self.max:.6f}>'
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        self.buckets[bisect.bisect_left(self.BOUNDS, value)] += 1
+
+    @property
+    def mean(self) -> float:
+        """:class:`float`: The average value, ``0.0`` when empty."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Estimates a quantile, such as ``0.99``, as the upper bound of the bucket
+        that contains it. Values above every bound are estimated as :attr:`max`.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index, size in enumerate(self.buckets):
+            seen += size
+            if seen >= rank and size:
+                return self.BOUNDS[index] if index < len(self.BOUNDS) else self.max
+        return self.max
+
+
+class Stall(NamedTuple):
+    """A stall of the event loop recorded by :class:`InMemoryMetrics`.
+
+    .. versionadded:: 2.0
+    """
+
+    time: float
+    duration: float
+    stack: Optional[str]
+    task: Optional[str]
+
+
+def _key(name: str, tags: Optional[Tags]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    return name, tuple(sorted(tags.items())) if tags else ()
+
+
+class InMemoryMetrics(MetricsSink):
+    """A :class:`MetricsSink` that keeps its measurements in memory, per name
+    and tags, for inspection from within the bot.
+
+    .. versionadded:: 2.0
+
+    Parameters
+    -----------
+    max_stalls: :class:`int`
+        The number of the most recent stalls kept in :attr:`stalls`.
+
+    Attributes
+    -----------
+    stalls: Deque[:class:`Stall`]
+        The most recent stalls of the event loop.
+    stall_count: :class:`int`
+        The number of stalls since the sink was created.
+    """
+
+    def __init__(self, *, max_stalls: int = 20) -> None:
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], int] = {}
+        self._histograms: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+        self.stalls: Deque[Stall] = deque(maxlen=max_stalls)
+        self.stall_count: int = 0
+
+    def increment(self, name: str, value: int = 1, tags: Optional[Tags] = None) -> None:
+        key = _key(name, tags)
+        self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, tags: Optional[Tags] = None) -> None:
+        key = _key(name, tags)
+        try:
+            histogram = self._histograms[key]
+        except KeyError:
+            histogram = self._histograms[key] = Histogram()
+        histogram.add(value)
+
+    def stall(self, duration: float, stack: Optional[str], task: Optional[str]) -> None:
+        # only ever called from the watchdog thread
+        self.stall_count += 1
+        self.stalls.append(Stall(time.time(), duration, stack, task))
+
+    def counter(self, name: str, **tags: str) -> int:
+        """Returns the value of a counter, ``0`` if it was never incremented."""
+        return self._counters.get(_key(name, tags), 0)
+
+    def histogram(self, name: str, **tags: str) -> Optional[Histogram]:
+        """Returns a :class:`Histogram`, ``None`` if it has no values."""
+        return self._histograms.get(_key(name, tags))
+
+    def histograms(self, name: str) -> Dict[Tuple[Tuple[str, str], ...], Histogram]:
+        """Returns every histogram of a name, keyed by their sorted ``(tag, value)`` pairs."""
+        return {tags: histogram for (key, tags), histogram in self._histograms.items() if key == name}
+
+    def top(self, name: str, limit: int = 10) -> List[Tuple[Dict[str, str], Histogram]]:
+        """Returns the histograms of a name with the largest totals first, such as
+        ``top('client.listener.busy')`` to find the listeners that hold the event
+        loop the most.
+        """
+        ranked = sorted(self.histograms(name).items(), key=lambda item: item[1].total, reverse=True)
+        return [(dict(tags), histogram) for tags, histogram in ranked[:limit]]
+
+    def clear(self) -> None:
+        """Removes every measurement."""
+        self._counters.clear()
+        self._histograms.clear()
+        self.stalls.clear()
+        self.stall_count = 0
+
+
+@types.coroutine
+def _measure(coro: Any, busy: List[float]) -> Generator[Any, Any, Any]:
+    # drives ``coro`` and adds the time spent inside it between suspensions to busy[0]
+    send, value = coro.send, None
+    while True:
+        start = time.perf_counter()
+        try:
+            yielded = send(value)
+        except StopIteration as exc:
+            return exc.value
+        finally:
+            busy[0] += time.perf_counter() - start
+
+        try:
+            value = yield yielded
+        except BaseException as exc:
+            send, value = coro.throw, exc
+        else:
+            send = coro.send
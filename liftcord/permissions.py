@@ -45,14 +45,20 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Callable, Any, ClassVar, Dict, Iterator, Set, TYPE_CHECKING, Tuple, Type, TypeVar, Optional
+import array
+from typing import Callable, Any, ClassVar, Dict, Iterator, List, Set, TYPE_CHECKING, Tuple, Type, TypeVar, Optional
 from .flags import BaseFlags, flag_value, fill_with_flags, alias_flag_value
 
 __all__ = (
     'Permissions',
     'PermissionOverwrite',
+    'PermissionMatrix',
 )
 
+if TYPE_CHECKING:
+    from .abc import GuildChannel, Snowflake
+    from .member import Member
+
 # A permission alias works like a regular flag but is marked
 # So the PermissionOverwrite knows to work with it
 class permission_alias(alias_flag_value):
@@ -769,3 +775,131 @@ class PermissionOverwrite:
     def __iter__(self) -> Iterator[Tuple[str, Optional[bool]]]:
         for key in self.PURE_FLAGS:
             yield key, self._values.get(key)
+
+
+class PermissionMatrix:
+    r"""The resolved permissions of a set of members in a set of channels.
+
+    This is returned by :meth:`Guild.permission_matrix`. The permission values
+    are kept in a single :class:`array.array`, one row per channel with one
+    column per member, and are queried with bitwise operations without
+    creating a :class:`Permissions` object per entry.
+
+    The matrix is a snapshot, it is not updated when roles, overwrites or
+    members change afterwards.
+
+    .. container:: operations
+
+        .. describe:: len(x)
+
+            Returns the number of entries, i.e. channels times members.
+
+    .. versionadded:: 2.0
+
+    Attributes
+    -----------
+    members: List[:class:`Member`]
+        The members of the matrix, in column order.
+    channels: List[:class:`abc.GuildChannel`]
+        The channels of the matrix, in row order.
+    """
+
+    __slots__ = ('members', 'channels', '_values', '_member_columns', '_channel_rows')
+
+    def __init__(self, members: List[Member], channels: List[GuildChannel], values: array.array) -> None:
+        self.members: List[Member] = members
+        self.channels: List[GuildChannel] = channels
+        self._values: array.array = values
+        self._member_columns: Dict[int, int] = {member.id: index for index, member in enumerate(members)}
+        self._channel_rows: Dict[int, int] = {channel.id: index for index, channel in enumerate(channels)}
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} members={len(self.members)} channels={len(self.channels)}>'
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _row(self, channel: Snowflake) -> array.array:
+        start = self._channel_rows[channel.id] * len(self.members)
+        return self._values[start : start + len(self.members)]
+
+    @staticmethod
+    def _mask(permissions: Optional[Permissions], perms: Dict[str, bool]) -> int:
+        mask = Permissions(**perms).value
+        if permissions is not None:
+            mask |= permissions.value
+        return mask
+
+    def permissions_for(self, channel: Snowflake, member: Snowflake) -> Permissions:
+        """Returns the permissions a member has in a channel.
+
+        Parameters
+        -----------
+        channel: :class:`abc.Snowflake`
+            The channel to look up.
+        member: :class:`abc.Snowflake`
+            The member to look up.
+
+        Raises
+        -------
+        KeyError
+            The channel or member is not part of the matrix.
+
+        Returns
+        --------
+        :class:`Permissions`
+            The member's permissions in the channel.
+        """
+        index = self._channel_rows[channel.id] * len(self.members) + self._member_columns[member.id]
+        return Permissions._from_value(self._values[index])
+
+    def members_with(self, channel: Snowflake, permissions: Optional[Permissions] = None, **perms: bool) -> List[Member]:
+        r"""Returns the members that have every given permission in a channel.
+
+        Parameters
+        -----------
+        channel: :class:`abc.Snowflake`
+            The channel to look up.
+        permissions: Optional[:class:`Permissions`]
+            The permissions the members must have.
+        \*\*perms: :class:`bool`
+            More permissions the members must have, by name.
+
+        Raises
+        -------
+        KeyError
+            The channel is not part of the matrix.
+
+        Returns
+        --------
+        List[:class:`Member`]
+            The members with all the permissions, in column order.
+        """
+        mask = self._mask(permissions, perms)
+        return [member for member, value in zip(self.members, self._row(channel)) if value & mask == mask]
+
+    def channels_for(self, member: Snowflake, permissions: Optional[Permissions] = None, **perms: bool) -> List[GuildChannel]:
+        r"""Returns the channels where a member has every given permission.
+
+        Parameters
+        -----------
+        member: :class:`abc.Snowflake`
+            The member to look up.
+        permissions: Optional[:class:`Permissions`]
+            The permissions the member must have.
+        \*\*perms: :class:`bool`
+            More permissions the member must have, by name.
+
+        Raises
+        -------
+        KeyError
+            The member is not part of the matrix.
+
+        Returns
+        --------
+        List[:class:`abc.GuildChannel`]
+            The channels where the member has all the permissions, in row order.
+        """
+        mask = self._mask(permissions, perms)
+        values = self._values[self._member_columns[member.id] :: len(self.members)]
+        return [channel for channel, value in zip(self.channels, values) if value & mask == mask]
@@ -54,6 +54,7 @@ from .state import AutoShardedConnectionState
 from .client import Client
 from .backoff import ExponentialBackoff
 from .gateway import *
+from .gateway import IdentifyBuckets
 from .errors import (
     ClientException,
     HTTPException,
@@ -69,6 +70,7 @@ from typing import TYPE_CHECKING, Any, Callable, Tuple, Type, Optional, List, Di
 if TYPE_CHECKING:
     from .gateway import DiscordWebSocket
     from .activity import BaseActivity
+    from .cluster import ClusterWorker
     from .enums import Status
 
     EI = TypeVar('EI', bound='EventItem')
@@ -144,9 +146,9 @@ class Shard:
         if self._task is not None and not self._task.done():
             self._task.cancel()
 
-    async def close(self) -> None:
+    async def close(self, *, code: int = 1000) -> None:
         self._cancel_task()
-        await self.ws.close(code=1000)
+        await self.ws.close(code=code)
 
     async def disconnect(self) -> None:
         await self.close()
@@ -332,6 +334,14 @@ class AutoShardedClient(Client):
     if this is used. By default, when omitted, the client will launch shards from
     0 to ``shard_count - 1``.
 
+    Shards are launched in parallel in identify buckets of ``shard_id % max_concurrency``,
+    where ``max_concurrency`` comes from the session start limit of the Bot Gateway
+    endpoint. Each bucket IDENTIFYs one shard every 5 seconds, in place of the default
+    :meth:`before_identify_hook` delay.
+
+    .. versionchanged:: 2.0
+        Shards are launched per identify bucket instead of one after another.
+
     Attributes
     ------------
     shard_ids: Optional[List[:class:`int`]]
@@ -344,6 +354,8 @@ class AutoShardedClient(Client):
     def __init__(self, *args: Any, loop: Optional[asyncio.AbstractEventLoop] = None, **kwargs: Any) -> None:
         kwargs.pop('shard_id', None)
         self.shard_ids: Optional[List[int]] = kwargs.pop('shard_ids', None)
+        self.cluster: Optional[ClusterWorker] = None
+        self._identify_buckets: IdentifyBuckets = IdentifyBuckets()
         super().__init__(*args, loop=loop, **kwargs)
 
         if self.shard_ids is not None:
@@ -365,6 +377,17 @@ class AutoShardedClient(Client):
             shard_id = (guild_id >> 22) % self.shard_count  # type: ignore
         return self.__shards[shard_id].ws
 
+    async def _call_before_identify_hook(self, shard_id: Optional[int], *, initial: bool = False) -> None:
+        # the identify buckets (or the cluster coordinator, which spaces out
+        # IDENTIFYs across every process) replace the default sleep
+        if self.cluster is None:
+            await self._identify_buckets.acquire(shard_id)
+        else:
+            await self.cluster.identify(shard_id)  # type: ignore
+
+        if type(self).before_identify_hook is not Client.before_identify_hook:
+            await self.before_identify_hook(shard_id, initial=initial)
+
     def _get_state(self, **options: Any) -> AutoShardedConnectionState:
         return AutoShardedConnectionState(
             dispatch=self.dispatch,
@@ -409,9 +432,16 @@ class AutoShardedClient(Client):
         """Mapping[int, :class:`ShardInfo`]: Returns a mapping of shard IDs to their respective info object."""
         return {shard_id: ShardInfo(parent, self.shard_count) for shard_id, parent in self.__shards.items()}
 
-    async def launch_shard(self, gateway: str, shard_id: int, *, initial: bool = False) -> None:
+    async def launch_shard(
+        self, gateway: str, shard_id: int, *, initial: bool = False, session: Optional[Tuple[str, int]] = None
+    ) -> None:
         try:
-            coro = DiscordWebSocket.from_client(self, initial=initial, gateway=gateway, shard_id=shard_id)
+            if session is not None:
+                coro = DiscordWebSocket.from_client(
+                    self, gateway=gateway, shard_id=shard_id, session=session[0], sequence=session[1], resume=True
+                )
+            else:
+                coro = DiscordWebSocket.from_client(self, initial=initial, gateway=gateway, shard_id=shard_id)
             ws = await asyncio.wait_for(coro, timeout=180.0)
         except Exception:
             _log.exception('Failed to connect for shard_id: %s. Retrying...', shard_id)
@@ -423,20 +453,44 @@ class AutoShardedClient(Client):
         ret.launch()
 
     async def launch_shards(self) -> None:
+        shard_count, gateway, limit = await self.http.get_bot_gateway()
         if self.shard_count is None:
-            self.shard_count, gateway = await self.http.get_bot_gateway()
-        else:
-            gateway = await self.http.get_gateway()
+            self.shard_count = shard_count
 
         self._connection.shard_count = self.shard_count
 
         shard_ids = self.shard_ids or range(self.shard_count)
         self._connection.shard_ids = shard_ids
+        sessions = self._restore_snapshot()
+
+        self._identify_buckets = buckets = IdentifyBuckets(limit['max_concurrency'])
+        identifying = len(shard_ids) - len(sessions)
+        if limit['remaining'] < identifying:
+            _log.warning(
+                'Only %s of the %s session starts remain to launch %s shards, the limit resets in %.2f seconds.',
+                limit['remaining'],
+                limit['total'],
+                identifying,
+                limit['reset_after'] / 1000,
+            )
 
+        # shards of a bucket IDENTIFY one after another, buckets launch in parallel
+        queues: Dict[int, List[int]] = {}
         for shard_id in shard_ids:
-            initial = shard_id == shard_ids[0]
-            await self.launch_shard(gateway, shard_id, initial=initial)
+            queues.setdefault(buckets.bucket_for(shard_id), []).append(shard_id)
+
+        _log.info('Launching %s shards in %s identify buckets.', len(shard_ids), len(queues))
+        launched = 0
+
+        async def launch_bucket(queue: List[int]) -> None:
+            nonlocal launched
+            for shard_id in queue:
+                initial = shard_id == shard_ids[0]
+                await self.launch_shard(gateway, shard_id, initial=initial, session=sessions.get(shard_id))
+                launched += 1
+                _log.info('Shard ID %s has launched (%s/%s).', shard_id, launched, len(shard_ids))
 
+        await asyncio.gather(*(launch_bucket(queue) for queue in queues.values()))
         self._connection.shards_launched.set()
 
     async def connect(self, *, reconnect: bool = True) -> None:
@@ -479,7 +533,10 @@ class AutoShardedClient(Client):
             except Exception:
                 pass
 
-        to_close = [asyncio.ensure_future(shard.close(), loop=self.loop) for shard in self.__shards.values()]
+        sessions = {shard_id: (shard.ws.session_id, shard.ws.sequence) for shard_id, shard in self.__shards.items()}
+        # closing with 1000 would invalidate the sessions the snapshot resumes
+        code = 4000 if self._save_snapshot(sessions) else 1000
+        to_close = [asyncio.ensure_future(shard.close(code=code), loop=self.loop) for shard in self.__shards.values()]
         if to_close:
             await asyncio.wait(to_close)
 
@@ -0,0 +1,333 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2021 xXSergeyXx
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+
+----------------------------------------------------------------------
+
+Авторские права (c) 2021 xXSergeyXx
+
+Данная лицензия разрешает лицам, получившим копию данного программного
+обеспечения и сопутствующей документации (в дальнейшем именуемыми «Программное обеспечение»), 
+безвозмездно использовать Программное обеспечение без ограничений, включая неограниченное 
+право на использование, копирование, изменение, слияние, публикацию, распространение, 
+сублицензирование и/или продажу копий Программного обеспечения, а также лицам, которым 
+предоставляется данное Программное обеспечение, при соблюдении следующих условий:
+
+Указанное выше уведомление об авторском праве и данные условия должны быть включены во 
+все копии или значимые части данного Программного обеспечения.
+
+ДАННОЕ ПРОГРАММНОЕ ОБЕСПЕЧЕНИЕ ПРЕДОСТАВЛЯЕТСЯ «КАК ЕСТЬ», БЕЗ КАКИХ-ЛИБО ГАРАНТИЙ, ЯВНО ВЫРАЖЕННЫХ 
+ИЛИ ПОДРАЗУМЕВАЕМЫХ, ВКЛЮЧАЯ ГАРАНТИИ ТОВАРНОЙ ПРИГОДНОСТИ, СООТВЕТСТВИЯ ПО ЕГО КОНКРЕТНОМУ 
+НАЗНАЧЕНИЮ И ОТСУТСТВИЯ НАРУШЕНИЙ, НО НЕ ОГРАНИЧИВАЯСЬ ИМИ. НИ В КАКОМ СЛУЧАЕ АВТОРЫ ИЛИ ПРАВООБЛАДАТЕЛИ 
+НЕ НЕСУТ ОТВЕТСТВЕННОСТИ ПО КАКИМ-ЛИБО ИСКАМ, ЗА УЩЕРБ ИЛИ ПО ИНЫМ ТРЕБОВАНИЯМ, В ТОМ ЧИСЛЕ, ПРИ 
+ДЕЙСТВИИ КОНТРАКТА, ДЕЛИКТЕ ИЛИ ИНОЙ СИТУАЦИИ, ВОЗНИКШИМ ИЗ-ЗА ИСПОЛЬЗОВАНИЯ ПРОГРАММНОГО 
+ОБЕСПЕЧЕНИЯ ИЛИ ИНЫХ ДЕЙСТВИЙ С ПРОГРАММНЫМ ОБЕСПЕЧЕНИЕМ.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import zlib
+from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple
+
+from .enums import ChannelType
+
+if TYPE_CHECKING:
+    from .abc import GuildChannel
+    from .codec import Codec
+    from .emoji import Emoji
+    from .guild import Guild
+    from .member import Member
+    from .role import Role
+    from .sticker import GuildSticker
+    from .threads import Thread
+    from .user import BaseUser, ClientUser
+
+    Sessions = Dict[Optional[int], Tuple[str, int]]
+
+# Cache snapshots used for warm restarts. The cached models are turned back
+# into the gateway payloads they are built from, so restoring a snapshot goes
+# through the exact same code as a GUILD_CREATE.
+
+__all__ = ()
+
+_log = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+# snapshots older than this are not restored, their sessions can't be resumed anymore
+MAX_AGE = 300.0
+
+
+def _isoformat(dt: Any) -> Optional[str]:
+    return dt.isoformat() if dt is not None else None
+
+
+def _user_payload(user: BaseUser) -> Dict[str, Any]:
+    return {
+        'id': user.id,
+        'username': user.name,
+        'discriminator': user.discriminator,
+        'avatar': user._avatar,
+        'banner': user._banner,
+        'accent_color': user._accent_colour,
+        'public_flags': user._public_flags,
+        'bot': user.bot,
+        'system': user.system,
+    }
+
+
+def client_user_payload(user: ClientUser) -> Dict[str, Any]:
+    payload = _user_payload(user)
+    payload.update(verified=user.verified, locale=user.locale, flags=user._flags, mfa_enabled=user.mfa_enabled)
+    return payload
+
+
+def _member_payload(member: Member) -> Dict[str, Any]:
+    return {
+        'user': _user_payload(member._user),
+        'roles': list(member._roles),
+        'joined_at': _isoformat(member.joined_at),
+        'premium_since': _isoformat(member.premium_since),
+        'nick': member.nick,
+        'pending': member.pending,
+        'avatar': member._avatar,
+    }
+
+
+def _presence_payload(member: Member) -> Optional[Dict[str, Any]]:
+    client_status = member._client_status
+    if client_status == {None: 'offline'} and not member.activities:
+        return None
+
+    activities = []
+    for activity in member.activities:
+        try:
+            activities.append(activity.to_dict())
+        except NotImplementedError:
+            pass
+
+    return {
+        'user': {'id': member.id},
+        'status': client_status[None],
+        'client_status': {key: value for key, value in client_status.items() if key is not None},
+        'activities': activities,
+    }
+
+
+def _role_payload(role: Role) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        'id': role.id,
+        'name': role.name,
+        'permissions': str(role._permissions),
+        'position': role.position,
+        'color': role._colour,
+        'hoist': role.hoist,
+        'managed': role.managed,
+        'mentionable': role.mentionable,
+    }
+    tags = role.tags
+    if tags is not None:
+        payload['tags'] = tags_payload = {}
+        if tags.bot_id is not None:
+            tags_payload['bot_id'] = tags.bot_id
+        if tags.integration_id is not None:
+            tags_payload['integration_id'] = tags.integration_id
+        if tags.is_premium_subscriber():
+            tags_payload['premium_subscriber'] = None
+    return payload
+
+
+# channel payload key -> attribute, for the attributes only some channel types have
+_CHANNEL_ATTRIBUTES: Tuple[Tuple[str, str], ...] = (
+    ('topic', 'topic'),
+    ('nsfw', 'nsfw'),
+    ('rate_limit_per_user', 'slowmode_delay'),
+    ('default_auto_archive_duration', 'default_auto_archive_duration'),
+    ('last_message_id', 'last_message_id'),
+    ('bitrate', 'bitrate'),
+    ('user_limit', 'user_limit'),
+)
+
+
+def _channel_payload(channel: GuildChannel) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        'id': channel.id,
+        'type': channel.type.value,
+        'name': channel.name,
+        'position': channel.position,
+        'parent_id': channel.category_id,
+        'permission_overwrites': [overwrite._asdict() for overwrite in channel._overwrites],
+    }
+    for key, attr in _CHANNEL_ATTRIBUTES:
+        try:
+            payload[key] = getattr(channel, attr)
+        except AttributeError:
+            pass
+
+    if channel.type in (ChannelType.voice, ChannelType.stage_voice):
+        rtc_region = channel.rtc_region  # type: ignore
+        payload['rtc_region'] = rtc_region.value if rtc_region is not None else None
+        payload['video_quality_mode'] = channel.video_quality_mode.value  # type: ignore
+    return payload
+
+
+def _thread_payload(thread: Thread) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        'id': thread.id,
+        'parent_id': thread.parent_id,
+        'owner_id': thread.owner_id,
+        'name': thread.name,
+        'type': thread._type.value,
+        'last_message_id': thread.last_message_id,
+        'rate_limit_per_user': thread.slowmode_delay,
+        'message_count': thread.message_count,
+        'member_count': thread.member_count,
+        'thread_metadata': {
+            'archived': thread.archived,
+            'archiver_id': thread.archiver_id,
+            'auto_archive_duration': thread.auto_archive_duration,
+            'archive_timestamp': _isoformat(thread.archive_timestamp),
+            'locked': thread.locked,
+            'invitable': thread.invitable,
+        },
+    }
+    me = thread.me
+    if me is not None:
+        payload['member'] = {
+            'id': thread.id,
+            'user_id': me.id,
+            'join_timestamp': _isoformat(me.joined_at),
+            'flags': me.flags,
+        }
+    return payload
+
+
+def _emoji_payload(emoji: Emoji) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        'id': emoji.id,
+        'name': emoji.name,
+        'require_colons': emoji.require_colons,
+        'managed': emoji.managed,
+        'animated': emoji.animated,
+        'available': emoji.available,
+        'roles': list(emoji._roles),
+    }
+    if emoji.user is not None:
+        payload['user'] = _user_payload(emoji.user)
+    return payload
+
+
+def _sticker_payload(sticker: GuildSticker) -> Dict[str, Any]:
+    payload: Dict[str, Any] = {
+        'id': sticker.id,
+        'name': sticker.name,
+        'description': sticker.description,
+        'format_type': sticker.format.value,
+        'available': sticker.available,
+        'guild_id': sticker.guild_id,
+        'tags': sticker.emoji,
+    }
+    if sticker.user is not None:
+        payload['user'] = _user_payload(sticker.user)
+    return payload
+
+
+def guild_payload(guild: Guild) -> Dict[str, Any]:
+    members = list(guild._members.values())
+    presences = [presence for presence in map(_presence_payload, members) if presence is not None]
+    return {
+        'id': guild.id,
+        'name': guild.name,
+        'member_count': guild._member_count,
+        'large': guild._large,
+        'region': guild.region.value,
+        'verification_level': guild.verification_level.value,
+        'default_message_notifications': guild.default_notifications.value,
+        'explicit_content_filter': guild.explicit_content_filter.value,
+        'afk_timeout': guild.afk_timeout,
+        'afk_channel_id': guild.afk_channel.id if guild.afk_channel is not None else None,
+        'icon': guild._icon,
+        'banner': guild._banner,
+        'splash': guild._splash,
+        'discovery_splash': guild._discovery_splash,
+        'owner_id': guild.owner_id,
+        'mfa_level': guild.mfa_level,
+        'features': guild.features,
+        'description': guild.description,
+        'max_presences': guild.max_presences,
+        'max_members': guild.max_members,
+        'max_video_channel_users': guild.max_video_channel_users,
+        'premium_tier': guild.premium_tier,
+        'premium_subscription_count': guild.premium_subscription_count,
+        'system_channel_id': guild._system_channel_id,
+        'system_channel_flags': guild._system_channel_flags,
+        'rules_channel_id': guild._rules_channel_id,
+        'public_updates_channel_id': guild._public_updates_channel_id,
+        'preferred_locale': guild.preferred_locale,
+        'nsfw_level': guild.nsfw_level.value,
+        'roles': [_role_payload(role) for role in guild._roles.values()],
+        'emojis': [_emoji_payload(emoji) for emoji in guild.emojis],
+        'stickers': [_sticker_payload(sticker) for sticker in guild.stickers],
+        'channels': [_channel_payload(channel) for channel in guild._channels.values()],
+        'threads': [_thread_payload(thread) for thread in guild._threads.values()],
+        'members': [_member_payload(member) for member in members],
+        'presences': presences,
+    }
+
+
+def write(path: str, codec: Codec, data: Dict[str, Any]) -> None:
+    data = dict(data, version=SNAPSHOT_VERSION, saved_at=time.time())
+    encoded = codec.encode(data)
+    if isinstance(encoded, str):
+        encoded = encoded.encode('utf-8')
+
+    # write to a temporary file first so a crash never leaves a torn snapshot
+    tmp = f'{path}.tmp'
+    with open(tmp, 'wb') as fp:
+        fp.write(zlib.compress(encoded))
+    os.replace(tmp, path)
+
+
+def read(path: str, codec: Codec, *, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'rb') as fp:
+            raw = fp.read()
+    except FileNotFoundError:
+        return None
+
+    try:
+        data = codec.decode(zlib.decompress(raw))
+    except Exception:
+        _log.warning('Ignoring unreadable cache snapshot %s.', path, exc_info=True)
+        return None
+
+    if data.get('version') != SNAPSHOT_VERSION:
+        _log.info('Ignoring cache snapshot %s from another version.', path)
+        return None
+
+    if max_age is not None and time.time() - data['saved_at'] > max_age:
+        _log.info('Ignoring cache snapshot %s older than %s seconds.', path, max_age)
+        return None
+
+    return data
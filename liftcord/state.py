@@ -46,12 +46,28 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-from collections import deque, OrderedDict
+from collections import OrderedDict
 import copy
 import datetime
 import itertools
 import logging
-from typing import Dict, Optional, TYPE_CHECKING, Union, Callable, Any, List, TypeVar, Coroutine, Sequence, Tuple, Deque
+from typing import (
+    Dict,
+    Optional,
+    TYPE_CHECKING,
+    Union,
+    Callable,
+    Any,
+    List,
+    TypeVar,
+    Coroutine,
+    AsyncIterator,
+    Sequence,
+    Set,
+    Tuple,
+    MutableMapping,
+    Type,
+)
 import inspect
 
 import os
@@ -66,7 +82,7 @@ from .message import Message
 from .channel import *
 from .channel import _channel_factory
 from .raw_models import *
-from .member import Member
+from .member import ColumnarMemberCache, Member
 from .role import Role
 from .enums import ChannelType, try_enum, Status
 from . import utils
@@ -79,6 +95,9 @@ from .ui.view import ViewStore, View
 from .stage_instance import StageInstance
 from .threads import Thread, ThreadMember
 from .sticker import GuildSticker
+from .cache import CacheBackend, CacheLimits, MemoryCache, MessageCache, NameIndex, _estimate_size
+from . import snapshot
+from .metrics import MetricsSink
 
 if TYPE_CHECKING:
     from .abc import PrivateChannel
@@ -118,9 +137,24 @@ class ChunkRequest:
         self.nonce: str = os.urandom(16).hex()
         self.buffer: List[Member] = []
         self.waiters: List[asyncio.Future[List[Member]]] = []
+        self.streams: List[asyncio.Queue[Optional[List[Member]]]] = []
+        self.chunks_received: int = 0
+        self.chunk_count: Optional[int] = None
+        self.finished: bool = False
 
-    def add_members(self, members: List[Member]) -> None:
+    @property
+    def member_count(self) -> int:
+        return len(self.buffer)
+
+    def add_members(self, members: List[Member], chunk_count: Optional[int] = None) -> None:
         self.buffer.extend(members)
+        self.chunks_received += 1
+        if chunk_count is not None:
+            self.chunk_count = chunk_count
+
+        for queue in self.streams:
+            queue.put_nowait(members)
+
         if self.cache:
             guild = self.resolver(self.guild_id)
             if guild is None:
@@ -144,7 +178,29 @@ class ChunkRequest:
         self.waiters.append(future)
         return future
 
+    async def stream(self, *, timeout: Optional[float] = None) -> AsyncIterator[List[Member]]:
+        queue: asyncio.Queue[Optional[List[Member]]] = asyncio.Queue()
+        # late subscribers get what was received so far in one go
+        if self.buffer:
+            queue.put_nowait(list(self.buffer))
+        if self.finished:
+            queue.put_nowait(None)
+
+        self.streams.append(queue)
+        try:
+            while True:
+                members = await asyncio.wait_for(queue.get(), timeout=timeout)
+                if members is None:
+                    return
+                yield members
+        finally:
+            self.streams.remove(queue)
+
     def done(self) -> None:
+        self.finished = True
+        for queue in self.streams:
+            queue.put_nowait(None)
+
         for future in self.waiters:
             if not future.done():
                 future.set_result(self.buffer)
@@ -152,6 +208,25 @@ class ChunkRequest:
 
 _log = logging.getLogger(__name__)
 
+# Gateway events whose parsers only build models for the listed events
+# without touching the cache, so they can be skipped when nobody listens.
+_LISTENER_ONLY_EVENTS: Dict[str, Tuple[str, ...]] = {
+    'TYPING_START': ('typing',),
+    'INVITE_CREATE': ('invite_create',),
+    'INVITE_DELETE': ('invite_delete',),
+    'GUILD_INTEGRATIONS_UPDATE': ('guild_integrations_update',),
+    'INTEGRATION_CREATE': ('integration_create',),
+    'INTEGRATION_UPDATE': ('integration_update',),
+    'INTEGRATION_DELETE': ('raw_integration_delete',),
+    'WEBHOOKS_UPDATE': ('webhooks_update',),
+}
+
+
+def _store_memory_usage(store: MutableMapping[int, Any]) -> int:
+    if isinstance(store, CacheBackend):
+        return store.memory_usage
+    return sum(_estimate_size(value) for value in store.values())
+
 
 async def logging_coroutine(coroutine: Coroutine[Any, Any, T], *, info: str) -> Optional[T]:
     try:
@@ -164,8 +239,11 @@ class ConnectionState:
     if TYPE_CHECKING:
         _get_websocket: Callable[..., DiscordWebSocket]
         _get_client: Callable[..., Client]
+        _has_listeners: Callable[[str], bool]
         _parsers: Dict[str, Callable[[Dict[str, Any]], None]]
 
+    CACHE_ENTITIES: Tuple[str, ...] = ('users', 'guilds', 'emojis', 'stickers', 'members', 'channels', 'threads')
+
     def __init__(
         self,
         *,
@@ -182,6 +260,29 @@ class ConnectionState:
         if self.max_messages is not None and self.max_messages <= 0:
             self.max_messages = 1000
 
+        self.message_cache_policy: str = options.get('message_cache_policy', 'fifo')
+        if self.message_cache_policy not in ('fifo', 'lru'):
+            raise ValueError('message_cache_policy must be either \'fifo\' or \'lru\'')
+
+        self.max_messages_per_channel: Optional[int] = options.get('max_messages_per_channel', None)
+        self.max_messages_per_guild: Optional[int] = options.get('max_messages_per_guild', None)
+        for quota in (self.max_messages_per_channel, self.max_messages_per_guild):
+            if quota is not None and quota <= 0:
+                raise ValueError('message cache quotas must be greater than 0')
+
+        self._message_cache_check: Optional[Callable[[Message], bool]] = options.get('message_cache_check', None)
+        if self._message_cache_check is not None and not callable(self._message_cache_check):
+            raise TypeError('message_cache_check parameter must be callable')
+
+        self.lazy_messages: bool = options.get('lazy_messages', False)
+
+        self.cache_presences: bool = options.get('cache_presences', True)
+        self._skippable_events: Dict[str, Tuple[str, ...]] = {}
+        if options.get('skip_unused_events', True):
+            self._skippable_events.update(_LISTENER_ONLY_EVENTS)
+            if not self.cache_presences:
+                self._skippable_events['PRESENCE_UPDATE'] = ('presence_update', 'user_update')
+
         self.dispatch: Callable = dispatch
         self.handlers: Dict[str, Callable] = handlers
         self.hooks: Dict[str, Callable] = hooks
@@ -189,6 +290,13 @@ class ConnectionState:
         self._ready_task: Optional[asyncio.Task] = None
         self.application_id: Optional[int] = utils._get_as_snowflake(options, 'application_id')
         self.heartbeat_timeout: float = options.get('heartbeat_timeout', 60.0)
+        self.metrics: Optional[MetricsSink] = options.get('metrics_sink')
+        if self.metrics is not None and not isinstance(self.metrics, MetricsSink):
+            raise TypeError(f'metrics_sink parameter must be MetricsSink not {type(self.metrics)!r}')
+
+        self.heartbeat_mode: str = options.get('heartbeat_mode', 'thread')
+        if self.heartbeat_mode not in ('thread', 'asyncio'):
+            raise ValueError(f'heartbeat_mode must be thread or asyncio not {self.heartbeat_mode!r}')
         self.guild_ready_timeout: float = options.get('guild_ready_timeout', 2.0)
         if self.guild_ready_timeout < 0:
             raise ValueError('guild_ready_timeout cannot be negative')
@@ -199,7 +307,11 @@ class ConnectionState:
             raise TypeError('allowed_mentions parameter must be AllowedMentions')
 
         self.allowed_mentions: Optional[AllowedMentions] = allowed_mentions
-        self._chunk_requests: Dict[Union[int, str], ChunkRequest] = {}
+        # pending requests by nonce, and full member requests by guild ID
+        self._chunk_requests: Dict[str, ChunkRequest] = {}
+        self._guild_chunk_requests: Dict[int, ChunkRequest] = {}
+        # shards restored from a cache snapshot that have yet to RESUME
+        self._restoring: Set[Optional[int]] = set()
 
         activity = options.get('activity', None)
         if activity:
@@ -241,6 +353,24 @@ class ConnectionState:
             cache_flags._verify_intents(intents)
 
         self.member_cache_flags: MemberCacheFlags = cache_flags
+
+        cache_limits = options.get('cache_limits', None) or {}
+        for name, limits in cache_limits.items():
+            if not isinstance(limits, CacheLimits):
+                raise TypeError(f'cache_limits values must be CacheLimits not {type(limits)!r}')
+            if name not in self.CACHE_ENTITIES:
+                raise ValueError(f'unknown cache entity {name!r}')
+
+        cache_backend = options.get('cache_backend', None)
+        if cache_backend is not None and not callable(cache_backend):
+            raise TypeError(f'cache_backend parameter must be callable not {type(cache_backend)!r}')
+
+        self.compact_members: bool = options.get('compact_members', False)
+        if self.compact_members and 'members' in cache_limits:
+            raise ValueError('compact_members cannot be combined with cache limits for members')
+
+        self._cache_limits: Dict[str, CacheLimits] = dict(cache_limits)
+        self._cache_backend: Optional[Type[CacheBackend]] = cache_backend
         self._activity: Optional[ActivityPayload] = activity
         self._status: Optional[str] = status
         self._intents: Intents = intents
@@ -256,6 +386,14 @@ class ConnectionState:
 
         self.clear()
 
+    def _is_event_needed(self, event: str) -> bool:
+        try:
+            dispatched = self._skippable_events[event]
+        except KeyError:
+            return True
+
+        return any(map(self._has_listeners, dispatched))
+
     def clear(self, *, views: bool = True) -> None:
         self.user: Optional[ClientUser] = None
         # Originally, this code used WeakValueDictionary to maintain references to the
@@ -270,10 +408,13 @@ class ConnectionState:
         # references now using a regular dictionary with eviction being done
         # using __del__. Testing this for memory leaks led to no discernable leaks,
         # though more testing will have to be done.
-        self._users: Dict[int, User] = {}
-        self._emojis: Dict[int, Emoji] = {}
-        self._stickers: Dict[int, GuildSticker] = {}
-        self._guilds: Dict[int, Guild] = {}
+        self._users: MutableMapping[int, User] = self._create_cache('users', on_evict=self._evict_user)
+        self._emojis: MutableMapping[int, Emoji] = self._create_cache('emojis', on_evict=self._unindex_emoji)
+        # the name indexes are only built the first time a lookup needs them
+        self._user_index: Optional[NameIndex[User]] = None
+        self._emoji_index: Optional[NameIndex[Emoji]] = None
+        self._stickers: MutableMapping[int, GuildSticker] = self._create_cache('stickers')
+        self._guilds: MutableMapping[int, Guild] = self._create_cache('guilds')
         if views:
             self._view_store: ViewStore = ViewStore(self)
 
@@ -284,21 +425,115 @@ class ConnectionState:
         # extra dict to look up private channels by user id
         self._private_channels_by_user: Dict[int, DMChannel] = {}
         if self.max_messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(maxlen=self.max_messages)
+            self._messages: Optional[MessageCache] = MessageCache(
+                self.max_messages,
+                policy=self.message_cache_policy,
+                max_per_channel=self.max_messages_per_channel,
+                max_per_guild=self.max_messages_per_guild,
+            )
         else:
-            self._messages: Optional[Deque[Message]] = None
+            self._messages: Optional[MessageCache] = None
+
+    def _create_cache(self, name: str, *, on_evict: Optional[Callable[[Any, Any], None]] = None) -> MutableMapping[int, Any]:
+        if name == 'members' and self.compact_members:
+            return ColumnarMemberCache(name, on_evict=on_evict)
+
+        limits = self._cache_limits.get(name)
+        backend = self._cache_backend
+        if backend is None:
+            if limits is None:
+                # unbounded stores stay plain dicts, they're the fastest option
+                return {}
+            backend = MemoryCache
+        return backend(name, limits, on_evict=on_evict)
+
+    def _evict_user(self, user_id: int, user: User) -> None:
+        # the evicted user may still be referenced by members, make sure its
+        # __del__ doesn't dereference a newer user stored under the same ID
+        user._stored = False
+        if self._user_index is not None:
+            self._user_index.remove(user_id)
+
+    def _get_user_index(self) -> NameIndex[User]:
+        index = self._user_index
+        if index is None:
+            self._user_index = index = NameIndex()
+            for user in self._users.values():
+                index.add(user.id, user)
+        return index
+
+    def _get_emoji_index(self) -> NameIndex[Emoji]:
+        index = self._emoji_index
+        if index is None:
+            self._emoji_index = index = NameIndex()
+            for emoji in self._emojis.values():
+                index.add(emoji.id, emoji)
+        return index
+
+    def _users_named(self, name: str) -> List[User]:
+        return [user for user in self._get_user_index().get(name) if user.name == name]
+
+    def _emojis_named(self, name: str) -> List[Emoji]:
+        return [emoji for emoji in self._get_emoji_index().get(name) if emoji.name == name]
+
+    def _unindex_emoji(self, emoji_id: int, *args: Any) -> None:
+        if self._emoji_index is not None:
+            self._emoji_index.remove(emoji_id)
+
+    def _reindex_user(self, user: User, guild: Optional[Guild] = None) -> None:
+        # a new username has to be reflected in the member indexes, but member
+        # events are sent for every guild so those only reindex their own guild
+        if self._user_index is not None and self._users.get(user.id) is user:
+            self._user_index.add(user.id, user)
+
+        guilds = self._guilds.values() if guild is None else (guild,)
+        for guild in guilds:
+            if guild._member_index is not None:
+                member = guild.get_member(user.id)
+                if member is not None:
+                    guild._member_index.add(member.id, member)
 
-    def process_chunk_requests(self, guild_id: int, nonce: Optional[str], members: List[Member], complete: bool) -> None:
-        removed = []
-        for key, request in self._chunk_requests.items():
-            if request.guild_id == guild_id and request.nonce == nonce:
-                request.add_members(members)
-                if complete:
-                    request.done()
-                    removed.append(key)
+    def cache_memory_usage(self) -> Dict[str, int]:
+        usage = dict.fromkeys(self.CACHE_ENTITIES, 0)
+        for name, store in (('users', self._users), ('emojis', self._emojis), ('stickers', self._stickers), ('guilds', self._guilds)):
+            usage[name] += _store_memory_usage(store)
 
-        for key in removed:
-            del self._chunk_requests[key]
+        for guild in self._guilds.values():
+            usage['members'] += _store_memory_usage(guild._members)
+            usage['channels'] += _store_memory_usage(guild._channels)
+            usage['threads'] += _store_memory_usage(guild._threads)
+        return usage
+
+    def process_chunk_requests(
+        self,
+        guild_id: int,
+        nonce: Optional[str],
+        members: List[Member],
+        complete: bool,
+        *,
+        chunk_count: Optional[int] = None,
+    ) -> None:
+        if nonce is None:
+            return
+
+        request = self._chunk_requests.get(nonce)
+        if request is None or request.guild_id != guild_id:
+            return
+
+        request.add_members(members, chunk_count)
+        _log.debug(
+            'Received chunk %s/%s for request %s in guild ID %s, %s members so far.',
+            request.chunks_received,
+            request.chunk_count,
+            nonce,
+            guild_id,
+            request.member_count,
+        )
+        if complete:
+            request.done()
+            del self._chunk_requests[nonce]
+            if self._guild_chunk_requests.get(guild_id) is request:
+                del self._guild_chunk_requests[guild_id]
 
     def call_handlers(self, key: str, *args: Any, **kwargs: Any) -> None:
         try:
@@ -354,10 +589,14 @@ class ConnectionState:
             if user.discriminator != '0000':
                 self._users[user_id] = user
                 user._stored = True
+                if self._user_index is not None:
+                    self._user_index.add(user_id, user)
             return user
 
     def deref_user(self, user_id: int) -> None:
         self._users.pop(user_id, None)
+        if self._user_index is not None:
+            self._user_index.remove(user_id)
 
     def create_user(self, data: UserPayload) -> User:
         return User(state=self, data=data)
@@ -373,6 +612,8 @@ class ConnectionState:
         # the id will be present here
         emoji_id = int(data['id'])  # type: ignore
         self._emojis[emoji_id] = emoji = Emoji(guild=guild, state=self, data=data)
+        if self._emoji_index is not None:
+            self._emoji_index.add(emoji_id, emoji)
         return emoji
 
     def store_sticker(self, guild: Guild, data: GuildStickerPayload) -> GuildSticker:
@@ -406,6 +647,7 @@ class ConnectionState:
 
         for emoji in guild.emojis:
             self._emojis.pop(emoji.id, None)
+            self._unindex_emoji(emoji.id)
 
         for sticker in guild.stickers:
             self._stickers.pop(sticker.id, None)
@@ -472,13 +714,60 @@ class ConnectionState:
                 self._private_channels_by_user.pop(recipient.id, None)
 
     def _get_message(self, msg_id: Optional[int]) -> Optional[Message]:
-        return utils.find(lambda m: m.id == msg_id, reversed(self._messages)) if self._messages else None
+        return self._messages.get(msg_id) if self._messages else None
+
+    def _should_cache_message(self, message: Message) -> bool:
+        check = self._message_cache_check
+        if check is None:
+            return True
+
+        try:
+            return bool(check(message))
+        except Exception:
+            _log.exception('Ignoring exception in message_cache_check')
+            return False
 
     def _add_guild_from_data(self, data: GuildPayload) -> Guild:
         guild = Guild(data=data, state=self)
         self._add_guild(guild)
         return guild
 
+    def _dump_snapshot(self, sessions: Dict[Optional[int], Tuple[str, int]]) -> Dict[str, Any]:
+        application_flags = getattr(self, 'application_flags', None)
+        return {
+            'user': snapshot.client_user_payload(self.user),  # type: ignore
+            'application': {
+                'id': self.application_id,
+                'flags': application_flags.value if application_flags is not None else 0,
+            },
+            'intents': self._intents.value,
+            'shard_count': self.shard_count,
+            'sessions': [[shard_id, session_id, sequence] for shard_id, (session_id, sequence) in sessions.items()],
+            'guilds': [snapshot.guild_payload(guild) for guild in self._guilds.values()],
+        }
+
+    def _restore_snapshot(self, data: Dict[str, Any]) -> Dict[Optional[int], Tuple[str, int]]:
+        if data['intents'] != self._intents.value:
+            _log.info('Not restoring the cache snapshot, it was taken with different intents.')
+            return {}
+
+        self.clear(views=False)
+        self.user = user = ClientUser(state=self, data=data['user'])
+        self._users[user.id] = user  # type: ignore
+
+        application = data['application']
+        if self.application_id is None and application['id'] is not None:
+            self.application_id = int(application['id'])
+            self.application_flags = ApplicationFlags._from_value(application['flags'])
+
+        for guild_data in data['guilds']:
+            self._add_guild_from_data(guild_data)
+
+        sessions = {shard_id: (session_id, sequence) for shard_id, session_id, sequence in data['sessions']}
+        self._restoring = set(sessions)
+        _log.info('Restored %s guilds from the cache snapshot, resuming %s session(s).', len(self._guilds), len(sessions))
+        return sessions
+
     def _guild_needs_chunking(self, guild: Guild) -> bool:
         # If presences are enabled then we get back the old guild.large behaviour
         return self._chunk_guilds and not guild.chunked and not (self._intents.presences and not guild.large)
@@ -571,6 +860,7 @@ class ConnectionState:
             self._ready_task.cancel()
 
         self._ready_state = asyncio.Queue()
+        self._restoring.clear()
         self.clear(views=False)
         self.user = ClientUser(state=self, data=data['user'])
         self.store_user(data['user'])
@@ -593,13 +883,18 @@ class ConnectionState:
 
     def parse_resumed(self, data) -> None:
         self.dispatch('resumed')
+        if self._restoring:
+            # the session was resumed from a cache snapshot, so READY never came
+            self._restoring.clear()
+            self.call_handlers('ready')
+            self.dispatch('ready')
 
     def parse_message_create(self, data) -> None:
         channel, _ = self._get_guild_channel(data)
         # channel would be the correct type here
-        message = Message(channel=channel, data=data, state=self)  # type: ignore
+        message = Message(channel=channel, data=data, state=self, lazy=self.lazy_messages)  # type: ignore
         self.dispatch('message', message)
-        if self._messages is not None:
+        if self._messages is not None and self._should_cache_message(message):
             self._messages.append(message)
         # we ensure that the channel is either a TextChannel or Thread
         if channel and channel.__class__ in (TextChannel, Thread):
@@ -612,21 +907,18 @@ class ConnectionState:
         self.dispatch('raw_message_delete', raw)
         if self._messages is not None and found is not None:
             self.dispatch('message_delete', found)
-            self._messages.remove(found)
+            self._messages.pop(found.id)
 
     def parse_message_delete_bulk(self, data) -> None:
         raw = RawBulkMessageDeleteEvent(data)
         if self._messages:
-            found_messages = [message for message in self._messages if message.id in raw.message_ids]
+            found_messages = self._messages.pop_many(raw.message_ids)
         else:
             found_messages = []
         raw.cached_messages = found_messages
         self.dispatch('raw_bulk_message_delete', raw)
         if found_messages:
             self.dispatch('bulk_message_delete', found_messages)
-            for msg in found_messages:
-                # self._messages won't be None here
-                self._messages.remove(msg)  # type: ignore
 
     def parse_message_update(self, data) -> None:
         raw = RawMessageUpdateEvent(data)
@@ -746,6 +1038,7 @@ class ConnectionState:
         old_member = Member._copy(member)
         user_update = member._presence_update(data=data, user=user)
         if user_update:
+            self._reindex_user(member._user, guild)
             self.dispatch('user_update', user_update[0], user_update[1])
 
         self.dispatch('presence_update', old_member, member)
@@ -757,6 +1050,7 @@ class ConnectionState:
         ref = self._users.get(user.id)
         if ref:
             ref._update(data)
+            self._reindex_user(ref)
 
     def parse_invite_create(self, data) -> None:
         invite = Invite.from_gateway(state=self, data=data)
@@ -773,6 +1067,8 @@ class ConnectionState:
             channel = guild.get_channel(channel_id)
             if channel is not None:
                 guild._remove_channel(channel)
+                if self._messages:
+                    self._messages.remove_channel(channel_id)
                 self.dispatch('guild_channel_delete', channel)
 
     def parse_channel_update(self, data) -> None:
@@ -793,6 +1089,7 @@ class ConnectionState:
             if channel is not None:
                 old_channel = copy.copy(channel)
                 channel._update(guild, data)
+                guild._index_channel(channel)
                 self.dispatch('guild_channel_update', old_channel, channel)
             else:
                 _log.debug('CHANNEL_UPDATE referencing an unknown channel ID: %s. Discarding.', channel_id)
@@ -893,7 +1190,7 @@ class ConnectionState:
         except KeyError:
             # If not provided, then the entire guild is being synced
             # So all previous thread data should be overwritten
-            previous_threads = guild._threads.copy()
+            previous_threads = dict(guild._threads)
             guild._clear_threads()
         else:
             previous_threads = guild._filter_threads(channel_ids)
@@ -1010,8 +1307,10 @@ class ConnectionState:
         if member is not None:
             old_member = Member._copy(member)
             member._update(data)
+            guild._index_member(member)
             user_update = member._update_inner_user(user)
             if user_update:
+                self._reindex_user(member._user, guild)
                 self.dispatch('user_update', user_update[0], user_update[1])
 
             self.dispatch('member_update', old_member, member)
@@ -1022,6 +1321,7 @@ class ConnectionState:
                 # Force an update on the inner user if necessary
                 user_update = member._update_inner_user(user)
                 if user_update:
+                    self._reindex_user(member._user, guild)
                     self.dispatch('user_update', user_update[0], user_update[1])
 
                 guild._add_member(member)
@@ -1036,6 +1336,7 @@ class ConnectionState:
         before_emojis = guild.emojis
         for emoji in before_emojis:
             self._emojis.pop(emoji.id, None)
+            self._unindex_emoji(emoji.id)
         # guild won't be None here
         guild.emojis = tuple(map(lambda d: self.store_emoji(guild, d), data['emojis']))  # type: ignore
         self.dispatch('guild_emojis_update', guild, before_emojis, guild.emojis)
@@ -1069,13 +1370,17 @@ class ConnectionState:
     def is_guild_evicted(self, guild) -> bool:
         return guild.id not in self._guilds
 
-    async def chunk_guild(self, guild, *, wait=True, cache=None):
+    async def _request_guild_chunks(self, guild, *, cache=None) -> ChunkRequest:
         cache = cache or self.member_cache_flags.joined
-        request = self._chunk_requests.get(guild.id)
+        request = self._guild_chunk_requests.get(guild.id)
         if request is None:
-            self._chunk_requests[guild.id] = request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
+            request = ChunkRequest(guild.id, self.loop, self._get_guild, cache=cache)
+            self._chunk_requests[request.nonce] = self._guild_chunk_requests[guild.id] = request
             await self.chunker(guild.id, nonce=request.nonce)
+        return request
 
+    async def chunk_guild(self, guild, *, wait=True, cache=None):
+        request = await self._request_guild_chunks(guild, cache=cache)
         if wait:
             return await request.wait()
         return request.get_future()
@@ -1142,10 +1447,8 @@ class ConnectionState:
             return
 
         # do a cleanup of the messages cache
-        if self._messages is not None:
-            self._messages: Optional[Deque[Message]] = deque(
-                (msg for msg in self._messages if msg.guild != guild), maxlen=self.max_messages
-            )
+        if self._messages:
+            self._messages.remove_guild(guild.id)
 
         self._remove_guild(guild)
         self.dispatch('guild_remove', guild)
@@ -1205,6 +1508,9 @@ class ConnectionState:
             if role is not None:
                 old_role = copy.copy(role)
                 role._update(role_data)
+                guild._index_role(role)
+                if role._permissions != old_role._permissions:
+                    guild._invalidate_role_permissions(role_id)
                 self.dispatch('guild_role_update', old_role, role)
         else:
             _log.debug('GUILD_ROLE_UPDATE referencing an unknown guild ID: %s. Discarding.', data['guild_id'])
@@ -1227,8 +1533,9 @@ class ConnectionState:
                 if member is not None:
                     member._presence_update(presence, user)
 
-        complete = data.get('chunk_index', 0) + 1 == data.get('chunk_count')
-        self.process_chunk_requests(guild_id, data.get('nonce'), members, complete)
+        chunk_count = data.get('chunk_count')
+        complete = data.get('chunk_index', 0) + 1 == chunk_count
+        self.process_chunk_requests(guild_id, data.get('nonce'), members, complete, chunk_count=chunk_count)
 
     def parse_guild_integrations_update(self, data) -> None:
         guild = self._get_guild(int(data['guild_id']))
@@ -1521,9 +1828,14 @@ class AutoShardedConnectionState(ConnectionState):
         if not hasattr(self, '_ready_state'):
             self._ready_state = asyncio.Queue()
 
+        # a shard failed to resume from the snapshot, READY is dispatched the usual way
+        self._restoring.clear()
+
         self.user = user = ClientUser(state=self, data=data['user'])
         # self._users is a list of Users, we're setting a ClientUser
         self._users[user.id] = user  # type: ignore
+        if self._user_index is not None:
+            self._user_index.add(user.id, user)
 
         if self.application_id is None:
             try:
@@ -1547,5 +1859,12 @@ class AutoShardedConnectionState(ConnectionState):
             self._ready_task = asyncio.create_task(self._delay_ready())
 
     def parse_resumed(self, data) -> None:
+        shard_id = data['__shard_id__']
         self.dispatch('resumed')
-        self.dispatch('shard_resumed', data['__shard_id__'])
+        self.dispatch('shard_resumed', shard_id)
+        if shard_id in self._restoring:
+            self._restoring.discard(shard_id)
+            self.dispatch('shard_ready', shard_id)
+            if not self._restoring:
+                self.call_handlers('ready')
+                self.dispatch('ready')
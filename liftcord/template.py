@@ -101,6 +101,9 @@ class _PartialTemplateState:
     def _get_guild(self, id):
         return self.__state._get_guild(id)
 
+    def _create_cache(self, name, **kwargs):
+        return {}
+
     async def query_members(self, **kwargs: Any):
         return []
 